@@ -0,0 +1,94 @@
+"""Benchmark import time of nsidc_projections modules
+
+Each measurement runs in a fresh interpreter.  Reports the median time to
+import the module and the time to first access of a single grid.  For
+comparison, the eager row imports nsidc_projections.grid and then builds
+every grid in available_grids and its CRS, which is what importing the
+module used to cost.  Exits with status 1 if a median lazy import time is
+over the budget; the same budget is enforced by tests/test_import.py.
+
+    python benchmarks/bench_import.py [--repeat N] [--budget SECONDS]
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+
+IMPORT_GRID = """
+import time
+t0 = time.perf_counter()
+import nsidc_projections.grid as grid
+t1 = time.perf_counter()
+grid.EASEGrid2North25km.crs
+t2 = time.perf_counter()
+print(t1 - t0, t2 - t1)
+"""
+
+IMPORT_GRID_EAGER = """
+import time
+t0 = time.perf_counter()
+import nsidc_projections.grid as grid
+for name in grid.available_grids:
+    grid.get_grid(name).crs
+t1 = time.perf_counter()
+grid.EASEGrid2North25km.crs
+t2 = time.perf_counter()
+print(t1 - t0, t2 - t1)
+"""
+
+IMPORT_PARSE_MAPX = """
+import time
+t0 = time.perf_counter()
+import nsidc_projections.mapx.parse_mapx as parse_mapx
+t1 = time.perf_counter()
+parse_mapx.filepath.MAPXMAPS_PATH
+t2 = time.perf_counter()
+print(t1 - t0, t2 - t1)
+"""
+
+IMPORT_CRS = """
+import time
+t0 = time.perf_counter()
+import nsidc_projections.crs as crs
+t1 = time.perf_counter()
+crs.EASEGrid2North
+t2 = time.perf_counter()
+print(t1 - t0, t2 - t1)
+"""
+
+
+def run(code, repeat):
+    """Returns median import and first-access times in seconds"""
+    imports, accesses = [], []
+    for _ in range(repeat):
+        out = subprocess.run([sys.executable, "-c", code],
+                             capture_output=True, text=True, check=True).stdout
+        t_import, t_access = map(float, out.split())
+        imports.append(t_import)
+        accesses.append(t_access)
+    return statistics.median(imports), statistics.median(accesses)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--budget", type=float, default=0.5,
+                        help="median import time budget in seconds")
+    args = parser.parse_args()
+    over_budget = False
+    for name, code in [("nsidc_projections.grid", IMPORT_GRID),
+                       ("nsidc_projections.crs", IMPORT_CRS),
+                       ("nsidc_projections.mapx.parse_mapx", IMPORT_PARSE_MAPX)]:
+        t_import, t_access = run(code, args.repeat)
+        flag = "  OVER BUDGET" if t_import > args.budget else ""
+        over_budget |= bool(flag)
+        print(f"{name:34s} import {t_import*1e3:8.1f} ms   "
+              f"first access {t_access*1e3:6.1f} ms{flag}")
+    t_import, t_access = run(IMPORT_GRID_EAGER, args.repeat)
+    print(f"{'eager: grid + every grid and CRS':34s} import {t_import*1e3:8.1f} ms   "
+          f"first access {t_access*1e3:6.1f} ms")
+    return 1 if over_budget else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
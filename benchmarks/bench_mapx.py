@@ -0,0 +1,90 @@
+"""Benchmark MapX parser and catalog throughput
+
+Writes a synthetic mapxmaps directory of old-style .gpd files that share a
+few .mpp files, then times parsing every file with get_grid_definition,
+parsing new-style gpd contents from memory, building the catalog,
+reloading it from its index and looking up names.
+
+    python benchmarks/bench_mapx.py [--files N]
+"""
+import argparse
+import tempfile
+from pathlib import Path
+
+from nsidc_projections.mapx import parse_mapx
+from nsidc_projections.mapx.catalog import MapxCatalog
+
+from common import timed
+
+MPP_FILES = {
+    "N200correct.mpp": ("Azimuthal Equal-Area\n"
+                        "90.0\t0.0\t\tlat0 lon0\n"
+                        "0.0\t\t\trotation\n"
+                        "200.5402\t\tscale (km/map unit)\n"),
+    "Nps.mpp": ("Polar Stereographic ellipsoid\n"
+                "90.0\t-45.0\t70.0\tlat0 lon0 lat1\n"
+                "0.0\t\t\trotation\n"
+                "100.0\t\t\tscale (km/map unit)\n"
+                "6378.273\t\tEarth equatorial radius (km) -- hughes\n"
+                "0.081816153\t\teccentricity -- hughes\n"),
+    }
+
+GPD_TEMPLATE = ("{mpp}\t\tmap projection parameters\n"
+                "{cols} {rows}\t\t\tcolumns rows\n"
+                "{cells}\t\t\tgrid cells per map unit\n"
+                "{col0} {row0}\t\tmap origin column,row\n")
+
+NEW_STYLE_GPD = (b"; EASE2_N25km.gpd\n"
+                 b"Map Projection: Azimuthal Equal-Area (ellipsoid)\n"
+                 b"Map Reference Latitude: 90.0\n"
+                 b"Map Reference Longitude: 0.0\n"
+                 b"Map Equatorial Radius: 6378.137 ; wgs84\n"
+                 b"Map Eccentricity: 0.081819190843 ; wgs84\n"
+                 b"Grid Width: 720\n"
+                 b"Grid Height: 720\n"
+                 b"Grid Map Origin Column: 359.5\n"
+                 b"Grid Map Origin Row: 359.5\n"
+                 b"Grid Map Units per Cell: 25000.0\n")
+
+
+def write_corpus(path, n_files):
+    """Writes n_files gpd files and their mpp files to path"""
+    for name, text in MPP_FILES.items():
+        (path / name).write_text(text)
+    mpp_names = list(MPP_FILES)
+    for i in range(n_files):
+        cells = 1 + i % 32
+        size = 90 * cells + 1
+        (path / f"grid{i:05d}.gpd").write_text(GPD_TEMPLATE.format(
+            mpp=mpp_names[i % len(mpp_names)], cols=size, rows=size, cells=cells,
+            col0=(size - 1) / 2, row0=(size - 1) / 2))
+
+
+def report(label, n, func):
+    elapsed, result = timed(func)
+    print(f"{label:36s} {elapsed*1e3:9.1f} ms  {n / elapsed:12.0f} files/s")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--files", type=int, default=5000)
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as tmp:
+        mapx_path = Path(tmp) / "mapxmaps"
+        mapx_path.mkdir()
+        write_corpus(mapx_path, args.files)
+        names = [p.stem for p in sorted(mapx_path.glob("*.gpd"))]
+        index_path = Path(tmp) / "index.json"
+        report("get_grid_definition, every file", len(names),
+               lambda: [parse_mapx.get_grid_definition(n, mapx_path) for n in names])
+        report("parse_gpd_buffer, new-style", len(names),
+               lambda: [parse_mapx.parse_gpd_buffer(NEW_STYLE_GPD) for n in names])
+        report("catalog build", len(names), lambda: MapxCatalog(mapx_path, index_path))
+        catalog = report("catalog load from index", len(names),
+                         lambda: MapxCatalog(mapx_path, index_path))
+        report("catalog lookups", len(names), lambda: [catalog[n] for n in names])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""Benchmark peak memory of coordinate and lat/lon arrays
+
+Compares materialized meshgrid coordinates with broadcast views, and
+float64 with float32 geolocation, using tracemalloc.
+
+    python benchmarks/bench_memory.py [--resolution METERS]
+"""
+import argparse
+
+import numpy as np
+
+from common import ease2_north, peak_mib
+
+
+def meshgrid_coordinates(grid):
+    x, y = grid.get_coordinates(cache=False)
+    return np.meshgrid(x, y)
+
+
+def meshgrid_latlon(grid):
+    """get_latlon as implemented before broadcast views"""
+    x2d, y2d = meshgrid_coordinates(grid)
+    return grid.transformer().transform(x2d, y2d)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--resolution", type=float, default=6250.)
+    args = parser.parse_args()
+    grid = ease2_north(args.resolution)
+    print(f"{grid.name}: {grid.rows} x {grid.cols}")
+    cases = [
+        ("coordinates: meshgrid", lambda: meshgrid_coordinates(grid)),
+        ("coordinates: broadcast views", lambda: grid.get_coordinate_grids()),
+        ("latlon: meshgrid + transform", lambda: meshgrid_latlon(grid)),
+        ("latlon: float64", lambda: grid.get_latlon(cache=False)),
+        ("latlon: float32", lambda: grid.get_latlon(cache=False, dtype=np.float32)),
+        ("latlon: float32, numpy engine",
+         lambda: grid.get_latlon(cache=False, dtype=np.float32, engine='numpy')),
+        ]
+    for name, func in cases:
+        print(f"{name:32s} peak {peak_mib(func):9.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
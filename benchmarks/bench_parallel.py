@@ -0,0 +1,40 @@
+"""Benchmark scaling of parallel geolocation
+
+Times Grid.get_latlon on a high-resolution EASE-Grid 2.0 North grid for
+1 up to all cores with the thread and process backends, and checks the
+output matches the serial result exactly.
+
+    python benchmarks/bench_parallel.py [--resolution METERS] [--engine proj|numpy]
+"""
+import argparse
+import os
+
+import numpy as np
+
+from common import ease2_north, timed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--resolution", type=float, default=3000.)
+    parser.add_argument("--engine", default="proj", choices=["proj", "numpy"])
+    args = parser.parse_args()
+    grid = ease2_north(args.resolution)
+    print(f"{grid.name}: {grid.rows} x {grid.cols}, engine={args.engine}")
+    serial_time, expected = timed(lambda: grid.get_latlon(cache=False, engine=args.engine))
+    print(f"{'serial':8s} {1:3d} workers {serial_time:8.2f} s")
+    cores = os.cpu_count()
+    workers = sorted({2**n for n in range(cores.bit_length()) if 2**n <= cores} | {cores})
+    for backend in ("thread", "process"):
+        for n in workers:
+            elapsed, result = timed(lambda: grid.get_latlon(
+                cache=False, engine=args.engine, workers=n, backend=backend))
+            identical = all(np.array_equal(r, e, equal_nan=True)
+                            for r, e in zip(result, expected))
+            print(f"{backend:8s} {n:3d} workers {elapsed:8.2f} s  "
+                  f"speedup {serial_time / elapsed:5.2f}  identical {identical}")
+            del result
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""Benchmark rendering a time series of frames on a grid
+
+Compares making a new map figure for every frame with FrameRenderer,
+which sets up the figure once and only replaces the frame values.
+
+    python benchmarks/bench_render.py [--frames N] [--workers N]
+"""
+import argparse
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+from nsidc_projections.grid import get_grid
+from nsidc_projections.plot import FrameRenderer, RENDER_METHODS
+
+from common import timed
+
+
+def report(label, n, func):
+    elapsed, _ = timed(func)
+    print(f"{label:36s} {elapsed:7.2f} s  {elapsed / n * 1e3:8.1f} ms/frame")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--frames", type=int, default=30)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--grid", default="EASEGrid2North25km")
+    args = parser.parse_args()
+    grid = get_grid(args.grid)
+    frames = np.random.default_rng(0).random((args.frames, grid.rows, grid.cols),
+                                             dtype=np.float32)
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = [Path(tmp) / f"frame{i:03d}.png" for i in range(args.frames)]
+
+        def new_figure_per_frame():
+            for frame, path in zip(frames, paths):
+                FrameRenderer(grid, coastlines=False, vmin=0., vmax=1.).render(frame, path)
+
+        report("new figure per frame", args.frames, new_figure_per_frame)
+        for method in RENDER_METHODS:
+            renderer = FrameRenderer(grid, coastlines=False, vmin=0., vmax=1., method=method)
+            report(f"FrameRenderer {method}, {args.workers} workers", args.frames,
+                   lambda: renderer.render_all(frames, paths, workers=args.workers))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""Helpers shared by the benchmark scripts"""
+import time
+import tracemalloc
+
+from nsidc_projections import grid_info
+from nsidc_projections.grid import Grid
+
+
+def timed(func, repeat=1, warmup=False):
+    """Returns minimum time of func over repeat runs in seconds, and the
+    result of the last run
+
+    :warmup: if True, func is run once first so one-off costs such as
+             imports and Transformer creation are not counted
+    """
+    if warmup:
+        func()
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        del result
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def peak_mib(func):
+    """Returns peak traced memory in MiB while running func"""
+    tracemalloc.start()
+    try:
+        result = func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return peak / 2**20
+
+
+def ease2_north(resolution):
+    """Returns nested EASE-Grid 2.0 North Grid with resolution in meters"""
+    return Grid(grid_info.ease_grid2("North", resolution / 1000.))
@@ -0,0 +1,171 @@
+"""Benchmark suite for regression checks
+
+Times and measures peak traced memory of the hot paths for every grid in
+available_grids and for high-resolution variants of each grid, plus the
+MapX parsers and the import of nsidc_projections.grid.
+
+Results can be saved as a JSON baseline and later runs compared against
+it.  A case fails if its time is over --threshold times the baseline (and
+slower by more than --min-seconds), or its peak memory is over
+--memory-threshold times the baseline.  The exit status is 1 if any case
+fails.
+
+    python benchmarks/suite.py --save baseline.json
+    python benchmarks/suite.py --compare baseline.json [--threshold 1.5]
+"""
+import argparse
+import json
+import platform
+import sys
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pyproj
+
+from nsidc_projections import grid as grid_module
+from nsidc_projections import grid_info
+from nsidc_projections.grid import Grid, available_grids, get_grid
+from nsidc_projections.mapx import parse_mapx
+
+from bench_import import IMPORT_GRID, run as run_import
+from bench_mapx import NEW_STYLE_GPD, write_corpus
+from common import peak_mib, timed
+
+MAPX_FILES = 200
+
+
+def high_resolution(name, factor):
+    """Returns grid with each cell of a registered grid split into factor x factor cells"""
+    definition = getattr(grid_info, name)
+    return Grid(grid_info.subdivide(definition, factor, name=f"{definition.name} / {factor}"))
+
+
+def cold_to_cartopy(grid):
+    grid_module._cartopy_from_wkt.cache_clear()
+    return grid.to_cartopy()
+
+
+def grid_cases(grid, label):
+    """Returns (name, func) cases for a grid"""
+    return [
+        (f"{label}: get_coordinates", lambda: grid.get_coordinates(cache=False)),
+        (f"{label}: get_gridcell_edges", lambda: grid.get_gridcell_edges()),
+        (f"{label}: get_latlon proj", lambda: grid.get_latlon(cache=False)),
+        (f"{label}: get_latlon numpy", lambda: grid.get_latlon(cache=False, engine='numpy')),
+        (f"{label}: grid_bounds", lambda: grid.grid_bounds()),
+        (f"{label}: to_cartopy", lambda: cold_to_cartopy(grid)),
+        ]
+
+
+def mapx_cases(mapx_path):
+    names = [p.stem for p in sorted(mapx_path.glob("*.gpd"))]
+    return [
+        (f"mapx: get_grid_definition x{len(names)}",
+         lambda: [parse_mapx.get_grid_definition(n, mapx_path) for n in names]),
+        (f"mapx: parse_gpd_buffer new-style x{len(names)}",
+         lambda: [parse_mapx.parse_gpd_buffer(NEW_STYLE_GPD) for n in names]),
+        ]
+
+
+def run_suite(repeat, factor, quick=False, select=None):
+    """Returns {case name: {"seconds": ..., "peak_mib": ...}}"""
+    results = {}
+
+    def measure(name, func):
+        if select and select not in name:
+            return
+        seconds, _ = timed(func, repeat, warmup=True)
+        results[name] = {"seconds": seconds, "peak_mib": peak_mib(func)}
+        print(f"{name:60s} {results[name]['seconds']*1e3:10.2f} ms "
+              f"{results[name]['peak_mib']:9.1f} MiB", flush=True)
+
+    grids = [(name, get_grid(name)) for name in available_grids]
+    if not quick:
+        grids += [(f"{name} / {factor}", high_resolution(name, factor))
+                  for name in available_grids]
+    for label, grid in grids:
+        for name, func in grid_cases(grid, label):
+            measure(name, func)
+    with tempfile.TemporaryDirectory() as tmp:
+        mapx_path = Path(tmp)
+        write_corpus(mapx_path, MAPX_FILES)
+        for name, func in mapx_cases(mapx_path):
+            measure(name, func)
+    name = "import nsidc_projections.grid"
+    if not select or select in name:
+        seconds, _ = run_import(IMPORT_GRID, max(repeat, 3))
+        results[name] = {"seconds": seconds, "peak_mib": None}
+        print(f"{name:60s} {seconds*1e3:10.2f} ms", flush=True)
+    return results
+
+
+def metadata():
+    return {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "pyproj": pyproj.__version__,
+        "proj": pyproj.proj_version_str,
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        }
+
+
+def compare(results, baseline, threshold, memory_threshold, min_seconds):
+    """Returns list of messages for cases that regressed against baseline"""
+    failures = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+        if (result["seconds"] > base["seconds"] * threshold and
+                result["seconds"] - base["seconds"] > min_seconds):
+            failures.append(f"{name}: {result['seconds']*1e3:.2f} ms, "
+                            f"baseline {base['seconds']*1e3:.2f} ms")
+        if (result["peak_mib"] is not None and base.get("peak_mib") is not None and
+                result["peak_mib"] > base["peak_mib"] * memory_threshold and
+                result["peak_mib"] - base["peak_mib"] > 1.):
+            failures.append(f"{name}: {result['peak_mib']:.1f} MiB, "
+                            f"baseline {base['peak_mib']:.1f} MiB")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--save", type=Path, help="write results to a JSON baseline")
+    parser.add_argument("--compare", type=Path, help="compare results with a JSON baseline")
+    parser.add_argument("--threshold", type=float, default=1.5,
+                        help="allowed ratio of time to baseline time")
+    parser.add_argument("--memory-threshold", type=float, default=1.2,
+                        help="allowed ratio of peak memory to baseline peak memory")
+    parser.add_argument("--min-seconds", type=float, default=0.002,
+                        help="slowdowns smaller than this are not failures")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--factor", type=int, default=4,
+                        help="subdivision factor of high-resolution grids")
+    parser.add_argument("--quick", action="store_true",
+                        help="skip high-resolution grids")
+    parser.add_argument("--select", help="only run cases whose name contains this")
+    args = parser.parse_args()
+
+    results = run_suite(args.repeat, args.factor, quick=args.quick, select=args.select)
+    if args.save:
+        args.save.write_text(json.dumps({"metadata": metadata(), "results": results},
+                                        indent=1))
+        print(f"Saved baseline to {args.save}")
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())
+        if baseline.get("metadata") != metadata():
+            print("Warning: baseline was recorded with different versions or platform")
+        failures = compare(results, baseline["results"], args.threshold,
+                           args.memory_threshold, args.min_seconds)
+        for failure in failures:
+            print(f"REGRESSION {failure}")
+        print(f"{len(failures)} regressions in {len(results)} cases")
+        return 1 if failures else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
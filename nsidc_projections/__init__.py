@@ -0,0 +1,9 @@
+"""Projection and grid definitions used in NSIDC data"""
+
+
+def __getattr__(name):
+    """identify is imported on first use so importing the package stays cheap"""
+    if name == "identify":
+        from nsidc_projections.index import identify
+        return identify
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,162 @@
+"""xarray accessor that georeferences datasets on a Grid
+
+Importing this module registers an ``nsidc`` accessor on xarray Datasets
+and DataArrays.
+
+    import nsidc_projections.accessor
+    ds = ds.nsidc.assign_grid(EASEGrid2North25km)
+
+assign_grid adds x and y coordinates, a CF grid_mapping variable and
+latitude and longitude coordinates.  Latitude and longitude are dask
+arrays that are only computed, one chunk at a time, when they are used.
+"""
+from functools import lru_cache
+
+import numpy as np
+import xarray as xr
+
+from nsidc_projections.cf import (GRID_MAPPING_NAME, LAT_ATTRS, LON_ATTRS, X_ATTRS,
+                                  Y_ATTRS, grid_mapping_attrs)
+from nsidc_projections.grid import Grid, get_grid
+
+
+class LatLonArray:
+    """Array-like (2, rows, cols) latitude and longitude of a Grid
+
+    Values are computed for the window that is indexed, so wrapping it
+    with dask.array.from_array computes geolocation one chunk at a time.
+    """
+    ndim = 3
+
+    def __init__(self, grid, dtype=np.float64, engine='proj'):
+        self.grid = grid
+        self.dtype = np.dtype(dtype)
+        self.engine = engine
+        self.shape = (2, grid.rows, grid.cols)
+
+
+    def __getitem__(self, key):
+        key = key if isinstance(key, tuple) else (key,)
+        band, rows, cols = key + (slice(None),) * (3 - len(key))
+        rows = np.arange(self.grid.rows)[rows]
+        cols = np.arange(self.grid.cols)[cols]
+        if rows.size == 0 or cols.size == 0:
+            return np.broadcast_to(np.empty((), dtype=self.dtype), self.shape)[key].copy()
+        row0, col0 = rows.min(), cols.min()
+        window = self.grid._latlon_window(slice(row0, rows.max() + 1),
+                                          slice(col0, cols.max() + 1), engine=self.engine)
+        window = np.take(window[band], rows - row0, axis=-2)
+        return np.take(window, cols - col0, axis=-1).astype(self.dtype, copy=False)
+
+
+def lazy_latlon(grid, chunks=None, dtype=np.float64, engine='proj'):
+    """Returns latitude and longitude of grid as dask arrays
+
+    :grid: Grid
+    :chunks: (rows, cols) chunk shape or dask chunks, defaults to one chunk
+    :dtype: dtype of latitude and longitude
+    :engine: 'proj' or 'numpy', see Grid.get_latlon
+    """
+    import dask.array as da
+    chunks = da.core.normalize_chunks((2,) + tuple(chunks or (grid.rows, grid.cols)),
+                                      shape=(2, grid.rows, grid.cols))
+    return _shared_latlon(grid, chunks, np.dtype(dtype).str, engine)
+
+
+@lru_cache(maxsize=64)
+def _shared_latlon(grid, chunks, dtype, engine):
+    """Returns dask latitude and longitude, one pair for recent arguments
+
+    dask arrays are immutable, so a pair is shared by every dataset
+    assigned the same grid, chunks, dtype and engine
+    """
+    import dask.array as da
+    # Names depend only on the grid, so graphs for many files share tasks
+    name = f"latlon-{grid.cache_key('latlon', dtype, engine, chunks)}"
+    latlon = da.from_array(LatLonArray(grid, dtype=dtype, engine=engine),
+                           chunks=chunks, asarray=False,
+                           meta=np.empty((0, 0, 0), dtype=dtype), name=name)
+    return latlon[0], latlon[1]
+
+
+def _data_chunks(obj, dims):
+    """Returns (rows, cols) dask chunks of the first dask-backed variable"""
+    variables = obj.data_vars.values() if isinstance(obj, xr.Dataset) else [obj]
+    for variable in variables:
+        if variable.chunks and set(dims) <= set(variable.dims):
+            return tuple(variable.chunks[variable.dims.index(dim)] for dim in dims)
+    return None
+
+
+def _grid_dims(obj, grid, dims):
+    """Returns names of the (row, col) dimensions of obj for grid"""
+    if dims is not None:
+        return tuple(dims)
+    if "y" in obj.dims and "x" in obj.dims:
+        return ("y", "x")
+    variables = obj.data_vars.values() if isinstance(obj, xr.Dataset) else [obj]
+    for variable in variables:
+        if variable.ndim >= 2 and variable.shape[-2:] == (grid.rows, grid.cols):
+            return variable.dims[-2:]
+    raise ValueError(f"No variable with (rows, cols) = ({grid.rows}, {grid.cols}) "
+                     "to assign the grid to, set dims")
+
+
+def assign_grid(obj, grid, dims=None, chunks=None, latlon=True, engine='proj',
+                dtype=np.float64):
+    """Returns a copy of obj georeferenced on grid
+
+    :obj: xarray Dataset or DataArray
+    :grid: Grid or name of a grid in grid.available_grids
+    :dims: names of the (row, col) dimensions.  Defaults to (y, x) if
+           present, otherwise the last two dimensions of the first
+           variable with the grid shape.  They are renamed to y and x
+    :chunks: (rows, cols) chunks for latitude and longitude.  Defaults to
+             the chunks of the first dask-backed variable or one chunk
+    :latlon: if True, adds lazy lat and lon coordinates
+    :engine: 'proj' or 'numpy', see Grid.get_latlon
+    :dtype: dtype of lat and lon, e.g. np.float32 to halve their memory
+    """
+    if not isinstance(grid, Grid):
+        grid = get_grid(grid)
+    row_dim, col_dim = _grid_dims(obj, grid, dims)
+    if (obj.sizes[row_dim], obj.sizes[col_dim]) != (grid.rows, grid.cols):
+        raise ValueError(f"Dimensions ({row_dim}, {col_dim}) have sizes "
+                         f"({obj.sizes[row_dim]}, {obj.sizes[col_dim]}), "
+                         f"{grid.name} has ({grid.rows}, {grid.cols})")
+    if chunks is None:
+        chunks = _data_chunks(obj, (row_dim, col_dim))
+    obj = obj.rename({row_dim: "y", col_dim: "x"}) if (row_dim, col_dim) != ("y", "x") else obj
+    x, y = grid.get_coordinates()
+    coords = {
+        "x": ("x", np.array(x), X_ATTRS),
+        "y": ("y", np.array(y), Y_ATTRS),
+        GRID_MAPPING_NAME: ((), np.int32(0), grid_mapping_attrs(grid)),
+        }
+    if latlon:
+        lat, lon = lazy_latlon(grid, chunks=chunks, dtype=dtype, engine=engine)
+        coords["lat"] = (("y", "x"), lat, LAT_ATTRS)
+        coords["lon"] = (("y", "x"), lon, LON_ATTRS)
+    obj = obj.assign_coords(coords)
+    if isinstance(obj, xr.DataArray):
+        return obj.assign_attrs(grid_mapping=GRID_MAPPING_NAME)
+    return obj.assign({name: variable.assign_attrs(grid_mapping=GRID_MAPPING_NAME)
+                       for name, variable in obj.data_vars.items()
+                       if "y" in variable.dims and "x" in variable.dims})
+
+
+class NSIDCAccessor:
+    """nsidc accessor for xarray Datasets and DataArrays"""
+    def __init__(self, xarray_obj):
+        self._obj = xarray_obj
+
+
+    def assign_grid(self, grid, dims=None, chunks=None, latlon=True, engine='proj',
+                    dtype=np.float64):
+        """Returns a copy georeferenced on grid, see accessor.assign_grid"""
+        return assign_grid(self._obj, grid, dims=dims, chunks=chunks, latlon=latlon,
+                           engine=engine, dtype=dtype)
+
+
+xr.register_dataset_accessor("nsidc")(NSIDCAccessor)
+xr.register_dataarray_accessor("nsidc")(NSIDCAccessor)
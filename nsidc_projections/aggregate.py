@@ -0,0 +1,125 @@
+"""Block aggregation and disaggregation between nested grids
+
+Nested grids, such as the EASE-Grid 2.0 family made by grid.ease_grid2,
+share an extent and each coarse cell covers a whole factor x factor block
+of fine cells.  Moving data between levels is then a reshape of the last
+two axes to (..., rows, factor, cols, factor) and a reduction over the
+block axes, with no interpolation or Python loops.
+"""
+import numpy as np
+
+METHODS = ('mean', 'sum', 'majority')
+
+
+def nesting_factor(fine, coarse):
+    """Returns number of fine cells along each side of a coarse cell
+
+    :fine: Grid or grid_info.Grid
+    :coarse: Grid or grid_info.Grid with the same extent
+
+    Raises ValueError if coarse is not a block aggregate of fine
+    """
+    factor = fine.cols // coarse.cols if coarse.cols else 0
+    nested = (
+        fine.epsg == coarse.epsg and
+        factor >= 1 and
+        fine.cols == coarse.cols * factor and
+        fine.rows == coarse.rows * factor and
+        np.isclose(fine.cell_width * factor, coarse.cell_width, rtol=1e-9, atol=0.) and
+        np.isclose(fine.cell_height * factor, coarse.cell_height, rtol=1e-9, atol=0.) and
+        np.isclose(fine.upper_left_x, coarse.upper_left_x, rtol=0., atol=1e-3) and
+        np.isclose(fine.upper_left_y, coarse.upper_left_y, rtol=0., atol=1e-3)
+        )
+    if not nested:
+        raise ValueError(f"{coarse.name} is not a block aggregate of {fine.name}")
+    return factor
+
+
+def blocks(data, factor):
+    """Returns view of data with shape (..., rows, factor, cols, factor)
+
+    :data: array with shape (..., rows * factor, cols * factor)
+    """
+    data = np.asarray(data)
+    rows, cols = data.shape[-2:]
+    if rows % factor or cols % factor:
+        raise ValueError(f"Shape {data.shape} is not divisible into {factor}x{factor} blocks")
+    return data.reshape(data.shape[:-2] + (rows // factor, factor, cols // factor, factor))
+
+
+def _majority(data, factor):
+    """Returns most common value in each block, the smallest value for ties"""
+    block = blocks(data, factor)
+    block = np.moveaxis(block, -3, -2)
+    block = np.sort(block.reshape(block.shape[:-2] + (factor * factor,)), axis=-1)
+    # Length of the run of equal values ending at each sorted position
+    position = np.arange(factor * factor)
+    run_start = np.where(np.diff(block, axis=-1, prepend=block[..., :1]) != 0, position, 0)
+    run_length = position - np.maximum.accumulate(run_start, axis=-1)
+    end = np.argmax(run_length, axis=-1)[..., np.newaxis]
+    return np.take_along_axis(block, end, axis=-1)[..., 0]
+
+
+def aggregate(data, factor, method='mean', skipna=False):
+    """Returns data reduced over factor x factor blocks
+
+    :data: array with shape (..., rows * factor, cols * factor)
+    :factor: cells along each side of a block, see nesting_factor
+    :method: one of METHODS.  majority is intended for categorical data
+    :skipna: if True, NaN cells are ignored by mean and sum.  Blocks of
+             only NaN are NaN for mean and 0 for sum
+
+    :returns: array with shape (..., rows, cols)
+    """
+    if method not in METHODS:
+        raise NotImplementedError(f"{method} is not available")
+    if method == 'majority':
+        return _majority(data, factor)
+    block = blocks(data, factor)
+    if method == 'sum':
+        return (np.nansum if skipna else np.sum)(block, axis=(-3, -1))
+    if skipna:
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.nanmean(block, axis=(-3, -1))
+    return block.mean(axis=(-3, -1))
+
+
+def disaggregate(data, factor, method='mean', out=None):
+    """Returns data repeated over factor x factor blocks
+
+    :data: array with shape (..., rows, cols)
+    :factor: cells along each side of a block, see nesting_factor
+    :method: mean and majority repeat each value; sum divides each value
+             equally between the cells of its block so totals are kept
+    :out: optional array with shape (..., rows * factor, cols * factor)
+
+    :returns: array with shape (..., rows * factor, cols * factor)
+    """
+    if method not in METHODS:
+        raise NotImplementedError(f"{method} is not available")
+    data = np.asarray(data)
+    if method == 'sum':
+        data = data / (factor * factor)
+    shape = data.shape[:-2] + (data.shape[-2] * factor, data.shape[-1] * factor)
+    if out is None:
+        out = np.empty(shape, dtype=data.dtype)
+    block = blocks(out, factor)
+    if not np.shares_memory(block, out):
+        raise ValueError("out must be an array that can be reshaped without copying")
+    block[...] = data[..., :, np.newaxis, :, np.newaxis]
+    return out
+
+
+def to_nested_grid(data, source, target, method='mean', skipna=False):
+    """Returns data moved from source grid to a nested target grid
+
+    Data are aggregated if target is coarser than source and disaggregated
+    if it is finer.
+
+    :data: array with shape (..., source rows, source cols)
+    :source: Grid of data
+    :target: Grid nested with source
+    """
+    if target.cols <= source.cols:
+        return aggregate(data, nesting_factor(source, target), method=method, skipna=skipna)
+    return disaggregate(data, nesting_factor(target, source), method=method)
@@ -0,0 +1,220 @@
+"""Two-level cache for arrays derived from grid definitions
+
+Arrays are held in an in-process LRU with a byte budget.  If a cache
+directory is set, either with configure or the NSIDC_PROJECTIONS_CACHE_DIR
+environment variable, arrays are also stored as .npy files and reopened
+as read-only memory maps on later lookups.
+"""
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+import numpy as np
+
+CACHE_DIR_ENV = "NSIDC_PROJECTIONS_CACHE_DIR"
+
+DEFAULT_MAX_BYTES = 512 * 2**20  # 512 MiB in memory
+DEFAULT_MAX_DISK_BYTES = 4 * 2**30  # 4 GiB on disk
+
+# Part of every grid cache key.  Increase when the arrays computed for a
+# key change, so files in a persistent cache directory are not reused
+CACHE_FORMAT = 1
+
+# Memory maps are paged by the OS, so each counts as this many bytes
+# against the memory budget, bounding the number held
+MEMMAP_ENTRY_BYTES = 2**20
+
+
+def make_key(*parts):
+    """Returns a stable string key from hashable parts"""
+    return hashlib.sha1(repr(parts).encode()).hexdigest()
+
+
+def _resident_bytes(array):
+    """Returns bytes counted against the memory budget"""
+    if isinstance(array, np.memmap):
+        return min(array.nbytes, MEMMAP_ENTRY_BYTES)
+    return array.nbytes
+
+
+class ArrayCache:
+    """LRU cache of read-only numpy arrays with an optional disk store
+
+    :max_bytes: byte budget for arrays held in memory
+    :directory: directory for .npy files, None disables the disk store
+    :max_disk_bytes: byte budget for the disk store
+    """
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES, directory=None,
+                 max_disk_bytes=DEFAULT_MAX_DISK_BYTES):
+        self.max_bytes = max_bytes
+        self.directory = Path(directory) if directory else None
+        self.max_disk_bytes = max_disk_bytes
+        self._entries = OrderedDict()
+        self._nbytes = 0
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+
+    def __len__(self):
+        return len(self._entries)
+
+
+    def __contains__(self, key):
+        return key in self._entries or self._disk_path(key, exists=True) is not None
+
+
+    def _disk_path(self, key, exists=False):
+        if self.directory is None:
+            return None
+        path = self.directory / f"{key}.npy"
+        if exists and not path.exists():
+            return None
+        return path
+
+
+    def _store(self, key, array):
+        """Adds array to the memory tier and evicts least recently used entries"""
+        nbytes = _resident_bytes(array)
+        if nbytes > self.max_bytes:
+            return
+        if key in self._entries:
+            self._nbytes -= _resident_bytes(self._entries.pop(key))
+        self._entries[key] = array
+        self._nbytes += nbytes
+        while self._nbytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._nbytes -= _resident_bytes(evicted)
+            self.evictions += 1
+
+
+    def _load(self, key):
+        """Opens a stored array as a read-only memory map"""
+        path = self._disk_path(key, exists=True)
+        if path is None:
+            return None
+        try:
+            array = np.load(path, mmap_mode="r")
+        except (OSError, ValueError):
+            return None
+        os.utime(path)  # mtime tracks recency for disk eviction
+        return array
+
+
+    def _save(self, key, array):
+        """Writes array to the disk store, replacing atomically"""
+        path = self._disk_path(key)
+        if path is None:
+            return
+        self.directory.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_path, "wb") as f:
+            np.save(f, array)
+        os.replace(tmp_path, path)
+        self._evict_disk()
+
+
+    def _evict_disk(self):
+        """Removes oldest files until the disk store is within budget"""
+        files = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(".npy"):
+                stat = entry.stat()
+                files.append((stat.st_mtime, stat.st_size, entry.path))
+        total = sum(size for _, size, _ in files)
+        for _, size, path in sorted(files):
+            if total <= self.max_disk_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+            with self._lock:
+                self.evictions += 1
+
+
+    def get(self, key, default=None):
+        """Returns cached array for key or default"""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            array = self._load(key)
+            if array is not None:
+                self.disk_hits += 1
+                self._store(key, array)
+                return array
+            return default
+
+
+    def put(self, key, array):
+        """Adds a read-only view of array to the cache and returns the view
+
+        The disk store is written outside the lock, so lookups by other
+        threads are not blocked by file I/O"""
+        view = array.view()
+        view.flags.writeable = False
+        with self._lock:
+            self._store(key, view)
+        self._save(key, view)
+        return view
+
+
+    def get_or_compute(self, key, func):
+        """Returns cached array for key, calling func() to create it on a miss"""
+        array = self.get(key)
+        if array is not None:
+            return array
+        with self._lock:
+            self.misses += 1
+        return self.put(key, func())
+
+
+    def clear(self, disk=False):
+        """Empties the memory tier and, optionally, the disk store"""
+        with self._lock:
+            self._entries.clear()
+            self._nbytes = 0
+            if disk and self.directory is not None and self.directory.exists():
+                for path in self.directory.glob("*.npy"):
+                    path.unlink()
+
+
+    def stats(self):
+        """Returns a dictionary of cache counters"""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "memory_bytes": self._nbytes,
+                "max_bytes": self.max_bytes,
+                "directory": str(self.directory) if self.directory else None,
+                }
+
+
+grid_cache = ArrayCache(directory=os.environ.get(CACHE_DIR_ENV))
+
+
+def configure(max_bytes=None, directory=None, max_disk_bytes=None):
+    """Changes budgets or disk location of the shared grid cache"""
+    with grid_cache._lock:
+        if max_bytes is not None:
+            grid_cache.max_bytes = max_bytes
+        if directory is not None:
+            grid_cache.directory = Path(directory)
+        if max_disk_bytes is not None:
+            grid_cache.max_disk_bytes = max_disk_bytes
+
+
+def stats():
+    """Returns counters for the shared grid cache"""
+    return grid_cache.stats()
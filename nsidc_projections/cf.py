@@ -0,0 +1,43 @@
+"""CF metadata for Grids
+
+Attributes for the grid_mapping variable and the coordinate variables of
+a Grid, shared by the xarray accessor and the file writers.
+"""
+GRID_MAPPING_NAME = "crs"
+
+X_ATTRS = {
+    "standard_name": "projection_x_coordinate",
+    "long_name": "x coordinate of projection",
+    "units": "m",
+    "axis": "X",
+    }
+
+Y_ATTRS = {
+    "standard_name": "projection_y_coordinate",
+    "long_name": "y coordinate of projection",
+    "units": "m",
+    "axis": "Y",
+    }
+
+LAT_ATTRS = {
+    "standard_name": "latitude",
+    "long_name": "latitude",
+    "units": "degrees_north",
+    }
+
+LON_ATTRS = {
+    "standard_name": "longitude",
+    "long_name": "longitude",
+    "units": "degrees_east",
+    }
+
+
+def grid_mapping_attrs(grid):
+    """Returns CF grid_mapping attributes for grid
+
+    spatial_ref and GeoTransform are added so GDAL reads the CRS and
+    geotransform without using the coordinate variables"""
+    attrs = grid.crs.to_cf()
+    attrs["spatial_ref"] = attrs["crs_wkt"]
+    attrs["GeoTransform"] = " ".join(str(v) for v in grid.geotransform().to_gdal())
+    return attrs
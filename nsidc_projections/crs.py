@@ -1,16 +1,36 @@
-"""Contains proj4 CRS definitions for NSIDC projections"""
+"""Contains proj4 CRS definitions for NSIDC projections
+
+CRS objects are created from EPSG codes on first access"""
 
 from pyproj import CRS
-import grid_info
-
-EASEGridNorth = CRS.from_epsg(grid_info.EASE_GRID_NORTH_EPSG)
-EASEGridSouth = CRS.from_epsg(grid_info.EASE_GRID_SOUTH_EPSG)
-EASEGridGlobal = CRS.from_epsg(grid_info.EASE_GRID_GLOBAL_EPSG)
-EASEGrid2North = CRS.from_epsg(grid_info.EASE_GRID2_NORTH_EPSG)
-EASEGrid2South = CRS.from_epsg(grid_info.EASE_GRID2_SOUTH_EPSG)
-EASEGrid2Global = CRS.from_epsg(grid_info.EASE_GRID2_GLOBAL_EPSG)
-
-PolarStereoNorth = CRS.from_epsg(grid_info.POLAR_STEREO_NORTH_EPSG)
-PolarStereoSouth = CRS.from_epsg(grid_info.POLAR_STEREO_SOUTH_EPSG)
-PolarStereoNorthWGS84 = CRS.from_epsg(grid_info.POLAR_STEREO_NORTH_WGS84_EPSG)
-PolarStereoSouthWGS84 = CRS.from_epsg(grid_info.POLAR_STEREO_SOUTH_WGS84_EPSG)
+
+from nsidc_projections import grid_info, profiling
+
+_crs_epsg = {
+    'EASEGridNorth': grid_info.EASE_GRID_NORTH_EPSG,
+    'EASEGridSouth': grid_info.EASE_GRID_SOUTH_EPSG,
+    'EASEGridGlobal': grid_info.EASE_GRID_GLOBAL_EPSG,
+    'EASEGrid2North': grid_info.EASE_GRID2_NORTH_EPSG,
+    'EASEGrid2South': grid_info.EASE_GRID2_SOUTH_EPSG,
+    'EASEGrid2Global': grid_info.EASE_GRID2_GLOBAL_EPSG,
+
+    'PolarStereoNorth': grid_info.POLAR_STEREO_NORTH_EPSG,
+    'PolarStereoSouth': grid_info.POLAR_STEREO_SOUTH_EPSG,
+    'PolarStereoNorthWGS84': grid_info.POLAR_STEREO_NORTH_WGS84_EPSG,
+    'PolarStereoSouthWGS84': grid_info.POLAR_STEREO_SOUTH_WGS84_EPSG,
+    }
+
+_crs_registry = {}
+
+
+def __getattr__(name):
+    if name in _crs_epsg:
+        if name not in _crs_registry:
+            with profiling.span("crs.create"):
+                _crs_registry[name] = CRS.from_epsg(_crs_epsg[name])
+        return _crs_registry[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_crs_epsg))
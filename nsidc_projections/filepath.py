@@ -1,16 +1,54 @@
-"""Sets filepaths for gpd and mapx files"""
-import yaml
+"""Sets filepaths for gpd and mapx files
+
+The config file is read on first use of MAPXMAPS_PATH, not on import.
+The file named by the NSIDC_PROJECTIONS_CONFIG environment variable is
+used if set, otherwise config.yml in the current directory, otherwise the
+config.yml at the top of the package source tree.
+"""
+import os
+from functools import lru_cache
 from pathlib import Path
 
+CONFIG_ENV = "NSIDC_PROJECTIONS_CONFIG"
 CONFIG_FILE_PATH = Path("config.yml")
+PACKAGE_CONFIG_FILE_PATH = Path(__file__).resolve().parent.parent / "config.yml"
+
 
+def config_file_path():
+    """Returns path of config file to read"""
+    if os.environ.get(CONFIG_ENV):
+        return Path(os.environ[CONFIG_ENV])
+    if CONFIG_FILE_PATH.exists():
+        return CONFIG_FILE_PATH
+    return PACKAGE_CONFIG_FILE_PATH
 
-def read_config():
+
+def read_config(path=None):
     """Loads config parameters"""
-    with open(CONFIG_FILE_PATH) as f:
+    import yaml
+    with open(config_file_path() if path is None else path) as f:
         return yaml.safe_load(f)
 
 
-configuration = read_config()
+@lru_cache(maxsize=None)
+def _configuration(path):
+    return read_config(path)
+
+
+def get_configuration():
+    """Returns config parameters, reading the config file once per path"""
+    return _configuration(config_file_path().resolve())
+
+
+def get_mapxmaps_path():
+    """Returns directory of mapx gpd and mpp files"""
+    return Path(get_configuration().get("APP").get("MAPXPATH"))
+
 
-MAPXMAPS_PATH = Path(configuration.get("APP").get("MAPXPATH"))
+def __getattr__(name):
+    """configuration and MAPXMAPS_PATH are loaded on first access"""
+    if name == "configuration":
+        return get_configuration()
+    if name == "MAPXMAPS_PATH":
+        return get_mapxmaps_path()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,24 +1,42 @@
 """Classes for NSIDC Grids"""
 import sys
+from functools import cached_property, lru_cache
 
 import numpy as np
 
-from pyproj import CRS, Transformer
+from pyproj import CRS, proj_version_str
+from pyproj.enums import TransformDirection
 from affine import Affine
-import cartopy.crs as ccrs
 
-from nsidc_projections import grid_info
+from nsidc_projections import grid_info, kernels, parallel, profiling
+from nsidc_projections.cache import CACHE_FORMAT, grid_cache, make_key
+from nsidc_projections.gridding import GridAccumulator
+from nsidc_projections.transform import get_transformer
+
+ENGINES = ('proj', 'numpy')
+
+EQUAL_AREA_FAMILIES = ('laea', 'cea')
+
+# Cells transformed at a time when writing through a buffer or numpy kernels
+TRANSFORM_BUFFER_CELLS = 2**20
+
+# Points along each edge of a latitude and longitude box projected by Grid.window
+WINDOW_EDGE_POINTS = 256
+
+# Fractional cell indices within this of a whole number are rounded to it
+WINDOW_INDEX_TOLERANCE = 1e-6
 
 if not sys.warnoptions:
     import warnings
     warnings.simplefilter("ignore")
 
 
-# Need to add cylindrical projection
+# Names of cartopy.crs classes, cartopy is imported on first use.
+# CylindricalEqualArea is defined here, see cylindrical_equal_area_class
 keymap_projclass = {
-#    'cea': ccrs.LambertCylindrical,
-    'laea': ccrs.LambertAzimuthalEqualArea,
-    'stere': ccrs.Stereographic,
+    'cea': 'CylindricalEqualArea',
+    'laea': 'LambertAzimuthalEqualArea',
+    'stere': 'Stereographic',
     }
 
 keymap_projparam = {
@@ -60,35 +78,133 @@ def get_globe_params(proj_dict):
     return ccrs_globeparam
 
 
+@lru_cache(maxsize=None)
+def cylindrical_equal_area_class():
+    """Returns cartopy projection class for normal cylindrical equal-area
+
+    cartopy.crs.LambertCylindrical has no latitude of true scale, which
+    EASE-Grid Global grids need.  The class is made on first use so that
+    cartopy is only imported when needed.
+    """
+    import cartopy.crs as ccrs
+
+    class CylindricalEqualArea(ccrs._RectangularProjection):
+        """Cylindrical equal-area projection with a latitude of true scale
+
+        Bounds are symmetric about the projection origin, so false easting
+        and northing are expected to be zero.
+        """
+        def __init__(self, central_longitude=0.0, true_scale_latitude=0.0,
+                     false_easting=0.0, false_northing=0.0, globe=None):
+            proj4_params = [('proj', 'cea'),
+                            ('lon_0', central_longitude),
+                            ('lat_ts', true_scale_latitude),
+                            ('x_0', false_easting),
+                            ('y_0', false_northing),
+                            ('units', 'm')]
+            super().__init__(proj4_params, 0., 0., globe=globe)
+            projection = grid_info.Projection(
+                'cea', 0., central_longitude, true_scale_latitude,
+                self.ellipsoid.semi_major_metre, self.ellipsoid.semi_minor_metre)
+            x, y = kernels.forward(projection, 90., central_longitude + 180., dtype=np.float64)
+            self._half_width = float(abs(x))
+            self._half_height = float(y)
+            self.threshold = self._half_width / 360.
+
+    return CylindricalEqualArea
+
+
 def get_cartopy_projclass(proj_name):
     """Returns cartopy projection definition"""
     try:
         cartopy_projclass = keymap_projclass[proj_name]
-        return cartopy_projclass
     except KeyError:
         raise NotImplementedError(f"{proj_name} is not available")
+    if cartopy_projclass == 'CylindricalEqualArea':
+        return cylindrical_equal_area_class()
+    import cartopy.crs as ccrs
+    return getattr(ccrs, cartopy_projclass)
 
 
-def create_proj_crs(crs):
-    """Trys to create a pyproj.CRS instance"""
+def _crs_wkt(crs):
+    """Returns WKT of a CRS-type object, raising TypeError if it has none"""
     try:
-        return CRS.from_wkt(crs.to_wkt())
-    except AttributeError as err:
+        return crs.to_wkt()
+    except AttributeError:
         raise TypeError("Unexpected CRS-type object.  Expects CRS to have to_wkt method")
-    
-        
-def to_cartopy(proj_crs):
-    """Returns a cartopy crs"""
-    if not isinstance(proj_crs, CRS):
-        proj_dict = create_proj_crs(proj_crs).to_dict()
-    else:
-        proj_dict = proj_crs.to_dict()
+
+
+def create_proj_crs(crs):
+    """Trys to create a pyproj.CRS instance"""
+    return CRS.from_wkt(_crs_wkt(crs))
+
+
+@lru_cache(maxsize=64)
+def _cartopy_from_wkt(wkt):
+    """Returns cartopy crs for WKT, one instance per WKT"""
+    proj_dict = CRS.from_wkt(wkt).to_dict()
     cartopy_projclass = get_cartopy_projclass(proj_dict['proj'])
     kw_proj = get_proj_params(proj_dict)
     kw_globe = get_globe_params(proj_dict)
+    import cartopy.crs as ccrs
     globe = ccrs.Globe(**kw_globe)
-    cartopy_crs = cartopy_projclass(**kw_proj, globe=globe)
-    return cartopy_crs
+    return cartopy_projclass(**kw_proj, globe=globe)
+
+
+def to_cartopy(proj_crs):
+    """Returns a cartopy crs
+
+    Results are memoized by WKT and the same instance is returned for
+    equal CRS, so it must not be modified.
+
+    :proj_crs: pyproj.CRS or an object with a to_wkt method
+    """
+    return _cartopy_from_wkt(_crs_wkt(proj_crs))
+
+
+def _empty(shape, dtype=np.float64):
+    """Returns an uninitialized array, counted as grid.alloc when profiling"""
+    with profiling.span("grid.alloc") as span:
+        array = np.empty(shape, dtype=dtype)
+        span.add(nbytes=array.nbytes)
+    return array
+
+
+def bbox_boundary(bbox, edge_points=WINDOW_EDGE_POINTS):
+    """Returns latitudes and longitudes along the edges of a box
+
+    :bbox: (west, south, east, north) in degrees.  If west > east the box
+           crosses the antimeridian
+    :edge_points: points along each edge
+
+    :returns: lat and lon arrays
+    """
+    west, south, east, north = bbox
+    if south > north:
+        raise ValueError(f"south must not be greater than north, got {bbox}")
+    if west > east:
+        east += 360.
+    lon = np.linspace(west, east, edge_points)
+    lat = np.linspace(south, north, edge_points)
+    return (np.concatenate([np.full_like(lon, south), lat, np.full_like(lon, north), lat]),
+            np.concatenate([lon, np.full_like(lat, east), lon, np.full_like(lat, west)]))
+
+
+def _covering_slice(index, size):
+    """Returns slice of the cells covering fractional cell edge indices,
+    clipped to 0 and size"""
+    start = int(np.floor(index.min() + WINDOW_INDEX_TOLERANCE))
+    stop = max(int(np.ceil(index.max() - WINDOW_INDEX_TOLERANCE)), start + 1)
+    return slice(max(start, 0), min(stop, size))
+
+
+def _as_pair(x, y, dtype, out):
+    """Returns x and y as dtype, or copied into out"""
+    if out is None:
+        return x.astype(dtype, copy=False), y.astype(dtype, copy=False)
+    np.copyto(out[0], x, casting='same_kind')
+    np.copyto(out[1], y, casting='same_kind')
+    return out[0], out[1]
 
 
 class Grid:
@@ -103,7 +219,32 @@ class Grid:
         self.upper_left_x = grid_tuple.upper_left_x
         self.upper_left_y = grid_tuple.upper_left_y
 
-        self.crs = CRS.from_epsg(grid_tuple.epsg)
+
+    @cached_property
+    def crs(self):
+        """pyproj.CRS for grid, created on first access"""
+        with profiling.span("crs.create"):
+            return CRS.from_epsg(self.epsg)
+
+
+    @cached_property
+    def geodetic_crs(self):
+        """Geodetic CRS of the grid datum"""
+        return self.crs.geodetic_crs
+
+
+    @property
+    def projection(self):
+        """grid_info.Projection parameters used by the numpy engine"""
+        try:
+            return grid_info.PROJECTIONS[self.epsg]
+        except KeyError:
+            raise NotImplementedError(f"No projection parameters for EPSG:{self.epsg}")
+
+
+    def transformer(self):
+        """Returns pooled Transformer from grid CRS to its geodetic CRS"""
+        return get_transformer(self.crs, self.geodetic_crs)
 
 
     def __str__(self):
@@ -131,34 +272,387 @@ class Grid:
             )
 
 
-    def get_coordinates(self):
+    def cache_key(self, kind, *args):
+        """Returns cache key for arrays derived from this grid
+
+        Keys depend on EPSG, shape and geotransform, not on grid name, and
+        on the cache format and PROJ version, so arrays stored before an
+        upgrade are not reused"""
+        return make_key(CACHE_FORMAT, proj_version_str, kind, self.epsg, self.rows,
+                        self.cols, tuple(self.geotransform()), *args)
+
+
+    def get_coordinates(self, cache=True, dtype=np.float64, out=None):
         """Return x and y coordinates for grid
         
-        Note: for EASE-Grid these may be undefined"""
+        Note: for EASE-Grid these may be undefined
+
+        :cache: if True, coordinates are copied from the grid cache
+        :dtype: dtype of returned arrays
+        :out: optional tuple of (x, y) arrays to write coordinates into"""
+        if cache:
+            x, y = self._cached_coordinates()
+            if out is None:
+                # Copies are small and writeable, as before caching was added
+                return x.astype(dtype), y.astype(dtype)
+            return _as_pair(x, y, dtype, out)
         c = np.arange(0.5, self.cols, 1.)
         r = np.arange(0.5, self.rows, 1.)
-        x, y = self.geotransform() * (c, r)
-        return x, y
+        x, _ = self.geotransform() * (c, 0.5)
+        _, y = self.geotransform() * (0.5, r)
+        return _as_pair(x, y, dtype, out)
+
+
+    def _cached_coordinates(self):
+        """Returns read-only x and y views of the cached coordinates"""
+        xy = grid_cache.get_or_compute(self.cache_key("coordinates"),
+                                       lambda: np.concatenate(self.get_coordinates(cache=False)))
+        return xy[:self.cols], xy[self.cols:]
+
 
+    def get_coordinate_grids(self, dtype=np.float64):
+        """Return 2D x and y coordinates as read-only broadcast views
 
-    def get_gridcell_edges(self):
+        The views share memory with the cached 1D coordinates, so no
+        (rows, cols) arrays are allocated"""
+        x, y = _as_pair(*self._cached_coordinates(), dtype, None)
+        shape = (self.rows, self.cols)
+        return np.broadcast_to(x, shape), np.broadcast_to(y[:, np.newaxis], shape)
+
+
+    def get_gridcell_edges(self, dtype=np.float64, out=None):
+        """Return x and y coordinates of grid cell edges
+
+        :dtype: dtype of returned arrays
+        :out: optional tuple of (x, y) arrays to write edges into"""
         c = np.arange(0, self.cols+1, 1)
         r = np.arange(0, self.rows+1, 1)
         x, _ = self.geotransform() * (c, 0)
         _, y = self.geotransform() * (0, r)
-        return x, y
+        return _as_pair(x, y, dtype, out)
 
     
-    def get_latlon(self):
-        """Return 2D grids of latitude and longitudes"""
-        x, y = self.get_coordinates()
-        x2d, y2d = np.meshgrid(x, y)
-        proj2latlon = Transformer.from_crs(self.crs, self.crs.geodetic_crs)
-        lat, lon = proj2latlon.transform(x2d, y2d)
-        return lat, lon
+    def get_latlon(self, cache=True, engine='proj', dtype=np.float64, out=None,
+                   workers=1, backend='thread'):
+        """Return 2D grids of latitude and longitudes
+
+        Results are cached and returned as read-only arrays unless
+        cache is False or out is given.
+
+        :engine: 'proj' transforms with PROJ, 'numpy' uses the closed-form
+                 kernels in kernels.py, which return NaN for cells that
+                 are off the globe
+        :dtype: dtype of returned arrays, float32 halves memory
+        :out: optional tuple of (lat, lon) arrays with shape (rows, cols)
+        :workers: number of workers transforming bands of rows, None uses
+                  all cores.  Results are identical to workers=1
+        :backend: 'thread' or 'process', see parallel.py"""
+        dtype = np.dtype(dtype)
+        key = self.cache_key("latlon", engine, dtype.str)
+        if out is not None:
+            latlon = grid_cache.get(key) if cache else None
+            if latlon is None:
+                return self._compute_latlon(engine, dtype, out, workers, backend)
+            return _as_pair(latlon[0], latlon[1], dtype, out)
+        if cache:
+            latlon = grid_cache.get_or_compute(
+                key, lambda: self._compute_latlon(engine, dtype, workers=workers, backend=backend))
+        else:
+            latlon = self._compute_latlon(engine, dtype, workers=workers, backend=backend)
+        return latlon[0], latlon[1]
+
+
+    def _compute_latlon(self, engine='proj', dtype=np.float64, out=None,
+                        workers=1, backend='thread'):
+        """Returns latitude and longitude as out or a (2, rows, cols) array"""
+        if workers == 1:
+            if out is None:
+                out = _empty((2, self.rows, self.cols), dtype=dtype)
+            return self._latlon_window(slice(0, self.rows), slice(0, self.cols),
+                                       out=out, engine=engine)
+        band_rows = max(1, TRANSFORM_BUFFER_CELLS // self.cols) if engine == 'numpy' else None
+        return parallel.latlon(self, None if out is None else (out[0], out[1]),
+                               engine=engine, workers=workers, backend=backend,
+                               band_rows=band_rows, dtype=dtype)
+
+
+    def _latlon_window(self, row_slice, col_slice, out=None, engine='proj'):
+        """Returns latitude and longitude for a window
+
+        :out: (2, nrows, ncols) array or tuple of (lat, lon) arrays to write into,
+              if None a float64 (2, nrows, ncols) array is returned"""
+        if engine not in ENGINES:
+            raise ValueError(f"engine must be one of {ENGINES}, got {engine}")
+        gt = self.geotransform()
+        x = gt.a * (np.arange(col_slice.start, col_slice.stop) + 0.5) + gt.c
+        y = gt.e * (np.arange(row_slice.start, row_slice.stop) + 0.5) + gt.f
+        if out is None:
+            out = _empty((2, y.size, x.size))
+        lat, lon = out[0], out[1]
+        with profiling.span("grid.latlon", points=x.size * y.size):
+            self._transform_window(x, y, lat, lon, engine)
+        return out
+
+
+    def _transform_window(self, x, y, lat, lon, engine):
+        """Writes latitude and longitude of cells at 1D x and y into lat and lon"""
+        band_rows = max(1, TRANSFORM_BUFFER_CELLS // x.size)
+        if engine == 'numpy':
+            # Bands of rows bound the size of kernel temporaries
+            for start in range(0, y.size, band_rows):
+                band = slice(start, min(start + band_rows, y.size))
+                kernels.inverse(self.projection, x, y[band, np.newaxis], dtype=lat.dtype,
+                                out=(lat[band], lon[band]))
+            return
+        if all(a.dtype == np.float64 and a.flags.c_contiguous for a in (lat, lon)):
+            lat[...] = x
+            lon[...] = y[:, np.newaxis]
+            self.transformer().transform(lat, lon, inplace=True)
+            return
+        # Transform bands of rows in a float64 buffer and cast into out
+        buffer = _empty((2, min(band_rows, y.size), x.size))
+        for start in range(0, y.size, band_rows):
+            band = slice(start, min(start + band_rows, y.size))
+            band_lat, band_lon = buffer[:, :band.stop-start]
+            band_lat[...] = x
+            band_lon[...] = y[band, np.newaxis]
+            self.transformer().transform(band_lat, band_lon, inplace=True)
+            lat[band] = band_lat
+            lon[band] = band_lon
+
+
+    def iter_windows(self, block_shape):
+        """Yields (row_slice, col_slice) windows that tile the grid
+
+        :block_shape: (rows, cols) of each window.  Windows at the bottom
+                      and right edges may be smaller
+        """
+        block_rows, block_cols = block_shape
+        for row_start in range(0, self.rows, block_rows):
+            row_slice = slice(row_start, min(row_start + block_rows, self.rows))
+            for col_start in range(0, self.cols, block_cols):
+                yield row_slice, slice(col_start, min(col_start + block_cols, self.cols))
+
+
+    def iter_latlon_blocks(self, block_shape, engine='proj'):
+        """Yields (row_slice, col_slice, lat, lon) for windows of the grid
+
+        Latitudes and longitudes are computed for one window at a time, so
+        peak memory is proportional to block_shape rather than grid size.
+
+        :block_shape: (rows, cols) of each window
+        :engine: 'proj' or 'numpy', see get_latlon
+        """
+        for row_slice, col_slice in self.iter_windows(block_shape):
+            lat, lon = self._latlon_window(row_slice, col_slice, engine=engine)
+            yield row_slice, col_slice, lat, lon
+
+
+    def latlon_to_rowcol(self, lat, lon, chunk_size=1_000_000, fractional=False,
+                         engine='proj'):
+        """Return row and column indices for latitudes and longitudes
+
+        Points are projected chunk_size at a time, so working memory is
+        bounded by chunk_size rather than by the number of points.
+
+        :lat: array of latitudes
+        :lon: array of longitudes
+        :chunk_size: number of points projected at a time
+        :fractional: if True, return float indices in pixel coordinates,
+                     where the center of cell (0, 0) is at (0.5, 0.5).
+                     Otherwise return integer indices.
+        :engine: 'proj' or 'numpy', see get_latlon
+
+        :returns: row, col and outside arrays with the shape of lat.  outside
+                  is True for points off the grid, where integer indices are -1
+        """
+        lat, lon = np.broadcast_arrays(np.asarray(lat, dtype=float),
+                                       np.asarray(lon, dtype=float))
+        shape = lat.shape
+        lat, lon = lat.ravel(), lon.ravel()
+        index_dtype = np.float64 if fractional else np.int64
+        row = _empty(lat.size, dtype=index_dtype)
+        col = _empty(lat.size, dtype=index_dtype)
+        outside = _empty(lat.size, dtype=bool)
+        if engine not in ENGINES:
+            raise ValueError(f"engine must be one of {ENGINES}, got {engine}")
+        chunk_size = max(min(chunk_size, lat.size), 1)
+        buffer = _empty((2, chunk_size))
+        with profiling.span("grid.rowcol", points=lat.size):
+            for start in range(0, lat.size, chunk_size):
+                chunk = slice(start, min(start + chunk_size, lat.size))
+                self._rowcol_chunk(lat[chunk], lon[chunk], buffer[:, :chunk.stop-start],
+                                   row[chunk], col[chunk], outside[chunk], engine)
+        return row.reshape(shape), col.reshape(shape), outside.reshape(shape)
+
+
+    def iter_latlon_to_rowcol(self, chunks, fractional=False, engine='proj'):
+        """Yields row, col and outside arrays for each (lat, lon) chunk
+
+        See latlon_to_rowcol"""
+        for lat, lon in chunks:
+            yield self.latlon_to_rowcol(lat, lon, chunk_size=np.size(lat),
+                                        fractional=fractional, engine=engine)
+
+
+    def _rowcol_chunk(self, lat, lon, buffer, row, col, outside, engine='proj'):
+        """Projects one chunk into buffer and writes indices to row, col and outside"""
+        x, y = buffer
+        if engine == 'numpy':
+            kernels.forward(self.projection, lat, lon, out=(x, y))
+        else:
+            x[:] = lat
+            y[:] = lon
+            self.transformer().transform(x, y, direction=TransformDirection.INVERSE,
+                                         inplace=True)
+        inverse = ~self.geotransform()
+        x *= inverse.a
+        x += inverse.c
+        y *= inverse.e
+        y += inverse.f
+        inside = (x >= 0) & (x < self.cols) & (y >= 0) & (y < self.rows)
+        np.logical_not(inside, out=outside)
+        if row.dtype.kind == "f":
+            row[:] = y
+            col[:] = x
+            return
+        row.fill(-1)
+        col.fill(-1)
+        np.floor(x, out=x)
+        np.floor(y, out=y)
+        np.copyto(row, y, casting="unsafe", where=inside)
+        np.copyto(col, x, casting="unsafe", where=inside)
+
+
+    def subgrid(self, row_slice, col_slice, name=None):
+        """Returns the Grid of a window of this grid
+
+        :row_slice, col_slice: slices of rows and columns with step 1
+        :name: name of the new grid, defaults to the name and window
+        """
+        rows = range(self.rows)[row_slice]
+        cols = range(self.cols)[col_slice]
+        if rows.step != 1 or cols.step != 1:
+            raise ValueError("Windows must have a step of 1")
+        if name is None:
+            name = (f"{self.name} rows {rows.start}:{rows.stop} "
+                    f"cols {cols.start}:{cols.stop}")
+        return Grid(grid_info.Grid(
+            name=name,
+            epsg=self.epsg,
+            cols=len(cols),
+            rows=len(rows),
+            cell_width=self.cell_width,
+            cell_height=self.cell_height,
+            upper_left_x=self.upper_left_x + cols.start * self.cell_width,
+            upper_left_y=self.upper_left_y + rows.start * self.cell_height,
+            ))
+
+
+    def window(self, bbox, latlon=True, edge_points=WINDOW_EDGE_POINTS, engine='proj'):
+        """Return slices and Grid of the cells covering a bounding box
+
+        Only points along the box boundary are projected, then mapped to
+        cells with the inverse of the geotransform.  Data on the grid can
+        be read with data[..., row_slice, col_slice], and the returned
+        Grid describes that window.
+
+        :bbox: (west, south, east, north) in degrees if latlon is True,
+               otherwise (xmin, ymin, xmax, ymax) in projected meters.
+               If west > east the box crosses the antimeridian
+        :latlon: if False, bbox is in projected coordinates
+        :edge_points: points projected along each edge of a latitude and
+                      longitude box
+        :engine: 'proj' or 'numpy', see get_latlon
+
+        :returns: row_slice, col_slice and Grid of the window.  Raises
+                  ValueError if the box does not overlap the grid.  A box
+                  touching a point that cannot be projected, such as the
+                  opposite pole, gives the whole grid, and a box crossing the
+                  edge of a global grid gives all columns
+        """
+        if latlon:
+            lat, lon = bbox_boundary(bbox, edge_points)
+            row, col, _ = self.latlon_to_rowcol(lat, lon, fractional=True, engine=engine)
+            if not (np.isfinite(row).all() and np.isfinite(col).all()):
+                # The box touches a point with no projected coordinates, such
+                # as the opposite pole, so the whole grid is returned
+                row, col = np.array([0., self.rows]), np.array([0., self.cols])
+        else:
+            xmin, ymin, xmax, ymax = bbox
+            inverse = ~self.geotransform()
+            col, row = inverse * (np.array([xmin, xmax, xmax, xmin]),
+                                  np.array([ymin, ymin, ymax, ymax]))
+        row_slice = _covering_slice(row, self.rows)
+        col_slice = _covering_slice(col, self.cols)
+        if row_slice.start >= row_slice.stop or col_slice.start >= col_slice.stop:
+            raise ValueError(f"{bbox} does not overlap grid {self.name}")
+        return row_slice, col_slice, self.subgrid(row_slice, col_slice)
+
+
+    def scale_factors(self, dtype=np.float64):
+        """Return meridian and parallel scale factors h and k at cell centers
+
+        Scale factors are computed analytically for the projection family
+        and cached as read-only (rows, cols) arrays.  Cells that are off
+        the globe are NaN."""
+        dtype = np.dtype(dtype)
+        hk = grid_cache.get_or_compute(self.cache_key("scale_factors", dtype.str),
+                                       lambda: self._compute_scale_factors(dtype))
+        return hk[0], hk[1]
+
+
+    def _latlon_bands(self):
+        """Yields (row_slice, lat) for bands of about TRANSFORM_BUFFER_CELLS cells
+
+        Used for products that need latitude but should not hold the whole
+        lat and lon grids while they are computed"""
+        band_rows = max(1, TRANSFORM_BUFFER_CELLS // self.cols)
+        for row_slice, _, lat, _ in self.iter_latlon_blocks((band_rows, self.cols),
+                                                            engine='numpy'):
+            yield row_slice, lat
+
+
+    def _compute_scale_factors(self, dtype):
+        hk = _empty((2, self.rows, self.cols), dtype=dtype)
+        with profiling.span("grid.scale_factors", points=self.rows * self.cols):
+            for row_slice, lat in self._latlon_bands():
+                hk[0, row_slice], hk[1, row_slice] = kernels.scale_factors(self.projection, lat)
+        return hk
+
+
+    def cell_area(self, dtype=np.float64):
+        """Return true area of each grid cell in square meters
+
+        Area is the map area of the cell divided by h * k at the cell
+        center, so it is constant for equal-area grids and varies with
+        latitude for polar stereographic grids.  The cached, read-only
+        (rows, cols) array can be used to sum areas with a dot product,
+        for example np.tensordot(ice_mask, grid.cell_area(), axes=2).
+        Cells that are off the globe are NaN."""
+        dtype = np.dtype(dtype)
+        return grid_cache.get_or_compute(self.cache_key("cell_area", dtype.str),
+                                         lambda: self._compute_cell_area(dtype))
+
+
+    def _compute_cell_area(self, dtype):
+        map_area = abs(self.cell_width * self.cell_height)
+        if self.projection.family in EQUAL_AREA_FAMILIES:
+            area = _empty((self.rows, self.cols), dtype=dtype)
+            for row_slice, lat in self._latlon_bands():
+                area[row_slice] = np.where(np.isfinite(lat), map_area, np.nan)
+            return area
+        h, k = self.scale_factors()
+        return (map_area / (h * k)).astype(dtype)
+
+
+    def accumulator(self, engine='proj'):
+        """Returns an empty GridAccumulator for gridding points onto this grid"""
+        return GridAccumulator(self, engine=engine)
 
 
     def to_cartopy(self):
+        """Returns cartopy crs for the grid, memoized by CRS"""
         return to_cartopy(self.crs)
 
 
@@ -179,23 +673,52 @@ class Grid:
         return min(y), max(y)
 
 
-EASEGridNorth25km = Grid(grid_info.EASEGridNorth25km)
-EASEGridSouth25km = Grid(grid_info.EASEGridSouth25km)
-EASEGridGlobal25km = Grid(grid_info.EASEGridGlobal25km)
-
-EASEGrid2North25km = Grid(grid_info.EASEGrid2North25km)
-EASEGrid2South25km = Grid(grid_info.EASEGrid2South25km)
-EASEGrid2Global25km = Grid(grid_info.EASEGrid2Global25km)
-
-AVHRR_EASEGridNorth25km = Grid(grid_info.AVHRR_EASEGridNorth25km)
-AVHRR_EASEGridSouth25km = Grid(grid_info.AVHRR_EASEGridSouth25km)
-
-SSMI_PolarStereoNorth25km = Grid(grid_info.SSMI_PolarStereoNorth25km)
-SSMI_PolarStereoSouth25km = Grid(grid_info.SSMI_PolarStereoSouth25km)
-
 available_grids = [
     'EASEGridNorth25km', 'EASEGridSouth25km', 'EASEGridGlobal25km',
     'EASEGrid2North25km', 'EASEGrid2South25km', 'EASEGrid2Global25km',
     'AVHRR_EASEGridNorth25km', 'AVHRR_EASEGridSouth25km',
     'SSMI_PolarStereoNorth25km', 'SSMI_PolarStereoSouth25km',
     ]
+
+_grid_registry = {}
+
+# Nested EASE-Grid 2.0 grids that are not in available_grids, keyed by
+# (region, resolution)
+_ease_grid2_registry = {}
+
+
+def get_grid(name):
+    """Returns a registered Grid by name, creating it on first use"""
+    try:
+        return _grid_registry[name]
+    except KeyError:
+        pass
+    if name not in available_grids:
+        raise KeyError(f"{name} is not an available grid")
+    return _grid_registry.setdefault(name, Grid(getattr(grid_info, name)))
+
+
+def ease_grid2(region, resolution):
+    """Returns a nested EASE-Grid 2.0 Grid, see grid_info.ease_grid2
+
+    :region: North, South or Global
+    :resolution: nominal cell size in km, e.g. 36, 9, 3, 1 or 25, 12.5
+    """
+    name = f"EASEGrid2{region}{resolution:g}km"
+    if name in available_grids:
+        return get_grid(name)
+    key = (region, float(resolution))
+    if key not in _ease_grid2_registry:
+        _ease_grid2_registry[key] = Grid(grid_info.ease_grid2(region, resolution))
+    return _ease_grid2_registry[key]
+
+
+def __getattr__(name):
+    """Grids in available_grids are created lazily on attribute access"""
+    if name in available_grids:
+        return get_grid(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + available_grids)
@@ -37,6 +37,49 @@ POLAR_STEREO_SOUTH_EPSG = 3412
 POLAR_STEREO_NORTH_WGS84_EPSG = 3413
 POLAR_STEREO_SOUTH_WGS84_EPSG = 3976
 
+# Projection parameters used by the closed-form kernels in kernels.py.
+# family is the proj name: laea, cea or stere.  lat_ts is None for laea.
+Projection = namedtuple(
+    "Projection",
+    [
+        "family",
+        "lat_0",
+        "lon_0",
+        "lat_ts",
+        "semi_major",
+        "semi_minor",
+        ]
+)
+
+AUTHALIC_SPHERE_RADIUS = 6371228.
+WGS84_SEMI_MAJOR = 6378137.
+WGS84_SEMI_MINOR = 6356752.314245179
+HUGHES1980_SEMI_MAJOR = 6378273.
+HUGHES1980_SEMI_MINOR = 6356889.449
+
+PROJECTIONS = {
+    EASE_GRID_NORTH_EPSG: Projection(
+        "laea", 90., 0., None, AUTHALIC_SPHERE_RADIUS, AUTHALIC_SPHERE_RADIUS),
+    EASE_GRID_SOUTH_EPSG: Projection(
+        "laea", -90., 0., None, AUTHALIC_SPHERE_RADIUS, AUTHALIC_SPHERE_RADIUS),
+    EASE_GRID_GLOBAL_EPSG: Projection(
+        "cea", 0., 0., 30., AUTHALIC_SPHERE_RADIUS, AUTHALIC_SPHERE_RADIUS),
+    EASE_GRID2_NORTH_EPSG: Projection(
+        "laea", 90., 0., None, WGS84_SEMI_MAJOR, WGS84_SEMI_MINOR),
+    EASE_GRID2_SOUTH_EPSG: Projection(
+        "laea", -90., 0., None, WGS84_SEMI_MAJOR, WGS84_SEMI_MINOR),
+    EASE_GRID2_GLOBAL_EPSG: Projection(
+        "cea", 0., 0., 30., WGS84_SEMI_MAJOR, WGS84_SEMI_MINOR),
+    POLAR_STEREO_NORTH_EPSG: Projection(
+        "stere", 90., -45., 70., HUGHES1980_SEMI_MAJOR, HUGHES1980_SEMI_MINOR),
+    POLAR_STEREO_SOUTH_EPSG: Projection(
+        "stere", -90., 0., -70., HUGHES1980_SEMI_MAJOR, HUGHES1980_SEMI_MINOR),
+    POLAR_STEREO_NORTH_WGS84_EPSG: Projection(
+        "stere", 90., -45., 70., WGS84_SEMI_MAJOR, WGS84_SEMI_MINOR),
+    POLAR_STEREO_SOUTH_WGS84_EPSG: Projection(
+        "stere", -90., 0., -70., WGS84_SEMI_MAJOR, WGS84_SEMI_MINOR),
+    }
+
 EASEGridNorth25km = Grid(
     name ="EASE-Grid North 25 km",
     epsg =EASE_GRID_NORTH_EPSG,
@@ -66,7 +109,7 @@ EASEGridGlobal25km = Grid(
     rows = 586,
     cell_width = EASE_GRID25_WIDTH,
     cell_height = EASE_GRID25_HEIGHT,
-    upper_left_x = np.round(-1 * EASE_GRID25_HEIGHT * (1383/2), 6),
+    upper_left_x = np.round(-1 * EASE_GRID25_WIDTH * (1383/2), 6),
     upper_left_y = np.round(-1 * EASE_GRID25_HEIGHT * (586/2), 6),
     )
 
@@ -147,3 +190,88 @@ SSMI_PolarStereoSouth25km = Grid(
     upper_left_y=4350000.
     )
 
+
+# EASE-Grid 2.0 grids are nested: each grid is a whole-number subdivision of
+# a base grid and covers the same extent (Brodzik et al, 2012).  There are
+# two families, 36 km (36, 18, 12, 9, 3, 1 km ...) and 25 km (25, 12.5,
+# 6.25, 3.125 km ...).  The Global 36 km cell is 36032.220840584 m.
+EASE_GRID2_REGIONS = ('North', 'South', 'Global')
+EASE_GRID2_BASE_RESOLUTIONS = (36, 25)
+
+EASEGrid2North36km = Grid(
+    name="EASE-Grid 2.0 North 36 km",
+    epsg=EASE_GRID2_NORTH_EPSG,
+    cols=500,
+    rows=500,
+    cell_width=36000.,
+    cell_height=-36000.,
+    upper_left_x=-9000000.0,
+    upper_left_y=9000000.0
+    )
+
+EASEGrid2South36km = Grid(
+    name="EASE-Grid 2.0 South 36 km",
+    epsg=EASE_GRID2_SOUTH_EPSG,
+    cols=500,
+    rows=500,
+    cell_width=36000.,
+    cell_height=-36000.,
+    upper_left_x=-9000000.0,
+    upper_left_y=9000000.0
+    )
+
+EASEGrid2Global36km = Grid(
+    name="EASE-Grid 2.0 Global 36 km",
+    epsg=EASE_GRID2_GLOBAL_EPSG,
+    cols=964,
+    rows=406,
+    cell_width=36032.220840584,
+    cell_height=-36032.220840584,
+    upper_left_x=-17367530.445161372,
+    upper_left_y=7314540.830638563
+    )
+
+EASE_GRID2_BASES = {
+    ('North', 36): EASEGrid2North36km,
+    ('South', 36): EASEGrid2South36km,
+    ('Global', 36): EASEGrid2Global36km,
+    ('North', 25): EASEGrid2North25km,
+    ('South', 25): EASEGrid2South25km,
+    ('Global', 25): EASEGrid2Global25km,
+    }
+
+
+def subdivide(grid, factor, name=None):
+    """Returns grid definition with each cell split into factor x factor cells
+
+    :grid: grid_info.Grid
+    :factor: whole number of cells along each side of the original cell
+    :name: name of new grid, defaults to grid.name
+    """
+    return grid._replace(
+        name=grid.name if name is None else name,
+        cols=grid.cols * factor,
+        rows=grid.rows * factor,
+        cell_width=grid.cell_width / factor,
+        cell_height=grid.cell_height / factor,
+        )
+
+
+def ease_grid2(region, resolution):
+    """Returns definition of a nested EASE-Grid 2.0 grid
+
+    :region: one of EASE_GRID2_REGIONS
+    :resolution: nominal cell size in km.  36 or 25 km divided by a whole
+                 number, e.g. 9, 3, 1 or 12.5 km
+
+    :returns: grid_info.Grid
+    """
+    if region not in EASE_GRID2_REGIONS:
+        raise ValueError(f"region must be one of {EASE_GRID2_REGIONS}, got {region}")
+    for base_resolution in EASE_GRID2_BASE_RESOLUTIONS:
+        factor = round(base_resolution / resolution)
+        if factor >= 1 and np.isclose(base_resolution / factor, resolution, rtol=1e-9, atol=0.):
+            return subdivide(EASE_GRID2_BASES[(region, base_resolution)], factor,
+                             name=f"EASE-Grid 2.0 {region} {resolution:g} km")
+    raise ValueError(f"{resolution} km is not a whole subdivision of "
+                     f"{' or '.join(f'{r} km' for r in EASE_GRID2_BASE_RESOLUTIONS)}")
@@ -0,0 +1,118 @@
+"""Drop-in-bucket gridding of point data onto a Grid
+
+Points are assigned to the grid cell that contains them and running
+count, sum, sum of squares, minimum and maximum are kept for each cell,
+so chunks of points can be streamed without holding them in memory.
+Accumulators for the same grid can be merged, for example after gridding
+granules in parallel.
+"""
+import numpy as np
+
+
+class GridAccumulator:
+    """Running per-cell statistics of points on a Grid
+
+    :grid: Grid to accumulate onto
+    :engine: projection engine used to locate points, see Grid.get_latlon
+    """
+    def __init__(self, grid, engine='proj'):
+        self.grid = grid
+        self.engine = engine
+        size = grid.rows * grid.cols
+        self.count = np.zeros(size, dtype=np.int64)
+        self.sum = np.zeros(size)
+        self.sum_of_squares = np.zeros(size)
+        self.min = np.full(size, np.inf)
+        self.max = np.full(size, -np.inf)
+
+
+    def __str__(self):
+        return ("GridAccumulator object\n"
+                f"grid: {self.grid.name}\n"
+                f"points: {self.count.sum()}\n"
+                f"cells: {np.count_nonzero(self.count)}\n")
+
+
+    def add(self, lat, lon, values):
+        """Adds points to the accumulator
+
+        Points off the grid and non-finite values are ignored
+
+        :returns: number of points added
+        """
+        values = np.asarray(values, dtype=np.float64).ravel()
+        row, col, outside = self.grid.latlon_to_rowcol(lat, lon, engine=self.engine)
+        keep = ~outside.ravel() & np.isfinite(values)
+        index = row.ravel()[keep] * self.grid.cols + col.ravel()[keep]
+        values = values[keep]
+        size = self.count.size
+        self.count += np.bincount(index, minlength=size)
+        self.sum += np.bincount(index, weights=values, minlength=size)
+        self.sum_of_squares += np.bincount(index, weights=values * values, minlength=size)
+        np.minimum.at(self.min, index, values)
+        np.maximum.at(self.max, index, values)
+        return index.size
+
+
+    def update(self, chunks):
+        """Adds points from an iterable of (lat, lon, values) chunks
+
+        :returns: self
+        """
+        for lat, lon, values in chunks:
+            self.add(lat, lon, values)
+        return self
+
+
+    def merge(self, other):
+        """Adds statistics from another accumulator on the same grid
+
+        :returns: self
+        """
+        if other.grid.cache_key("grid") != self.grid.cache_key("grid"):
+            raise ValueError(f"Cannot merge {other.grid.name} into {self.grid.name}")
+        self.count += other.count
+        self.sum += other.sum
+        self.sum_of_squares += other.sum_of_squares
+        np.minimum(self.min, other.min, out=self.min)
+        np.maximum(self.max, other.max, out=self.max)
+        return self
+
+
+    def _raster(self, values):
+        """Returns per-cell values as a (rows, cols) array, NaN for empty cells"""
+        raster = np.where(self.count > 0, values, np.nan)
+        return raster.reshape(self.grid.rows, self.grid.cols)
+
+
+    def counts(self):
+        """Returns number of points in each cell"""
+        return self.count.reshape(self.grid.rows, self.grid.cols)
+
+
+    def mean(self):
+        """Returns mean of points in each cell"""
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return self._raster(self.sum / self.count)
+
+
+    def std(self, ddof=0):
+        """Returns standard deviation of points in each cell
+
+        :ddof: delta degrees of freedom, cells with count <= ddof are NaN
+        """
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = self.sum / self.count
+            variance = (self.sum_of_squares - self.count * mean**2) / (self.count - ddof)
+            variance = np.where(self.count > ddof, np.maximum(variance, 0.), np.nan)
+        return self._raster(np.sqrt(variance))
+
+
+    def minimum(self):
+        """Returns minimum of points in each cell"""
+        return self._raster(self.min)
+
+
+    def maximum(self):
+        """Returns maximum of points in each cell"""
+        return self._raster(self.max)
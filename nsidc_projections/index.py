@@ -0,0 +1,246 @@
+"""Index of grids by shape, cell size and upper-left corner
+
+Lookups are dictionary lookups, so identifying the grid of an unlabeled
+array or file takes constant time however many grids are indexed.
+
+    from nsidc_projections import identify
+    identify(shape=(448, 304))
+    identify(x=ds.x.values, y=ds.y.values)
+"""
+import math
+from collections import defaultdict
+
+import numpy as np
+
+from nsidc_projections import grid_info, kernels
+from nsidc_projections.grid import Grid, available_grids, ease_grid2, get_grid
+
+# Coordinates and cell sizes within TOLERANCE meters are treated as equal
+TOLERANCE = 1.
+
+# Nested EASE-Grid 2.0 resolutions added to the default index
+EASE_GRID2_RESOLUTIONS = (36, 9, 3, 1, 25, 12.5, 6.25, 3.125)
+
+MAPX_FAMILIES = {
+    "azimuthal equal-area": "laea",
+    "cylindrical equal-area": "cea",
+    "polar stereographic": "stere",
+    }
+
+
+def _bins(value, tolerance):
+    """Returns keys of the bins within tolerance of value"""
+    key = math.floor(value / tolerance)
+    return (key - 1, key, key + 1)
+
+
+def coordinate_geometry(x, y):
+    """Returns (cell width, cell height, upper-left x, upper-left y) from
+    1D cell-center coordinates in either order"""
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    if x.size < 2 or y.size < 2:
+        raise ValueError("x and y must each have at least two coordinates")
+    width = abs(x[1] - x[0])
+    height = abs(y[1] - y[0])
+    return width, height, x.min() - width / 2., y.max() + height / 2.
+
+
+class GridIndex:
+    """Index of grids by (rows, cols), cell size and upper-left corner
+
+    :grids: Grids to index
+    :tolerance: meters within which cell sizes and corners match
+    """
+    def __init__(self, grids=(), tolerance=TOLERANCE):
+        self.tolerance = tolerance
+        self.grids = []
+        self._by_shape = defaultdict(list)
+        self._by_cell_size = defaultdict(list)
+        self._by_corner = defaultdict(list)
+        for grid in grids:
+            self.add(grid)
+
+
+    def __len__(self):
+        return len(self.grids)
+
+
+    def add(self, grid):
+        """Adds a Grid to the index"""
+        position = len(self.grids)
+        self.grids.append(grid)
+        self._by_shape[(grid.rows, grid.cols)].append(position)
+        self._by_cell_size[math.floor(abs(grid.cell_width) / self.tolerance)].append(position)
+        self._by_corner[(math.floor(grid.upper_left_x / self.tolerance),
+                         math.floor(grid.upper_left_y / self.tolerance))].append(position)
+
+
+    def _near_cell_size(self, width, height):
+        found = set()
+        for key in _bins(width, self.tolerance):
+            for position in self._by_cell_size.get(key, ()):
+                grid = self.grids[position]
+                if (abs(abs(grid.cell_width) - width) <= self.tolerance and
+                        abs(abs(grid.cell_height) - height) <= self.tolerance):
+                    found.add(position)
+        return found
+
+
+    def _near_corner(self, upper_left_x, upper_left_y):
+        found = set()
+        for key_x in _bins(upper_left_x, self.tolerance):
+            for key_y in _bins(upper_left_y, self.tolerance):
+                for position in self._by_corner.get((key_x, key_y), ()):
+                    grid = self.grids[position]
+                    if (abs(grid.upper_left_x - upper_left_x) <= self.tolerance and
+                            abs(grid.upper_left_y - upper_left_y) <= self.tolerance):
+                        found.add(position)
+        return found
+
+
+    def identify(self, shape=None, x=None, y=None, cell_size=None, epsg=None):
+        """Returns grids matching all of the given properties
+
+        :shape: (rows, cols) of an array on the grid
+        :x, y: 1D cell-center coordinates, giving cell size, corner and shape
+        :cell_size: cell width in meters, or (width, height)
+        :epsg: EPSG code of the grid CRS
+
+        :returns: list of matching Grids in the order they were added
+        """
+        candidates = None
+
+        def narrow(found):
+            return found if candidates is None else candidates & found
+
+        if shape is not None:
+            candidates = narrow(set(self._by_shape.get(tuple(shape), ())))
+        if x is not None or y is not None:
+            if x is None or y is None:
+                raise ValueError("x and y must be given together")
+            width, height, upper_left_x, upper_left_y = coordinate_geometry(x, y)
+            candidates = narrow(set(self._by_shape.get((len(y), len(x)), ())))
+            candidates = narrow(self._near_cell_size(width, height))
+            candidates = narrow(self._near_corner(upper_left_x, upper_left_y))
+        if cell_size is not None:
+            width, height = (cell_size, cell_size) if np.isscalar(cell_size) else cell_size
+            candidates = narrow(self._near_cell_size(abs(width), abs(height)))
+        if candidates is None:
+            raise ValueError("Give at least one of shape, x and y, or cell_size")
+        grids = [self.grids[position] for position in sorted(candidates)]
+        if epsg is not None:
+            grids = [grid for grid in grids if grid.epsg == epsg]
+        return grids
+
+
+def mapx_epsg(params):
+    """Returns EPSG code with the projection of mapx params, or None
+
+    Projections are matched to grid_info.PROJECTIONS on family, reference
+    latitude and longitude, latitude of true scale if given, and ellipsoid.
+    """
+    name = params.get("Map Projection", "").lower()
+    family = next((f for key, f in MAPX_FAMILIES.items() if key in name), None)
+    radius = params.get("Map Equatorial Radius")
+    if family is None or radius is None:
+        return None
+    for epsg, projection in grid_info.PROJECTIONS.items():
+        if projection.family != family:
+            continue
+        if family != 'cea' and not math.isclose(projection.lat_0,
+                                                params.get("Map Reference Latitude", math.nan)):
+            continue
+        if not math.isclose(projection.lon_0, params.get("Map Reference Longitude", math.nan),
+                            abs_tol=1e-9):
+            continue
+        lat_ts = params.get("Map Latitude True Scale")
+        if lat_ts is not None and projection.lat_ts is not None and \
+           not math.isclose(projection.lat_ts, lat_ts):
+            continue
+        if abs(projection.semi_major - radius) > 1. or \
+           abs(kernels.eccentricity(projection) - params.get("Map Eccentricity", 0.)) > 1e-6:
+            continue
+        return epsg
+    return None
+
+
+def mapx_grid(name, params):
+    """Returns Grid for mapx params, or None if the projection has no EPSG code"""
+    epsg = mapx_epsg(params)
+    if epsg is None:
+        return None
+    return Grid(grid_info.Grid(
+        name=name,
+        epsg=epsg,
+        cols=params["Grid Width"],
+        rows=params["Grid Height"],
+        cell_width=params["Cell Width"],
+        cell_height=params["Cell Height"],
+        upper_left_x=params["Map Origin X"],
+        upper_left_y=params["Map Origin Y"],
+        ))
+
+
+def add_mapx_catalog(index, catalog):
+    """Adds grids from a MapxCatalog to index
+
+    :returns: names of catalog entries that were not added
+    """
+    skipped = []
+    for name in catalog.names():
+        try:
+            grid = mapx_grid(name, catalog[name])
+        except KeyError:
+            grid = None
+        if grid is None:
+            skipped.append(name)
+        else:
+            index.add(grid)
+    return skipped
+
+
+def default_grids():
+    """Returns registered grids and the nested EASE-Grid 2.0 grids"""
+    grids = [get_grid(name) for name in available_grids]
+    names = {grid.name for grid in grids}
+    for region in grid_info.EASE_GRID2_REGIONS:
+        for resolution in EASE_GRID2_RESOLUTIONS:
+            grid = ease_grid2(region, resolution)
+            if grid.name not in names:
+                grids.append(grid)
+    return grids
+
+
+_default_index = None
+_mapx_added = False
+
+
+def get_index(mapx=False):
+    """Returns the default index, building it on first use
+
+    :mapx: if True, grids from the MapX catalog are added on first use
+    """
+    global _default_index, _mapx_added
+    if _default_index is None:
+        _default_index = GridIndex(default_grids())
+    if mapx and not _mapx_added:
+        from nsidc_projections.mapx.catalog import get_catalog
+        add_mapx_catalog(_default_index, get_catalog())
+        _mapx_added = True
+    return _default_index
+
+
+def identify(shape=None, x=None, y=None, cell_size=None, epsg=None, mapx=False):
+    """Returns grids matching an array shape, coordinates or cell size
+
+    :shape: (rows, cols) of an array on the grid
+    :x, y: 1D cell-center coordinates
+    :cell_size: cell width in meters, or (width, height)
+    :epsg: EPSG code of the grid CRS
+    :mapx: if True, also searches grids in the MapX catalog
+
+    :returns: list of candidate Grids
+    """
+    return get_index(mapx=mapx).identify(shape=shape, x=x, y=y, cell_size=cell_size,
+                                         epsg=epsg)
@@ -0,0 +1,225 @@
+"""Closed-form NumPy projection kernels for NSIDC grids
+
+Forward and inverse formulas follow Snyder (1987) Map Projections - A
+Working Manual, USGS Professional Paper 1395, for the three projection
+families used by NSIDC grids: polar Lambert azimuthal equal-area (laea),
+normal cylindrical equal-area (cea) and polar stereographic with a
+latitude of true scale (stere).  Spherical projections are the e = 0
+case of the ellipsoidal formulas.
+
+Kernels take a grid_info.Projection.  Calculations are done in the dtype
+of the inputs (float32 or float64) unless dtype is given.  Points that are
+off the globe for a projection are returned as NaN.
+"""
+import math
+
+import numpy as np
+
+FAMILIES = ('laea', 'cea', 'stere')
+
+# Degrees from the pole within which scale factors take their polar limit
+POLE_TOLERANCE = 1e-6
+
+
+def eccentricity(projection):
+    """Returns first eccentricity of the projection ellipsoid"""
+    return math.sqrt(1. - (projection.semi_minor / projection.semi_major)**2)
+
+
+def _q(sinphi, e):
+    """Returns q (Snyder eq 3-12)"""
+    if e == 0.:
+        return 2. * sinphi
+    esinphi = e * sinphi
+    return (1. - e**2) * (sinphi / (1. - esinphi**2) -
+                          np.log((1. - esinphi) / (1. + esinphi)) / (2. * e))
+
+
+def _q_pole(e):
+    """Returns q at the pole"""
+    if e == 0.:
+        return 2.
+    return 1. - (1. - e**2) / (2. * e) * math.log((1. - e) / (1. + e))
+
+
+def _authalic_to_geodetic(beta, e):
+    """Returns geodetic latitude from authalic latitude in radians (Snyder eq 3-18)"""
+    if e == 0.:
+        return beta
+    e2, e4, e6 = e**2, e**4, e**6
+    return (beta +
+            (e2 / 3. + 31. * e4 / 180. + 517. * e6 / 5040.) * np.sin(2. * beta) +
+            (23. * e4 / 360. + 251. * e6 / 3780.) * np.sin(4. * beta) +
+            761. * e6 / 45360. * np.sin(6. * beta))
+
+
+def _conformal_to_geodetic(chi, e):
+    """Returns geodetic latitude from conformal latitude in radians (Snyder eq 3-5)"""
+    if e == 0.:
+        return chi
+    e2, e4, e6, e8 = e**2, e**4, e**6, e**8
+    return (chi +
+            (e2 / 2. + 5. * e4 / 24. + e6 / 12. + 13. * e8 / 360.) * np.sin(2. * chi) +
+            (7. * e4 / 48. + 29. * e6 / 240. + 811. * e8 / 11520.) * np.sin(4. * chi) +
+            (7. * e6 / 120. + 81. * e8 / 1120.) * np.sin(6. * chi) +
+            4279. * e8 / 161280. * np.sin(8. * chi))
+
+
+def _t(phi, e):
+    """Returns t (Snyder eq 15-9)"""
+    t = np.tan(math.pi / 4. - phi / 2.)
+    if e == 0.:
+        return t
+    esinphi = e * np.sin(phi)
+    return t * ((1. + esinphi) / (1. - esinphi))**(e / 2.)
+
+
+def _stere_rho_scale(projection, e):
+    """Returns ratio of rho to t for polar stereographic (Snyder eq 21-33, 21-34)"""
+    phi_c = math.radians(abs(projection.lat_ts))
+    if phi_c == math.pi / 2.:
+        return 2. / math.sqrt((1. + e)**(1. + e) * (1. - e)**(1. - e))
+    m_c = math.cos(phi_c) / math.sqrt(1. - (e * math.sin(phi_c))**2)
+    t_c = math.tan(math.pi / 4. - phi_c / 2.)
+    if e != 0.:
+        esinphi_c = e * math.sin(phi_c)
+        t_c *= ((1. + esinphi_c) / (1. - esinphi_c))**(e / 2.)
+    return m_c / t_c
+
+
+def _cea_k0(projection, e):
+    """Returns scale factor along the standard parallel (Snyder eq 10-13)"""
+    phi_ts = math.radians(projection.lat_ts)
+    return math.cos(phi_ts) / math.sqrt(1. - (e * math.sin(phi_ts))**2)
+
+
+def _wrap(lam):
+    """Wraps longitude in radians to [-pi, pi)"""
+    return (lam + math.pi) % (2. * math.pi) - math.pi
+
+
+def _prepare(u, v, dtype, out):
+    """Returns inputs as arrays of dtype and output arrays"""
+    u = np.asarray(u)
+    v = np.asarray(v)
+    if dtype is None:
+        dtype = np.result_type(u, v, np.float32)
+    u = u.astype(dtype, copy=False)
+    v = v.astype(dtype, copy=False)
+    if out is None:
+        shape = np.broadcast_shapes(u.shape, v.shape)
+        out = (np.empty(shape, dtype=dtype), np.empty(shape, dtype=dtype))
+    return u, v, out
+
+
+def _check_family(projection):
+    if projection.family not in FAMILIES:
+        raise NotImplementedError(f"{projection.family} is not available")
+
+
+def forward(projection, lat, lon, dtype=None, out=None):
+    """Projects latitude and longitude to x and y
+
+    :projection: grid_info.Projection
+    :lat: latitudes in degrees
+    :lon: longitudes in degrees
+    :dtype: float dtype for calculation and output, defaults to input dtype
+    :out: optional tuple of (x, y) output arrays
+
+    :returns: x and y in meters
+    """
+    _check_family(projection)
+    lat, lon, (x, y) = _prepare(lat, lon, dtype, out)
+    e = eccentricity(projection)
+    a = projection.semi_major
+    phi = np.radians(lat)
+    lam = _wrap(np.radians(lon - projection.lon_0))
+    with np.errstate(invalid="ignore", divide="ignore"):
+        if projection.family == 'cea':
+            k0 = _cea_k0(projection, e)
+            np.multiply(lam, a * k0, out=x)
+            np.multiply(_q(np.sin(phi), e), a / (2. * k0), out=y)
+            return x, y
+        sign = 1. if projection.lat_0 > 0 else -1.
+        if projection.family == 'laea':
+            rho = a * np.sqrt(_q_pole(e) - sign * _q(np.sin(phi), e))
+        else:
+            rho = a * _stere_rho_scale(projection, e) * _t(sign * phi, e)
+        np.multiply(rho, np.sin(lam), out=x)
+        np.multiply(rho, -sign * np.cos(lam), out=y)
+    return x, y
+
+
+def inverse(projection, x, y, dtype=None, out=None):
+    """Returns latitude and longitude of projected x and y
+
+    :projection: grid_info.Projection
+    :x: x in meters
+    :y: y in meters
+    :dtype: float dtype for calculation and output, defaults to input dtype
+    :out: optional tuple of (lat, lon) output arrays
+
+    :returns: latitude and longitude in degrees, NaN where undefined
+    """
+    _check_family(projection)
+    x, y, (lat, lon) = _prepare(x, y, dtype, out)
+    e = eccentricity(projection)
+    a = projection.semi_major
+    with np.errstate(invalid="ignore", divide="ignore"):
+        if projection.family == 'cea':
+            k0 = _cea_k0(projection, e)
+            beta = np.arcsin(y * (2. * k0 / (a * _q_pole(e))))
+            lat[...] = np.degrees(_authalic_to_geodetic(beta, e))
+            lon[...] = np.degrees(_wrap(x / (a * k0) + math.radians(projection.lon_0)))
+            return lat, lon
+        sign = 1. if projection.lat_0 > 0 else -1.
+        rho = np.hypot(x, y)
+        if projection.family == 'laea':
+            qp = _q_pole(e)
+            beta = np.arcsin(1. - (rho / a)**2 / qp)
+            phi = _authalic_to_geodetic(beta, e)
+        else:
+            t = rho / (a * _stere_rho_scale(projection, e))
+            phi = _conformal_to_geodetic(math.pi / 2. - 2. * np.arctan(t), e)
+        np.degrees(sign * phi, out=lat)
+        lam = np.arctan2(x, -sign * y)
+        np.degrees(_wrap(lam + math.radians(projection.lon_0)), out=lon)
+    return lat, lon
+
+
+def scale_factors(projection, lat, dtype=None):
+    """Returns meridian and parallel scale factors h and k at latitudes
+
+    Scale factors of these families depend only on latitude.  h * k is 1
+    for the equal-area laea and cea families; h equals k for the conformal
+    stere family (Snyder eq 10-16, 21-32, 24-2).
+
+    :projection: grid_info.Projection
+    :lat: latitudes in degrees
+    :dtype: float dtype for calculation and output, defaults to input dtype
+
+    :returns: h and k
+    """
+    _check_family(projection)
+    lat = np.asarray(lat)
+    lat = lat.astype(dtype or np.result_type(lat, np.float32), copy=False)
+    e = eccentricity(projection)
+    phi = np.radians(lat)
+    sinphi = np.sin(phi)
+    m = np.cos(phi) / np.sqrt(1. - (e * sinphi)**2)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        if projection.family == 'cea':
+            k = _cea_k0(projection, e) / m
+            return 1. / k, k
+        sign = 1. if projection.lat_0 > 0 else -1.
+        # rho / m loses precision approaching the pole, use the limit there
+        near_pole = (90. - sign * lat) < POLE_TOLERANCE
+        if projection.family == 'laea':
+            rho = np.sqrt(_q_pole(e) - sign * _q(sinphi, e))
+            k = np.where(near_pole, 1., rho / m).astype(lat.dtype, copy=False)
+            return 1. / k, k
+        at_pole = 0.5 * _stere_rho_scale(projection, e) * math.sqrt(
+            (1. + e)**(1. + e) * (1. - e)**(1. - e))
+        rho = _stere_rho_scale(projection, e) * _t(sign * phi, e)
+        k = np.where(near_pole, at_pole, rho / m).astype(lat.dtype, copy=False)
+        return k, k.copy()
@@ -0,0 +1,231 @@
+"""Indexed catalog of MapX grid definitions
+
+The catalog parses every .gpd file in a mapxmaps directory, together with
+the .mpp file it references, and saves the parameters to a JSON index.
+On later loads only files whose modification time or size has changed
+are parsed again, and lookups by name are dictionary lookups.  Files that
+cannot be parsed are saved in the index with their error, so they are
+only tried again once they or the mpp file they reference change.
+"""
+import json
+import os
+from pathlib import Path
+
+from nsidc_projections import filepath
+from nsidc_projections.cache import CACHE_DIR_ENV, make_key
+from nsidc_projections.mapx import parse_mapx
+
+INDEX_VERSION = 2
+
+
+def default_index_path(mapx_path):
+    """Returns index file path for a mapxmaps directory"""
+    cache_dir = os.environ.get(CACHE_DIR_ENV)
+    cache_dir = Path(cache_dir) if cache_dir else Path.home() / ".cache" / "nsidc_projections"
+    return cache_dir / f"mapx_index_{make_key(str(Path(mapx_path).resolve()))[:16]}.json"
+
+
+def _signature(path):
+    """Returns (mtime in ns, size) used to detect changed files"""
+    stat = os.stat(path)
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+class MapxCatalog:
+    """Catalog of grid definitions in a mapxmaps directory
+
+    :mapx_path: directory of .gpd and .mpp files, defaults to MAPXMAPS_PATH
+    :index_path: JSON index file, defaults to a file in the cache directory.
+                 Set to False to keep the catalog in memory only
+    """
+    def __init__(self, mapx_path=None, index_path=None):
+        self.mapx_path = Path(filepath.MAPXMAPS_PATH if mapx_path is None else mapx_path)
+        if index_path is None:
+            index_path = default_index_path(self.mapx_path)
+        self.index_path = Path(index_path) if index_path else None
+        self.entries = {}
+        self.errors = {}
+        self.failures = {}
+        self.parsed = 0
+        self.refresh()
+
+
+    def __len__(self):
+        return len(self.entries)
+
+
+    def __contains__(self, gpdname):
+        return _gpd_key(gpdname) in self.entries
+
+
+    def __getitem__(self, gpdname):
+        """Returns a copy of the parameters, so callers cannot change the catalog"""
+        return dict(self.entries[_gpd_key(gpdname)]["params"])
+
+
+    def __iter__(self):
+        return iter(self.entries)
+
+
+    def names(self):
+        """Returns names of grid definitions in the catalog"""
+        return sorted(self.entries)
+
+
+    def get_grid_definition(self, gpdname):
+        """Returns parameters for a gpd, parsing it if it is not in the catalog"""
+        try:
+            return self[gpdname]
+        except KeyError:
+            return parse_mapx.get_grid_definition(gpdname, self.mapx_path)
+
+
+    def _load_index(self):
+        """Returns entries and failures from the index file, or ({}, {}) if
+        missing or stale"""
+        if self.index_path is None or not self.index_path.exists():
+            return {}, {}
+        try:
+            with open(self.index_path) as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            return {}, {}
+        if index.get("version") != INDEX_VERSION or index.get("mapx_path") != str(self.mapx_path):
+            return {}, {}
+        return index.get("entries", {}), index.get("failures", {})
+
+
+    def _save_index(self):
+        if self.index_path is None:
+            return
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        index = {
+            "version": INDEX_VERSION,
+            "mapx_path": str(self.mapx_path),
+            "entries": self.entries,
+            "failures": self.failures,
+            }
+        tmp_path = self.index_path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(index, f, separators=(",", ":"))
+        os.replace(tmp_path, self.index_path)
+
+
+    def _mpp_signature(self, mpp_file, signatures):
+        """Returns signature of mpp file, memoized in signatures for one scan"""
+        if mpp_file not in signatures:
+            try:
+                signatures[mpp_file] = _signature(
+                    parse_mapx.make_mpp_path(mpp_file, self.mapx_path))
+            except OSError:
+                signatures[mpp_file] = None
+        return signatures[mpp_file]
+
+
+    def _is_current(self, entry, gpd_signature, mpp_signatures):
+        if entry.get("gpd") != gpd_signature:
+            return False
+        mpp_file, mpp_signature = entry.get("mpp", (None, None))
+        if mpp_file is None:
+            return True
+        return self._mpp_signature(mpp_file, mpp_signatures) == mpp_signature
+
+
+    def _parse_entry(self, name, gpd_signature, mpp_signatures):
+        params = parse_mapx.get_grid_definition(name, self.mapx_path)
+        mpp_file = params.get("Grid MPP File")
+        mpp = [None, None]
+        if mpp_file is not None:
+            mpp = [mpp_file, self._mpp_signature(mpp_file, mpp_signatures)]
+        return {"gpd": gpd_signature, "mpp": mpp, "params": params}
+
+
+    def _referenced_mpp(self, name):
+        """Returns mpp file named by an original-style gpd, or None"""
+        try:
+            buffer = parse_mapx.make_gpd_path(name, self.mapx_path).read_bytes()
+            if not parse_mapx.is_original_style(buffer):
+                return None
+            for key, value in parse_mapx.tokenize(buffer, original_style=True):
+                if key == "map projection parameters":
+                    return value
+        except (OSError, ValueError):
+            pass
+        return None
+
+
+    def _failure_entry(self, name, gpd_signature, mpp_signatures, err):
+        mpp_file = self._referenced_mpp(name)
+        mpp = [None, None]
+        if mpp_file is not None:
+            mpp = [mpp_file, self._mpp_signature(mpp_file, mpp_signatures)]
+        return {"gpd": gpd_signature, "mpp": mpp, "error": f"{type(err).__name__}: {err}"}
+
+
+    def refresh(self):
+        """Scans mapx_path, parsing new or changed gpd files
+
+        Files that cannot be parsed are recorded in errors, and are not
+        parsed again until they or the mpp file they reference change.
+
+        :returns: number of gpd files parsed
+        """
+        if self.entries or self.failures:
+            previous, previous_failures = self.entries, self.failures
+        else:
+            previous, previous_failures = self._load_index()
+        entries, failures, mpp_signatures = {}, {}, {}
+        parsed = 0
+        for gpd_entry in sorted(os.scandir(self.mapx_path), key=lambda e: e.name):
+            if not gpd_entry.name.endswith(".gpd"):
+                continue
+            name = gpd_entry.name[:-4]
+            stat = gpd_entry.stat()
+            gpd_signature = [stat.st_mtime_ns, stat.st_size]
+            entry = previous.get(name)
+            if entry is not None and self._is_current(entry, gpd_signature, mpp_signatures):
+                entries[name] = entry
+                continue
+            failure = previous_failures.get(name)
+            if failure is not None and self._is_current(failure, gpd_signature, mpp_signatures):
+                failures[name] = failure
+                continue
+            try:
+                entries[name] = self._parse_entry(name, gpd_signature, mpp_signatures)
+            except (NotImplementedError, KeyError, ValueError, IndexError, OSError) as err:
+                failures[name] = self._failure_entry(name, gpd_signature, mpp_signatures, err)
+            parsed += 1
+        changed = (parsed > 0 or entries.keys() != previous.keys() or
+                   failures.keys() != previous_failures.keys())
+        self.entries, self.failures = entries, failures
+        self.errors = {name: failure["error"] for name, failure in failures.items()}
+        self.parsed = parsed
+        if changed or (self.index_path is not None and not self.index_path.exists()):
+            self._save_index()
+        return parsed
+
+
+def _gpd_key(gpdname):
+    return gpdname[:-4] if gpdname.endswith(".gpd") else gpdname
+
+
+_default_catalog = None
+
+
+def get_catalog():
+    """Returns catalog of MAPXMAPS_PATH, building it on first use"""
+    global _default_catalog
+    if _default_catalog is None:
+        _default_catalog = MapxCatalog()
+    return _default_catalog
+
+
+def get_grid_definition(gpdname):
+    """Returns parameters for a gpd in MAPXMAPS_PATH
+
+    Uses the default catalog if it has been built, otherwise parses the
+    single gpd file rather than scanning the whole directory
+    """
+    if _default_catalog is None:
+        return parse_mapx.get_grid_definition(gpdname)
+    return _default_catalog.get_grid_definition(gpdname)
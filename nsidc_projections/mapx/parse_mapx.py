@@ -1,12 +1,12 @@
 """Readers and parsers for mapx gpd and mpp files"""
+import os
 import re
+from functools import lru_cache
+from pathlib import Path
 
 import numpy as np
 
-import pyproj
-import cartopy.crs as ccrs
-
-from nsidc_projections.filepath import MAPXMAPS_PATH
+from nsidc_projections import filepath, profiling
 from nsidc_projections.mapx.constants import (MAP_EQUATORIAL_RADIUS,
                                               Expected_Missing_Radius,
                                               km2m)
@@ -53,8 +53,10 @@ class GPDefinition():
 
 
     def from_gpd(self, gpd_name):
-        """Initializes from a gpd file"""
-        params = get_grid_definition(gpd_name)
+        """Initializes from a gpd file, looked up in the MapX catalog if it
+        has been built"""
+        from nsidc_projections.mapx import catalog
+        params = catalog.get_grid_definition(gpd_name)
         self.map_projection = params.get('Map Projection', None)
         self.map_reference_latitude = params.get('Map Reference Latitude', np.nan)
         self.map_reference_longitude = params.get('Map Reference Longitude', np.nan)
@@ -72,20 +74,30 @@ class GPDefinition():
         self.cell_height = params.get('Cell Height', 0)
         
 
-def make_gpd_path(gpdname):
+def make_gpd_path(gpdname, mapx_path=None):
     """Returns a Path object for gpd"""
+    mapx_path = filepath.MAPXMAPS_PATH if mapx_path is None else Path(mapx_path)
     if ".gpd" not in gpdname:
-        return MAPXMAPS_PATH / (gpdname + ".gpd")
+        return mapx_path / (gpdname + ".gpd")
     else:
-        return MAPXMAPS_PATH / gpdname
+        return mapx_path / gpdname
 
 
-def make_mpp_path(mpp_name):
+def make_mpp_path(mpp_name, mapx_path=None):
     """Returns a Path object to mpp"""
+    mapx_path = filepath.MAPXMAPS_PATH if mapx_path is None else Path(mapx_path)
     if ".mpp" not in mpp_name:
-        return MAPXMAPS_PATH / (mpp_name + ".mpp")
+        return mapx_path / (mpp_name + ".mpp")
     else:
-        return MAPXMAPS_PATH / mpp_name
+        return mapx_path / mpp_name
+
+
+def read_bytes(path):
+    """Returns contents of a gpd or mpp file, counted as mapx.read when profiling"""
+    with profiling.span("mapx.read") as span:
+        buffer = Path(path).read_bytes()
+        span.add(nbytes=len(buffer))
+    return buffer
 
 
 def parse_grid_mpp_file(s):
@@ -150,53 +162,198 @@ mpp_parser = {
     }
 
 
+# Precompiled patterns for the single-pass tokenizer.  Original-style gpd
+# lines are "value<tabs>key", with any later tab-separated fields ignored,
+# mpp lines are "value<tabs>value...<tabs>key" and new-style lines are
+# "Key: value ; comment"
+_FIRST_LINE = re.compile(rb"[^\r\n]*")
+_ORIGINAL_STYLE_LINE = re.compile(
+    rb"^[ \t]*([^\t\r\n]*?)[ \t]*\t[ \t]*([^\t\r\n]*?)[ \t]*(?:\t[^\r\n]*)?\r?$",
+    re.MULTILINE)
+_MPP_LINE = re.compile(
+    rb"^[ \t]*([^\r\n]*?)[ \t]*\t[ \t]*([^\t\r\n]*?)[ \t]*\r?$", re.MULTILINE)
+_NEW_STYLE_LINE = re.compile(
+    rb"^[ \t]*([^:;\r\n]+?)[ \t]*:[ \t]*([^;\r\n]*?)[ \t]*(?:;[^\r\n]*)?\r?$", re.MULTILINE)
+_ORIGINAL_STYLE_MARKER = b"map projection parameters"
+
+
+def is_original_style(buffer):
+    """Returns True if gpd buffer is an original-style gpd"""
+    return _ORIGINAL_STYLE_MARKER in _FIRST_LINE.match(buffer).group()
+
+
+def tokenize(buffer, original_style=None):
+    """Yields (key, value) pairs from a gpd or mpp file in a single pass
+
+    :buffer: file contents as bytes, bytearray, memoryview or mmap
+    :original_style: True for original-style "value<tabs>key" lines, False
+                     for new-style "Key: value" lines, None to detect from
+                     the first line
+
+    Original-style keys are the second tab-separated field, and text after
+    " -- " in a key is dropped.  Values with several fields are joined with
+    single spaces.
+    """
+    if original_style is None:
+        original_style = is_original_style(buffer)
+    if original_style:
+        yield from _original_style_pairs(_ORIGINAL_STYLE_LINE, buffer)
+    else:
+        for match in _NEW_STYLE_LINE.finditer(buffer):
+            key, value = match.groups()
+            yield key.decode(), value.decode()
+
+
+def tokenize_mpp(buffer):
+    """Yields (key, value) pairs from a mpp file in a single pass
+
+    Keys are the last tab-separated field, values are all fields before it
+    joined with single spaces.  Text after " -- " in a key is dropped.
+    """
+    yield from _original_style_pairs(_MPP_LINE, buffer)
+
+
+def _original_style_pairs(pattern, buffer):
+    for match in pattern.finditer(buffer):
+        value, key = match.groups()
+        yield key.split(b" -- ")[0].decode(), " ".join(value.decode().split())
+
+
 def get_mpp_fields(lines):
     """Returns a dictionary of mpp parameters from each line"""
-    these_fields = ['lat0 lon0', 'lat0 lon0 lat1', 'rotation', 'scale (km/map unit)',
-                    'Earth equatorial radius (km) -- wgs84', 'eccentricity -- wgs84',
-                    'Earth equatorial radius (km)', 'eccentricity']
-
-    def as_pair(line):
-        """Create key value tuple"""
-        arr = re.split("\t+", line.strip())
-        key = arr[-1].split(' -- ')[0]
-        value = " ".join([s.strip() for s in arr[:-1] if s.strip() != ""])
-        return (key, value)
-    
+    return _mpp_fields("".join(lines).encode())
+
+
+def _mpp_fields(buffer):
     fields = {}
-    for line in lines:
-        key, value = as_pair(line)
-        if key in these_fields:
+    for key, value in tokenize_mpp(buffer):
+        if key in mpp_parser:
             fields.update(mpp_parser[key](value))
     return fields
 
 
-def parse_mpp(mpp_name):
-    """Parses a mpp definition file
+def parse_mpp_buffer(buffer):
+    """Parses contents of a mpp file
 
-    :mpp_name: name of mpp file - normally defined in orig gpd_name
+    :buffer: file contents as bytes or a memory-mapped buffer
 
     :returns: a dictionary of projection parameters
     """
-    path_to_mpp = make_mpp_path(mpp_name)
-    with open(path_to_mpp, "r") as f:
-        lines = f.readlines()
     fields = {}
-    fields["Map Projection"] = lines[0].strip().title()
-    fields.update(get_mpp_fields(lines))
+    fields["Map Projection"] = _FIRST_LINE.match(buffer).group().decode().strip().title()
+    fields.update(_mpp_fields(buffer))
     return fields
 
 
-def parse_original_gpd(lines):
+@lru_cache(maxsize=256)
+def _parse_mpp_file(path, mtime_ns, size):
+    """Parses a mpp file once for each modification time and size"""
+    return parse_mpp_buffer(read_bytes(path))
+
+
+def parse_mpp(mpp_name, mapx_path=None):
+    """Parses a mpp definition file
+
+    :mpp_name: name of mpp file - normally defined in orig gpd_name
+    :mapx_path: directory containing mpp file, defaults to MAPXMAPS_PATH
+
+    :returns: a dictionary of projection parameters
+    """
+    path_to_mpp = make_mpp_path(mpp_name, mapx_path)
+    stat = os.stat(path_to_mpp)
+    return dict(_parse_mpp_file(str(path_to_mpp), stat.st_mtime_ns, stat.st_size))
+
+
+def parse_original_gpd(lines, mapx_path=None):
     """Parses an original-style gpd file"""
+    return _parse_original_gpd("".join(lines).encode(), mapx_path)
+
+
+def _parse_original_gpd(buffer, mapx_path=None):
     fields = {}
-    for line in lines:
-        value, key = re.split("\t+", line.strip())[:2]
+    for key, value in tokenize(buffer, original_style=True):
         fields.update(gpd_parser[key](value))
-    fields.update(parse_mpp(fields["Grid MPP File"]))
+    fields.update(parse_mpp(fields["Grid MPP File"], mapx_path))
     return fields
 
 
+def parse_equatorial_radius(s):
+    """New-style radii may be given in km or m"""
+    # New-style files have no units keyword.  Earth radii are about 6378 in
+    # km and 6.378e6 in m, so any value below 1e5 is taken to be km
+    radius = float(s)
+    return {"Map Equatorial Radius": radius * km2m if radius < 1e5 else radius}
+
+
+def as_float(key):
+    return lambda s: {key: float(s)}
+
+
+def as_int(key):
+    return lambda s: {key: int(s)}
+
+
+new_gpd_parser = {
+    "Map Projection": lambda s: {"Map Projection": s.title()},
+    "Map Reference Latitude": as_float("Map Reference Latitude"),
+    "Map Reference Longitude": as_float("Map Reference Longitude"),
+    "Map Second Reference Latitude": as_float("Map Latitude True Scale"),
+    "Map Rotation": as_float("Map Rotation"),
+    "Map Scale": as_float("Map Scale"),
+    "Map Equatorial Radius": parse_equatorial_radius,
+    "Map Eccentricity": as_float("Map Eccentricity"),
+    "Map Origin Latitude": as_float("Map Origin Latitude"),
+    "Map Origin Longitude": as_float("Map Origin Longitude"),
+    "Map Origin X": as_float("Map Projection Origin X"),
+    "Map Origin Y": as_float("Map Projection Origin Y"),
+    "Grid Map Origin Column": as_float("Grid Map Origin Column"),
+    "Grid Map Origin Row": as_float("Grid Map Origin Row"),
+    "Grid Map Units per Cell": as_float("Map Units per Cell"),
+    "Grid Cells per Map Unit": as_float("Grid Cells per Map Unit"),
+    "Grid Width": as_int("Grid Width"),
+    "Grid Height": as_int("Grid Height"),
+    }
+
+
+def parse_new_gpd(buffer):
+    """Parses a new-style "Key: value" gpd file
+
+    Map Origin X and Y in new-style files locate the projection origin.
+    They are returned as Map Projection Origin X and Y, and Map Origin X
+    and Y are the upper-left corner, as for original-style files.
+    """
+    fields = {}
+    for key, value in tokenize(buffer, original_style=False):
+        if key in new_gpd_parser:
+            fields.update(new_gpd_parser[key](value))
+    if "Map Units per Cell" not in fields and "Map Scale" in fields:
+        fields["Scale km per map unit"] = fields["Map Scale"]
+    if "Map Units per Cell" not in fields:
+        fields["Map Units per Cell"] = calc_grid_map_units_per_cell(fields)
+    fields["Map Origin X"] = (fields.get("Map Projection Origin X", 0.) +
+                              calc_map_origin_x(fields))
+    fields["Map Origin Y"] = (fields.get("Map Projection Origin Y", 0.) +
+                              calc_map_origin_y(fields))
+    return fields
+
+
+def parse_gpd_buffer(buffer, mapx_path=None):
+    """Parses contents of an original-style or new-style gpd file
+
+    :buffer: file contents as bytes or a memory-mapped buffer
+    :mapx_path: directory containing mpp files referenced by original-style
+                gpd files, defaults to MAPXMAPS_PATH
+
+    :returns: dict containing parameters
+    """
+    with profiling.span("mapx.parse", nbytes=len(buffer)):
+        if is_original_style(buffer):
+            params = _parse_original_gpd(buffer, mapx_path)
+        else:
+            params = parse_new_gpd(buffer)
+        return calc_missing_parameters(params)
+
+
 def get_equatorial_radius(params):
     """Returns missing equatorial radius for projection
 
@@ -250,20 +407,13 @@ def calc_grid_map_units_per_cell(params):
     return map_units_per_cell
 
 
-def get_grid_definition(gpdname):
+def get_grid_definition(gpdname, mapx_path=None):
     """Parses a gpd definition file
 
-    :path_to_gpd: str or Path object to gpd file
+    :gpdname: name of gpd file
+    :mapx_path: directory containing gpd and mpp files, defaults to MAPXMAPS_PATH
 
     :returns: dict containing parameters
     """
-    path_to_gpd = make_gpd_path(gpdname)
-    with open(path_to_gpd, "r") as f:
-        lines = f.readlines()
-    if 'map projection parameters' in lines[0]:
-        params = parse_original_gpd(lines)
-        params = calc_missing_parameters(params)
-    else:
-        raise NotImplementedError("Parser for new format gpd coming soon!")
-    return params
-
+    path_to_gpd = make_gpd_path(gpdname, mapx_path)
+    return parse_gpd_buffer(read_bytes(path_to_gpd), mapx_path)
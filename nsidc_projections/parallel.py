@@ -0,0 +1,151 @@
+"""Parallel geolocation of grids in bands of rows
+
+The thread backend relies on PROJ and numpy releasing the GIL; each
+thread uses its own pooled Transformer.  The process backend writes into
+multiprocessing.shared_memory blocks so results are not pickled back to
+the parent.  Without an out array, results are returned in a block the
+size of the grid, which is not copied.  With an out array, each band is
+written to its own block and copied into out, so only bands in flight are
+held twice.  Both backends produce the same values as the serial path.
+
+concurrent.futures and multiprocessing are imported on first use.
+"""
+import os
+import weakref
+
+import numpy as np
+
+BACKENDS = ('thread', 'process')
+
+
+def row_bands(grid, workers, band_rows=None):
+    """Returns row slices that split grid into bands for workers
+
+    :band_rows: if given, bands are multiples of band_rows so that banded
+                calculations line up with the serial path
+    """
+    target = -(-grid.rows // (4 * workers))  # about four bands per worker
+    if band_rows is not None:
+        target = max(band_rows, target // band_rows * band_rows)
+    return [slice(start, min(start + target, grid.rows))
+            for start in range(0, grid.rows, target)]
+
+
+def _window_into(grid, band, lat, lon, engine):
+    grid._latlon_window(band, slice(0, grid.cols), out=(lat[band], lon[band]),
+                        engine=engine)
+
+
+def _shared_band_worker(grid, shm_name, shape, dtype, band, offset, engine):
+    """Computes one band into a shared memory block
+
+    :shape: shape of the (2, rows, cols) array in the block
+    :offset: first grid row in the block
+    """
+    from multiprocessing import shared_memory
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        latlon = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+        rows = slice(band.start - offset, band.stop - offset)
+        grid._latlon_window(band, slice(0, grid.cols), out=(latlon[0, rows], latlon[1, rows]),
+                            engine=engine)
+        del latlon
+    finally:
+        shm.close()
+
+
+def _shared_array(shape, dtype):
+    """Returns a new shared memory block and an array backed by it
+
+    The block is unlinked when the array and every view of it are freed"""
+    from multiprocessing import shared_memory
+    size = max(int(np.prod(shape)) * dtype.itemsize, 1)
+    shm = shared_memory.SharedMemory(create=True, size=size)
+    array = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+    weakref.finalize(array, _release, shm)
+    return shm, array
+
+
+def _release(shm):
+    shm.close()
+    shm.unlink()
+
+
+def latlon(grid, out=None, engine='proj', workers=None, backend='thread', band_rows=None,
+           dtype=np.float64):
+    """Computes latitude and longitude for grid using workers
+
+    :grid: Grid instance
+    :out: optional tuple of (lat, lon) arrays with shape (rows, cols)
+    :engine: 'proj' or 'numpy', see Grid.get_latlon
+    :workers: number of threads or processes, defaults to os.cpu_count()
+    :backend: 'thread' or 'process'
+    :band_rows: band size the serial path uses for engine
+    :dtype: dtype of the returned array if out is None
+
+    :returns: out, or a new (2, rows, cols) array
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"backend must be one of {BACKENDS}, got {backend}")
+    workers = workers or os.cpu_count()
+    dtype = np.dtype(dtype)
+    bands = row_bands(grid, workers, band_rows)
+    if backend == 'thread':
+        from concurrent.futures import ThreadPoolExecutor
+        result = np.empty((2, grid.rows, grid.cols), dtype=dtype) if out is None else out
+        lat, lon = result
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(_window_into, grid, band, lat, lon, engine)
+                       for band in bands]
+            for future in futures:
+                future.result()
+        return result
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        if out is None:
+            return _process_into_shared(executor, grid, bands, dtype, engine)
+        return _process_into_out(executor, grid, bands, out, engine, workers)
+
+
+def _process_into_shared(executor, grid, bands, dtype, engine):
+    """Returns (2, rows, cols) array backed by the block workers write into"""
+    shape = (2, grid.rows, grid.cols)
+    shm, result = _shared_array(shape, dtype)
+    futures = [executor.submit(_shared_band_worker, grid, shm.name, shape, dtype.str,
+                               band, 0, engine)
+               for band in bands]
+    for future in futures:
+        future.result()
+    return result
+
+
+def _process_into_out(executor, grid, bands, out, engine, workers):
+    """Copies bands into out as workers finish, with at most 2 * workers in flight"""
+    from concurrent.futures import FIRST_COMPLETED, wait
+    dtype = np.result_type(out[0].dtype, out[1].dtype)
+    pending = {}
+    bands = iter(bands)
+
+    def submit(band):
+        shape = (2, band.stop - band.start, grid.cols)
+        shm, block = _shared_array(shape, dtype)
+        future = executor.submit(_shared_band_worker, grid, shm.name, shape, dtype.str,
+                                 band, band.start, engine)
+        pending[future] = (band, block)
+
+    for band in bands:
+        submit(band)
+        if len(pending) >= 2 * workers:
+            break
+    while pending:
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            band, block = pending.pop(future)
+            future.result()
+            out[0][band] = block[0]
+            out[1][band] = block[1]
+            del block
+            band = next(bands, None)
+            if band is not None:
+                submit(band)
+    return out
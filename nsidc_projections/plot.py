@@ -1,20 +1,162 @@
-"""Code to plot extent"""
-import matplotlib.pyplot as plt
-import cartopy.crs as ccrs
-import cartopy.feature as cfeature
+"""Code to plot extent
+
+matplotlib and cartopy are imported when first needed so that importing
+this module stays cheap for code that does not plot.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
 from pyproj import CRS
 
+
 def make_cartopy_crs(epsg_code):
-    """Makes a cartopy crs using proj strings.  proj strings are returned from proj CRS
-    This is done because defining CRS from epsg does no create correct bounds"""
-    proj_params = CRS.from_epsg(epsg_code).to_dict()
-    
-    proj2ctopy = {'a': 'semimajor_axis', 'b': 'semiminor_axis'}  # Converts proj parameter names to cartopy Globe keywords
+    """Makes a cartopy crs for an EPSG code
+
+    Uses the same memoized conversion as Grid.to_cartopy, which sets map
+    bounds from the projection rather than the EPSG area of use"""
+    from nsidc_projections.grid import to_cartopy
+    return to_cartopy(CRS.from_epsg(epsg_code))
+
+
+RENDER_METHODS = ('pcolormesh', 'imshow')
+
+
+class FrameRenderer:
+    """Renders a series of (rows, cols) frames on a Grid to image files
+
+    The figure, map axes, coastlines and a pcolormesh on the grid cell
+    edges are made once.  Each frame only replaces the mesh values with
+    set_array before the figure is saved.
+
+    Map axes use the grid projection, so grid cells are rectangles and
+    method='imshow' draws the same cells as an image, which is about twice
+    as fast for large grids.
+
+    :grid: Grid of frames
+    :cmap: matplotlib colormap name or Colormap
+    :vmin, vmax: color limits shared by all frames.  If None, limits of the
+                 first frame rendered are used
+    :coastlines: if True, draws coastlines.  Requires Natural Earth data
+    :colorbar: if True, adds a colorbar
+    :figsize: figure size in inches
+    :dpi: resolution of saved images
+    :method: one of RENDER_METHODS
+    """
+    def __init__(self, grid, cmap='viridis', vmin=None, vmax=None, coastlines=True,
+                 colorbar=False, figsize=(6, 6), dpi=100, method='pcolormesh'):
+        if method not in RENDER_METHODS:
+            raise NotImplementedError(f"{method} is not available")
+        self.grid = grid
+        self.method = method
+        self.cmap = cmap
+        self.vmin = vmin
+        self.vmax = vmax
+        self.coastlines = coastlines
+        self.colorbar = colorbar
+        self.figsize = figsize
+        self.dpi = dpi
+        self.figure = None
+        self.mesh = None
+        self.title = None
+
+
+    def __getstate__(self):
+        """Figures are not sent to worker processes, workers make their own"""
+        state = self.__dict__.copy()
+        state["figure"] = None
+        state["mesh"] = None
+        state["title"] = None
+        return state
+
+
+    def _set_limits(self, frame):
+        if self.vmin is None:
+            self.vmin = float(np.nanmin(frame))
+        if self.vmax is None:
+            self.vmax = float(np.nanmax(frame))
+
+
+    def setup(self):
+        """Makes the figure, map axes and mesh"""
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        projection = self.grid.to_cartopy()
+        self.figure = Figure(figsize=self.figsize)
+        FigureCanvasAgg(self.figure)
+        ax = self.figure.add_subplot(projection=projection)
+        ax.set_extent(self.grid.x_limits() + self.grid.y_limits(), crs=projection)
+        empty = np.ma.masked_all((self.grid.rows, self.grid.cols))
+        if self.method == 'imshow':
+            self.mesh = ax.imshow(empty, extent=self.grid.x_limits() + self.grid.y_limits(),
+                                  origin='upper', interpolation='nearest', cmap=self.cmap,
+                                  vmin=self.vmin, vmax=self.vmax, transform=projection)
+        else:
+            x, y = self.grid.get_gridcell_edges()
+            self.mesh = ax.pcolormesh(x, y, empty, cmap=self.cmap, vmin=self.vmin,
+                                      vmax=self.vmax, transform=projection)
+        if self.coastlines:
+            ax.coastlines()
+        if self.colorbar:
+            self.figure.colorbar(self.mesh, ax=ax, shrink=0.8)
+        self.title = ax.set_title("")
+        return self
+
+
+    def render(self, frame, path, title=None):
+        """Draws frame and saves figure to path
+
+        :frame: array with shape (rows, cols), NaN cells are not drawn
+        :path: image file path, format is set by the file extension
+        :title: optional axes title
+        """
+        frame = np.asarray(frame)
+        if frame.shape != (self.grid.rows, self.grid.cols):
+            raise ValueError(f"Expected frame with shape ({self.grid.rows}, "
+                             f"{self.grid.cols}), got {frame.shape}")
+        if self.figure is None:
+            self._set_limits(frame)
+            self.setup()
+        self.mesh.set_array(np.ma.masked_invalid(frame))
+        self.title.set_text("" if title is None else title)
+        self.figure.savefig(path, dpi=self.dpi)
+        return path
+
+
+    def _render_chunk(self, frames, paths, titles):
+        for frame, path, title in zip(frames, paths, titles):
+            self.render(frame, path, title)
+        return list(paths)
+
+
+    def render_all(self, frames, paths, titles=None, workers=1):
+        """Renders each frame to the matching path
+
+        :frames: array with shape (frames, rows, cols) or a sequence of frames
+        :paths: image file path for each frame
+        :titles: optional title for each frame
+        :workers: number of processes.  Frames are split into one
+                  contiguous chunk per worker and each worker sets up its
+                  own figure once
 
-    # Make the globe instance
-    globe = ccrs.Globe(**{**{'ellipse': None}, **{proj2ctopy[k]: v for k, v in proj_params.items() if k in ['a', 'b']}})  # Must set ellipse explicitly to None otherwise is wgs84
-    crs = ccrs.Projection({k: v for k, v in proj_params.items() if k not in ['a', 'b']}, globe=globe)
-    return crs
+        :returns: list of paths
+        """
+        paths = list(paths)
+        titles = [None] * len(paths) if titles is None else list(titles)
+        if not len(frames) == len(paths) == len(titles):
+            raise ValueError("frames, paths and titles must have the same length")
+        if not paths:
+            return []
+        self._set_limits(frames[0])
+        workers = min(workers or os.cpu_count(), len(paths))
+        if workers == 1:
+            return self._render_chunk(frames, paths, titles)
+        bounds = np.linspace(0, len(paths), workers + 1).astype(int)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(self._render_chunk, frames[start:end],
+                                       paths[start:end], titles[start:end])
+                       for start, end in zip(bounds[:-1], bounds[1:])]
+            return [path for future in futures for path in future.result()]
 
 
 #def plot_projected_extent(crs):
@@ -0,0 +1,169 @@
+"""Opt-in counters for transforms, allocations, CRS creation and file reads
+
+Profiling is off by default.  It is turned on for the whole process by
+setting the NSIDC_PROJECTIONS_PROFILE environment variable to 1, or to
+log to also emit one JSON log line per event, or for a block of code with
+
+    from nsidc_projections import profiling
+    with profiling.profile():
+        grid.get_latlon()
+    profiling.stats()
+
+Each event name, e.g. grid.latlon, crs.create or mapx.read, accumulates
+call count, wall time in seconds, points transformed and bytes allocated
+or read.  Times of nested events overlap, so grid.latlon includes the
+transform.create time of a first call.  Events in worker processes are
+not counted.
+
+Log lines go to the nsidc_projections.profile logger at INFO level.
+"""
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+PROFILE_ENV = "NSIDC_PROJECTIONS_PROFILE"
+
+logger = logging.getLogger("nsidc_projections.profile")
+
+_lock = threading.Lock()
+_stats = {}
+_enabled = False
+_log = False
+
+
+def _from_environment():
+    value = os.environ.get(PROFILE_ENV, "").strip().lower()
+    return value not in ("", "0", "false", "off"), value == "log"
+
+
+_enabled, _log = _from_environment()
+
+
+def enabled():
+    """Returns True if events are being recorded"""
+    return _enabled
+
+
+def enable(log=False):
+    """Starts recording events
+
+    :log: if True, also emits a JSON log line for each event
+    """
+    global _enabled, _log
+    _enabled, _log = True, log
+
+
+def disable():
+    """Stops recording events, counts recorded so far are kept"""
+    global _enabled, _log
+    _enabled, _log = False, False
+
+
+@contextmanager
+def profile(log=False, reset=True):
+    """Records events inside a with block
+
+    :log: if True, also emits a JSON log line for each event
+    :reset: if True, counts are cleared on entry
+
+    The previous enabled and log state is restored on exit.
+    """
+    global _enabled, _log
+    previous = _enabled, _log
+    if reset:
+        clear()
+    enable(log=log)
+    try:
+        yield
+    finally:
+        _enabled, _log = previous
+
+
+def record(name, seconds=0., points=0, nbytes=0):
+    """Adds one call of an event to the counts"""
+    if not _enabled:
+        return
+    with _lock:
+        counts = _stats.get(name)
+        if counts is None:
+            counts = _stats[name] = {"calls": 0, "seconds": 0., "points": 0, "bytes": 0}
+        counts["calls"] += 1
+        counts["seconds"] += seconds
+        counts["points"] += points
+        counts["bytes"] += nbytes
+    if _log:
+        logger.info(json.dumps({"event": name, "seconds": seconds, "points": points,
+                                "bytes": nbytes}))
+
+
+class Span:
+    """Times a with block and records it as one call of an event
+
+    :name: event name
+    :points: points transformed
+    :nbytes: bytes allocated or read
+    """
+    __slots__ = ("name", "points", "nbytes", "_start")
+
+    def __init__(self, name, points=0, nbytes=0):
+        self.name = name
+        self.points = points
+        self.nbytes = nbytes
+
+
+    def add(self, points=0, nbytes=0):
+        """Adds points and bytes found inside the with block"""
+        self.points += points
+        self.nbytes += nbytes
+
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+
+    def __exit__(self, *exc_info):
+        record(self.name, time.perf_counter() - self._start, self.points, self.nbytes)
+
+
+class _NullSpan:
+    """Span used while profiling is off"""
+    __slots__ = ()
+
+    def add(self, points=0, nbytes=0):
+        pass
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, *exc_info):
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def span(name, points=0, nbytes=0):
+    """Returns a context manager recording the with block as event name
+
+    Returns a shared no-op span while profiling is off"""
+    if not _enabled:
+        return _NULL_SPAN
+    return Span(name, points, nbytes)
+
+
+def stats():
+    """Returns a snapshot of {event name: {calls, seconds, points, bytes}}"""
+    with _lock:
+        return {name: dict(counts) for name, counts in _stats.items()}
+
+
+def clear():
+    """Resets all counts"""
+    with _lock:
+        _stats.clear()
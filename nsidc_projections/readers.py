@@ -0,0 +1,168 @@
+"""Memory-mapped readers for flat binary grid products
+
+Many NSIDC products are raw arrays of the grid rows and columns, after an
+optional header.  Files are opened with np.memmap, so indexing a pixel or
+window only reads the pages holding it, and arrays are returned as views
+in top-down, row-major orientation without copying.
+
+    sic = open_binary(path, SSMI_PolarStereoNorth25km, "nsidc0051")
+    beaufort, grid = open_window(path, SSMI_PolarStereoNorth25km, "nsidc0051",
+                                 (-160, 68, -120, 80))
+"""
+import os
+from collections import namedtuple
+
+import numpy as np
+
+from nsidc_projections.grid import Grid, get_grid
+
+# Layout of a flat binary file.  dtype includes the byte order, e.g. '<u2',
+# header_bytes are skipped before the first cell and flipud is True if rows
+# are stored bottom-up
+BinaryFormat = namedtuple(
+    "BinaryFormat",
+    [
+        "dtype",
+        "header_bytes",
+        "flipud",
+        ],
+    defaults=(0, False),
+)
+
+BINARY_FORMATS = {
+    # Sea ice concentration, 1-byte fraction * 250, 300-byte header
+    "nsidc0051": BinaryFormat("u1", 300),
+    # Brightness temperature in tenths of K, 2-byte little endian
+    "nsidc0001": BinaryFormat("<u2"),
+    }
+
+
+def get_format(binary_format):
+    """Returns BinaryFormat for a BinaryFormat or a name in BINARY_FORMATS"""
+    if isinstance(binary_format, BinaryFormat):
+        return binary_format
+    try:
+        return BINARY_FORMATS[binary_format]
+    except KeyError:
+        raise ValueError(f"binary_format must be a BinaryFormat or one of "
+                         f"{list(BINARY_FORMATS)}, got {binary_format}")
+
+
+def open_binary(path, grid, binary_format, bands=1, mode="r"):
+    """Returns a flat binary file as a memory-mapped array
+
+    :path: path of the file
+    :grid: Grid of the file, or name of a grid in grid.available_grids
+    :binary_format: BinaryFormat or name in BINARY_FORMATS
+    :bands: number of (rows, cols) arrays in the file
+    :mode: np.memmap mode, 'r' for read-only or 'c' for copy-on-write
+
+    :returns: (rows, cols) array, or (bands, rows, cols) if bands > 1,
+              in top-down orientation.  Raises ValueError if the file
+              size does not match the grid and format
+    """
+    if not isinstance(grid, Grid):
+        grid = get_grid(grid)
+    binary_format = get_format(binary_format)
+    dtype = np.dtype(binary_format.dtype)
+    shape = (bands, grid.rows, grid.cols)
+    expected = binary_format.header_bytes + dtype.itemsize * bands * grid.rows * grid.cols
+    size = os.path.getsize(path)
+    if size != expected:
+        raise ValueError(f"{path} has {size} bytes, expected {expected} for {bands} "
+                         f"x {grid.rows} x {grid.cols} {dtype} and a "
+                         f"{binary_format.header_bytes}-byte header")
+    array = np.memmap(path, dtype=dtype, mode=mode, offset=binary_format.header_bytes,
+                      shape=shape)
+    if binary_format.flipud:
+        array = array[:, ::-1]
+    return array[0] if bands == 1 else array
+
+
+def open_window(path, grid, binary_format, bbox, latlon=True, bands=1):
+    """Returns the window of a flat binary file covering a bounding box
+
+    :bbox: box passed to Grid.window
+    :latlon: if False, bbox is in projected coordinates
+
+    See open_binary for the other parameters.
+
+    :returns: memory-mapped view of the window and Grid of the window
+    """
+    if not isinstance(grid, Grid):
+        grid = get_grid(grid)
+    row_slice, col_slice, window = grid.window(bbox, latlon=latlon)
+    array = open_binary(path, grid, binary_format, bands=bands)
+    return array[..., row_slice, col_slice], window
+
+
+def _read_span(path, offset, dtype, count):
+    """Returns count items of dtype read from path at byte offset"""
+    buffer = np.empty(count, dtype=dtype)
+    with open(path, "rb", buffering=0) as f:
+        f.seek(offset)
+        if f.readinto(buffer) != buffer.nbytes:
+            raise ValueError(f"{path} is too short for the grid and format")
+    return buffer
+
+
+def read_series(paths, grid, binary_format, row_slice=slice(None), col_slice=slice(None),
+                out=None):
+    """Reads the same window from many flat binary files
+
+    Only the bytes from the first to the last cell of the window are read
+    from each file, with one read call, so a pixel or small window can be
+    read from thousands of files without opening a memory map for each.
+
+    :paths: sequence of file paths
+    :row_slice, col_slice: window of the grid, or integers for one pixel
+    :out: optional array to write into, with len(paths) as first dimension
+
+    See open_binary for the other parameters.
+
+    :returns: array with shape (len(paths), ...) of the window
+    """
+    if not isinstance(grid, Grid):
+        grid = get_grid(grid)
+    binary_format = get_format(binary_format)
+    dtype = np.dtype(binary_format.dtype)
+    shape = np.broadcast_to(np.empty((), dtype=bool), (grid.rows, grid.cols))[row_slice,
+                                                                               col_slice].shape
+    if out is None:
+        out = np.empty((len(paths),) + shape, dtype=dtype)
+    rows = np.atleast_1d(np.arange(grid.rows)[row_slice])
+    cols = np.atleast_1d(np.arange(grid.cols)[col_slice])
+    if rows.size == 0 or cols.size == 0:
+        return out
+    if binary_format.flipud:
+        rows = grid.rows - 1 - rows
+    first_row, first_col = rows.min(), cols.min()
+    span_rows, span_cols = rows.max() + 1 - first_row, cols.max() + 1 - first_col
+    offset = binary_format.header_bytes + dtype.itemsize * (first_row * grid.cols + first_col)
+    count = (span_rows - 1) * grid.cols + span_cols
+    index = np.ix_(rows - first_row, cols - first_col)
+    for i, path in enumerate(paths):
+        span = _read_span(path, offset, dtype, count)
+        block = np.lib.stride_tricks.as_strided(
+            span, shape=(span_rows, span_cols), strides=(grid.cols * dtype.itemsize,
+                                                         dtype.itemsize))
+        out[i] = block[index].reshape(shape)
+    return out
+
+
+def to_dataarray(path, grid, binary_format, name=None, chunks=None, latlon=True):
+    """Returns a flat binary file as an xarray DataArray georeferenced on grid
+
+    Values stay memory-mapped; coordinates are added by accessor.assign_grid
+
+    :name: name of the DataArray
+    :chunks: (rows, cols) chunks of lazy lat and lon
+
+    See open_binary for the other parameters.
+    """
+    import xarray as xr
+    from nsidc_projections.accessor import assign_grid
+    if not isinstance(grid, Grid):
+        grid = get_grid(grid)
+    array = xr.DataArray(open_binary(path, grid, binary_format), dims=("y", "x"), name=name)
+    return assign_grid(array, grid, chunks=chunks, latlon=latlon)
@@ -0,0 +1,395 @@
+"""Regridding between Grids with precomputed sparse weights
+
+Weights are computed once for a (source, target, method) triple and stored
+as a scipy.sparse matrix with one row per target cell and one column per
+source cell.  Applying them to a (..., rows, cols) stack is a single sparse
+matrix multiply.
+
+Conservative weights are the area of overlap of each source and target
+cell as a fraction of the target cell area, from cell polygons with
+densified edges in a shared equal-area projection.  shapely is imported
+when they are first computed.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+from pyproj import CRS
+from scipy import sparse
+
+from nsidc_projections import kernels
+from nsidc_projections.grid import EQUAL_AREA_FAMILIES
+from nsidc_projections.transform import get_transformer
+
+METHODS = ('nearest', 'bilinear', 'conservative')
+
+# Points along each side of a cell polygon in conservative weights
+CELL_EDGE_POINTS = 8
+
+
+def nearest_weights(source, target, engine='proj'):
+    """Returns sparse nearest-neighbour weights from source to target"""
+    lat, lon = target.get_latlon(engine=engine)
+    row, col, outside = source.latlon_to_rowcol(lat.ravel(), lon.ravel(), engine=engine)
+    target_index = np.flatnonzero(~outside)
+    source_index = row[target_index] * source.cols + col[target_index]
+    return sparse.csr_matrix(
+        (np.ones(target_index.size), (target_index, source_index)),
+        shape=(target.rows * target.cols, source.rows * source.cols))
+
+
+def bilinear_weights(source, target, engine='proj'):
+    """Returns sparse bilinear weights from source to target
+
+    Weights are interpolated between the four source cell centers around
+    each target cell center.  Neighbours that fall off the source grid are
+    dropped and the remaining weights renormalized."""
+    lat, lon = target.get_latlon(engine=engine)
+    row, col, outside = source.latlon_to_rowcol(lat.ravel(), lon.ravel(),
+                                                fractional=True, engine=engine)
+    target_index = np.flatnonzero(~outside)
+    # Shift to coordinates where cell centers are at integer values
+    row = row[target_index] - 0.5
+    col = col[target_index] - 0.5
+    row0 = np.floor(row)
+    col0 = np.floor(col)
+    drow = row - row0
+    dcol = col - col0
+    row0 = row0.astype(np.int64)
+    col0 = col0.astype(np.int64)
+
+    rows, cols, targets, weights = [], [], [], []
+    for i, wrow in ((0, 1. - drow), (1, drow)):
+        for j, wcol in ((0, 1. - dcol), (1, dcol)):
+            r = row0 + i
+            c = col0 + j
+            valid = (r >= 0) & (r < source.rows) & (c >= 0) & (c < source.cols)
+            rows.append(r[valid])
+            cols.append(c[valid])
+            targets.append(target_index[valid])
+            weights.append((wrow * wcol)[valid])
+    source_index = np.concatenate(rows) * source.cols + np.concatenate(cols)
+    weights = sparse.csr_matrix(
+        (np.concatenate(weights), (np.concatenate(targets), source_index)),
+        shape=(target.rows * target.cols, source.rows * source.cols))
+    return normalize_rows(weights)
+
+
+def normalize_rows(weights):
+    """Returns weights scaled so each non-empty row sums to one"""
+    totals = np.asarray(weights.sum(axis=1)).ravel()
+    scale = np.divide(1., totals, out=np.zeros_like(totals), where=totals > 0)
+    return sparse.diags(scale) @ weights
+
+
+def shared_crs(source, target):
+    """Returns an equal-area CRS for cell polygons of source and target
+
+    The target CRS is used if it is equal-area, then the source CRS,
+    otherwise a WGS84 Lambert azimuthal equal-area CRS with the center of
+    the target projection"""
+    for grid in (target, source):
+        try:
+            if grid.projection.family in EQUAL_AREA_FAMILIES:
+                return grid.crs
+        except NotImplementedError:
+            pass
+    lat_0, lon_0 = target.projection.lat_0, target.projection.lon_0
+    return CRS.from_proj4(f"+proj=laea +lat_0={lat_0} +lon_0={lon_0} +datum=WGS84 +units=m")
+
+
+def cell_boundaries(grid, row_slice, col_slice, edge_points=CELL_EDGE_POINTS):
+    """Returns fractional (row, col) indices around each cell of a window
+
+    :returns: row and col arrays with shape (window cells, 4 * edge_points),
+              going clockwise from the upper-left corner of each cell
+    """
+    t = np.arange(edge_points) / edge_points
+    ring_row = np.concatenate([np.zeros_like(t), t, np.ones_like(t), 1. - t])
+    ring_col = np.concatenate([t, np.ones_like(t), 1. - t, np.zeros_like(t)])
+    rows = np.arange(row_slice.start, row_slice.stop)
+    cols = np.arange(col_slice.start, col_slice.stop)
+    row = np.broadcast_to(rows[:, np.newaxis, np.newaxis] + ring_row,
+                          (rows.size, cols.size, ring_row.size))
+    col = np.broadcast_to(cols[:, np.newaxis] + ring_col, row.shape)
+    return row.reshape(-1, ring_row.size), col.reshape(-1, ring_col.size)
+
+
+def _project_indices(grid, row, col, crs, engine='proj'):
+    """Returns x and y in crs of fractional row and col indices of grid"""
+    gt = grid.geotransform()
+    x = gt.a * col + gt.c
+    y = gt.e * row + gt.f
+    if crs == grid.crs:
+        return x, y
+    if engine == 'numpy':
+        lat, lon = kernels.inverse(grid.projection, x, y)
+        x, y = get_transformer(grid.geodetic_crs, crs, always_xy=True).transform(lon, lat)
+    else:
+        x, y = get_transformer(grid.crs, crs, always_xy=True).transform(x, y)
+    return np.asarray(x), np.asarray(y)
+
+
+def _map_width(crs):
+    """Returns width of a cylindrical crs, or None for other projections"""
+    if crs.to_dict().get('proj') != 'cea':
+        return None
+    return 2. * abs(get_transformer(4326, crs, always_xy=True).transform(180., 0.)[0])
+
+
+def cell_polygons(grid, row_slice, col_slice, crs, edge_points=CELL_EDGE_POINTS,
+                  engine='proj'):
+    """Returns shapely polygons of the cells in a window, projected to crs
+
+    Cells with corners that cannot be projected are None.  In a cylindrical
+    crs, cells crossing the antimeridian are multipolygons with a part at
+    each edge of the map.
+    """
+    import shapely
+    edge_points = 1 if crs == grid.crs else edge_points
+    row, col = cell_boundaries(grid, row_slice, col_slice, edge_points)
+    x, y = _project_indices(grid, row, col, crs, engine)
+    polygons = shapely.polygons(np.stack([x, y], axis=-1))
+    finite = np.isfinite(x).all(axis=1) & np.isfinite(y).all(axis=1)
+    polygons[~finite] = None
+    width = _map_width(crs)
+    if width is not None and crs != grid.crs:
+        wraps = finite & (x.max(axis=1) - x.min(axis=1) > width / 2.)
+        east = np.where(x[wraps] < 0., x[wraps] + width, x[wraps])
+        parts = np.stack([shapely.polygons(np.stack([east, y[wraps]], axis=-1)),
+                          shapely.polygons(np.stack([east - width, y[wraps]], axis=-1))],
+                         axis=1)
+        polygons[wraps] = shapely.multipolygons(parts)
+    return polygons
+
+
+def _cell_area(polygons):
+    """Returns area of cell polygons, counting one part of split cells"""
+    import shapely
+    return shapely.area(polygons) / shapely.get_num_geometries(polygons)
+
+
+def overlap_window(source, target, engine='proj'):
+    """Returns row and column slices of target cells that may overlap source
+
+    The window covers the source outline, with a point for each source
+    cell edge, and one more target cell on each side.  Returns None if
+    they do not overlap."""
+    row, col = cell_boundaries(source, slice(0, 1), slice(0, 1),
+                               edge_points=max(source.rows, source.cols))
+    x, y = _project_indices(source, row * source.rows, col * source.cols, target.crs, engine)
+    if not (np.isfinite(x).all() and np.isfinite(y).all()):
+        return slice(0, target.rows), slice(0, target.cols)
+    try:
+        row_slice, col_slice, _ = target.window((x.min(), y.min(), x.max(), y.max()),
+                                                latlon=False)
+    except ValueError:
+        return None
+    width = _map_width(target.crs)
+    if width is not None and x.max() - x.min() > width / 2.:
+        col_slice = slice(0, target.cols)
+    return (slice(max(row_slice.start - 1, 0), min(row_slice.stop + 1, target.rows)),
+            slice(max(col_slice.start - 1, 0), min(col_slice.stop + 1, target.cols)))
+
+
+_worker_state = {}
+
+
+def _init_overlap_worker(source, crs_wkt, edge_points, engine):
+    """Builds source cell polygons and their spatial index once per process"""
+    import shapely
+    crs = CRS.from_wkt(crs_wkt)
+    polygons = cell_polygons(source, slice(0, source.rows), slice(0, source.cols), crs,
+                             edge_points, engine)
+    _worker_state.update(crs=crs, polygons=polygons,
+                         tree=shapely.STRtree(polygons), edge_points=edge_points,
+                         engine=engine)
+
+
+def _window_overlaps(target, row_slice, col_slice):
+    """Returns target index, source index and fraction of target cell area
+    for overlapping cells in a window of the target"""
+    import shapely
+    state = _worker_state
+    polygons = cell_polygons(target, row_slice, col_slice, state["crs"],
+                             state["edge_points"], state["engine"])
+    part, source_index = state["tree"].query(polygons, predicate="intersects")
+    areas = shapely.area(shapely.intersection(polygons[part], state["polygons"][source_index]))
+    fractions = areas / _cell_area(polygons[part])
+    keep = fractions > 0.
+    window_cols = col_slice.stop - col_slice.start
+    target_index = ((row_slice.start + part[keep] // window_cols) * target.cols +
+                    col_slice.start + part[keep] % window_cols)
+    return target_index, source_index[keep], fractions[keep]
+
+
+def conservative_weights(source, target, engine='proj', workers=1, edge_points=CELL_EDGE_POINTS,
+                         crs=None, band_rows=None):
+    """Returns sparse area-weighted weights from source to target
+
+    Each weight is the area of overlap of a source cell and a target cell
+    divided by the area of the target cell, so the area integral of the
+    source over cells covered by the target is preserved.  Target cells
+    partly off the source get the area-weighted sum of the covered part;
+    use skipna in Regridder.regrid to renormalize instead.  Cells that
+    contain a pole are not exact in a cylindrical crs.
+
+    :engine: 'proj' or 'numpy', used to find latitude and longitude of
+             cell edges when they are reprojected
+    :workers: number of processes intersecting bands of target rows,
+              None uses all cores.  1 computes weights in this process
+    :edge_points: points along each side of a cell polygon
+    :crs: equal-area CRS for cell polygons, see shared_crs
+    :band_rows: target rows in each task, defaults to about four tasks per worker
+    """
+    crs = shared_crs(source, target) if crs is None else CRS.from_user_input(crs)
+    shape = (target.rows * target.cols, source.rows * source.cols)
+    window = overlap_window(source, target, engine)
+    if window is None:
+        return sparse.csr_matrix(shape)
+    row_slice, col_slice = window
+    workers = workers or os.cpu_count()
+    rows = row_slice.stop - row_slice.start
+    band_rows = band_rows or max(1, -(-rows // (4 * workers)))
+    bands = [slice(start, min(start + band_rows, row_slice.stop))
+             for start in range(row_slice.start, row_slice.stop, band_rows)]
+    initargs = (source, crs.to_wkt(), edge_points, engine)
+    if workers == 1:
+        _init_overlap_worker(*initargs)
+        try:
+            parts = [_window_overlaps(target, band, col_slice) for band in bands]
+        finally:
+            _worker_state.clear()
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_overlap_worker,
+                                 initargs=initargs) as executor:
+            parts = list(executor.map(_window_overlaps, [target] * len(bands), bands,
+                                      [col_slice] * len(bands)))
+    target_index, source_index, fractions = (np.concatenate(part) for part in zip(*parts))
+    return sparse.csr_matrix((fractions, (target_index, source_index)), shape=shape)
+
+
+def conservative_options(source, target, edge_points=CELL_EDGE_POINTS, crs=None, **options):
+    """Returns conservative_weights options that change the weights
+
+    workers and band_rows only change how weights are computed, so they
+    are not included"""
+    crs = shared_crs(source, target) if crs is None else CRS.from_user_input(crs)
+    return [f"edge_points={edge_points}", crs.to_wkt()]
+
+
+weight_functions = {
+    'nearest': nearest_weights,
+    'bilinear': bilinear_weights,
+    'conservative': conservative_weights,
+    }
+
+# Functions returning options saved with weights, so weights made with
+# other options are not reused
+option_functions = {
+    'conservative': conservative_options,
+    }
+
+
+class Regridder:
+    """Regrids data from a source Grid to a target Grid
+
+    :source: Grid of input data
+    :target: Grid of output data
+    :method: one of METHODS
+    :path: optional .npz file.  Weights are loaded from path if it exists
+           and was made for the same grids, method, engine and options
+           that change the weights, otherwise they are computed and saved
+           to path
+    :engine: projection engine used to compute weights, see Grid.get_latlon
+    :options: passed to the weight function, e.g. workers for conservative
+    """
+    def __init__(self, source, target, method='nearest', path=None, engine='proj',
+                 **options):
+        if method not in weight_functions:
+            raise NotImplementedError(f"{method} is not available")
+        self.source = source
+        self.target = target
+        self.method = method
+        self.engine = engine
+        self.options = options
+        self.weights = None
+        if path is not None and Path(path).exists():
+            self.weights = self._load_weights(path)
+        if self.weights is None:
+            self.weights = weight_functions[method](source, target, engine=engine,
+                                                    **options).tocsr()
+            if path is not None:
+                self.save(path)
+        self._covered = np.diff(self.weights.indptr) > 0
+
+
+    def __str__(self):
+        return ("Regridder object\n"
+                f"source: {self.source.name}\n"
+                f"target: {self.target.name}\n"
+                f"method: {self.method}\n"
+                f"weights: {self.weights.nnz}\n")
+
+
+    def _metadata(self):
+        metadata = [self.method,
+                    self.source.cache_key("grid"),
+                    self.target.cache_key("grid"),
+                    self.engine]
+        if self.method in option_functions:
+            metadata += option_functions[self.method](self.source, self.target,
+                                                      **self.options)
+        return np.array(metadata)
+
+
+    def save(self, path):
+        """Saves weights and grid identifiers to a .npz file"""
+        np.savez(path,
+                 data=self.weights.data,
+                 indices=self.weights.indices,
+                 indptr=self.weights.indptr,
+                 shape=np.array(self.weights.shape),
+                 metadata=self._metadata())
+
+
+    def _load_weights(self, path):
+        """Returns weights from path, or None if they are for other grids"""
+        with np.load(path) as f:
+            if not np.array_equal(f["metadata"], self._metadata()):
+                return None
+            return sparse.csr_matrix((f["data"], f["indices"], f["indptr"]),
+                                     shape=tuple(f["shape"]))
+
+
+    def regrid(self, data, fill_value=np.nan, skipna=False):
+        """Returns data regridded to the target grid
+
+        :data: array with shape (..., source rows, source cols)
+        :fill_value: value for target cells not covered by the source
+        :skipna: if True, NaN source cells are excluded and the remaining
+                 weights renormalized
+
+        :returns: array with shape (..., target rows, target cols)
+        """
+        data = np.asarray(data)
+        if data.shape[-2:] != (self.source.rows, self.source.cols):
+            raise ValueError(f"Expected data with shape (..., {self.source.rows}, "
+                             f"{self.source.cols}), got {data.shape}")
+        leading = data.shape[:-2]
+        flat = data.reshape(-1, self.source.rows * self.source.cols)
+        if skipna:
+            valid = np.isfinite(flat)
+            result = np.where(valid, flat, 0.) @ self.weights.T
+            total = valid.astype(self.weights.dtype) @ self.weights.T
+            result = np.divide(result, total, out=np.full_like(result, np.nan),
+                               where=total > 0)
+        else:
+            result = flat @ self.weights.T
+        result = np.asarray(result, dtype=np.result_type(data.dtype, np.float32))
+        result[:, ~self._covered] = fill_value
+        return result.reshape(leading + (self.target.rows, self.target.cols))
+
+
+    __call__ = regrid
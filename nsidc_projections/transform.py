@@ -0,0 +1,81 @@
+"""Shared pool of pyproj Transformers
+
+pyproj Transformers are expensive to create and are not thread-safe, so
+each thread keeps its own transformer for each (source CRS, target CRS)
+pair.  Inverse transforms reuse the forward transformer with
+direction=TransformDirection.INVERSE.
+"""
+import threading
+
+from pyproj import CRS, Transformer
+from pyproj.enums import TransformDirection
+
+from nsidc_projections import profiling
+
+_local = threading.local()
+_lock = threading.Lock()
+_counts = {"created": 0, "reused": 0}
+
+
+def crs_key(crs):
+    """Returns a hashable key for a CRS-like object"""
+    if isinstance(crs, CRS):
+        return crs.srs
+    if isinstance(crs, int):
+        return f"EPSG:{crs}"
+    if isinstance(crs, str):
+        return crs
+    return CRS.from_user_input(crs).srs
+
+
+def _thread_pool():
+    try:
+        return _local.transformers
+    except AttributeError:
+        _local.transformers = {}
+        return _local.transformers
+
+
+def get_transformer(crs_from, crs_to, always_xy=False):
+    """Returns a Transformer owned by the calling thread
+
+    :crs_from: source CRS, anything accepted by pyproj.CRS.from_user_input
+    :crs_to: target CRS
+    :always_xy: passed to Transformer.from_crs
+    """
+    key = (crs_key(crs_from), crs_key(crs_to), always_xy)
+    pool = _thread_pool()
+    transformer = pool.get(key)
+    if transformer is None:
+        with profiling.span("transform.create"):
+            transformer = Transformer.from_crs(crs_from, crs_to, always_xy=always_xy)
+        pool[key] = transformer
+        counter = "created"
+    else:
+        counter = "reused"
+    with _lock:
+        _counts[counter] += 1
+    return transformer
+
+
+def transform(crs_from, crs_to, xx, yy, direction=TransformDirection.FORWARD,
+              always_xy=False, **kwargs):
+    """Transforms coordinates with a pooled transformer
+
+    Keywords other than direction and always_xy are passed to
+    Transformer.transform"""
+    transformer = get_transformer(crs_from, crs_to, always_xy=always_xy)
+    return transformer.transform(xx, yy, direction=direction, **kwargs)
+
+
+def stats():
+    """Returns counts of transformers created and reused"""
+    with _lock:
+        return dict(_counts)
+
+
+def clear():
+    """Drops transformers held by the calling thread and resets counts"""
+    _thread_pool().clear()
+    with _lock:
+        _counts.update(created=0, reused=0)
@@ -0,0 +1,162 @@
+"""Chunked, compressed NetCDF and GeoTIFF writers for Grids
+
+CRS, geotransform and coordinate variables come from the Grid.  Data are
+written one block at a time, either from an array, which may be a memory
+map or other lazily loaded array, or from an iterable of
+(row_slice, col_slice, block) tuples, so the whole grid does not have to
+be in memory.  Blocks aligned with the file chunks or tiles are written
+without reading back partly filled chunks.
+
+netCDF4 and rasterio are imported when a writer is first used.
+"""
+import itertools
+
+import numpy as np
+
+from nsidc_projections.cf import (GRID_MAPPING_NAME, LAT_ATTRS, LON_ATTRS, X_ATTRS,
+                                  Y_ATTRS, grid_mapping_attrs)
+
+DEFAULT_CHUNKS = (512, 512)
+
+
+def iter_blocks(grid, data, chunks=DEFAULT_CHUNKS):
+    """Yields (row_slice, col_slice, block) for data
+
+    :grid: Grid of data
+    :data: array with shape (..., rows, cols), or an iterable of
+           (row_slice, col_slice, block) tuples which is returned as is
+    :chunks: (rows, cols) of blocks taken from an array
+    """
+    if not hasattr(data, "shape"):
+        yield from data
+        return
+    if tuple(data.shape[-2:]) != (grid.rows, grid.cols):
+        raise ValueError(f"Expected data with shape (..., {grid.rows}, {grid.cols}), "
+                         f"got {data.shape}")
+    for row_slice, col_slice in grid.iter_windows(chunks):
+        yield row_slice, col_slice, np.asarray(data[..., row_slice, col_slice])
+
+
+def _first_block(grid, data, chunks):
+    """Returns first block and an iterator over all blocks"""
+    blocks = iter_blocks(grid, data, chunks)
+    try:
+        first = next(blocks)
+    except StopIteration:
+        raise ValueError("No data blocks to write")
+    return first[2], itertools.chain([first], blocks)
+
+
+def write_netcdf(path, grid, data, name="data", dtype=None, chunks=DEFAULT_CHUNKS,
+                 complevel=4, fill_value=None, attrs=None, leading_dim="time",
+                 latlon=False):
+    """Writes data on grid to a CF NetCDF4 file
+
+    :path: output file path
+    :grid: Grid of data
+    :data: array with shape (rows, cols) or (n, rows, cols), or an iterable
+           of (row_slice, col_slice, block) tuples
+    :name: name of the data variable
+    :dtype: dtype of the data variable, defaults to dtype of the data
+    :chunks: (rows, cols) of file chunks and of blocks taken from an array
+    :complevel: zlib compression level, 0 for no compression
+    :fill_value: _FillValue of the data variable
+    :attrs: attributes of the data variable
+    :leading_dim: name of the first dimension of 3D data
+    :latlon: if True, also writes lat and lon variables, block by block
+
+    :returns: path
+    """
+    import netCDF4
+    first, blocks = _first_block(grid, data, chunks)
+    dtype = np.dtype(first.dtype if dtype is None else dtype)
+    chunk_rows, chunk_cols = min(chunks[0], grid.rows), min(chunks[1], grid.cols)
+    with netCDF4.Dataset(path, "w", format="NETCDF4") as nc:
+        dims = ("y", "x")
+        chunksizes = (chunk_rows, chunk_cols)
+        if first.ndim == 3:
+            nc.createDimension(leading_dim, first.shape[0])
+            dims = (leading_dim,) + dims
+            chunksizes = (1,) + chunksizes
+        nc.createDimension("y", grid.rows)
+        nc.createDimension("x", grid.cols)
+        x, y = grid.get_coordinates()
+        for coordinate, values, coordinate_attrs in (("x", x, X_ATTRS), ("y", y, Y_ATTRS)):
+            variable = nc.createVariable(coordinate, "f8", (coordinate,))
+            variable.setncatts(coordinate_attrs)
+            variable[:] = values
+        crs = nc.createVariable(GRID_MAPPING_NAME, "i4")
+        crs.setncatts(grid_mapping_attrs(grid))
+        variable = nc.createVariable(name, dtype, dims, zlib=complevel > 0,
+                                     complevel=complevel or None, shuffle=complevel > 0,
+                                     chunksizes=chunksizes, fill_value=fill_value)
+        variable.setncatts({**(attrs or {}), "grid_mapping": GRID_MAPPING_NAME})
+        if latlon:
+            variable.coordinates = "lat lon"
+            _write_netcdf_latlon(nc, grid, chunksizes[-2:], complevel)
+        for row_slice, col_slice, block in blocks:
+            variable[..., row_slice, col_slice] = block
+    return path
+
+
+def _write_netcdf_latlon(nc, grid, chunks, complevel):
+    """Writes lat and lon variables one chunk at a time"""
+    variables = []
+    for name, attrs in (("lat", LAT_ATTRS), ("lon", LON_ATTRS)):
+        variable = nc.createVariable(name, "f8", ("y", "x"), zlib=complevel > 0,
+                                     complevel=complevel or None, chunksizes=chunks)
+        variable.setncatts(attrs)
+        variables.append(variable)
+    for row_slice, col_slice, lat, lon in grid.iter_latlon_blocks(chunks):
+        variables[0][row_slice, col_slice] = lat
+        variables[1][row_slice, col_slice] = lon
+
+
+def write_geotiff(path, grid, data, dtype=None, blocksize=DEFAULT_CHUNKS[0],
+                  compress="deflate", nodata=None, count=None):
+    """Writes data on grid to a tiled, compressed GeoTIFF
+
+    :path: output file path
+    :grid: Grid of data
+    :data: array with shape (rows, cols) or (bands, rows, cols), or an
+           iterable of (row_slice, col_slice, block) tuples
+    :dtype: dtype of the raster, defaults to dtype of the data
+    :blocksize: tile width and height, a multiple of 16
+    :compress: GDAL compression, e.g. deflate, lzw, zstd or None
+    :nodata: nodata value
+    :count: number of bands, defaults to bands in the first block
+
+    :returns: path
+    """
+    import rasterio
+    from rasterio.windows import Window
+    first, blocks = _first_block(grid, data, (blocksize, blocksize))
+    dtype = np.dtype(first.dtype if dtype is None else dtype)
+    if count is None:
+        count = first.shape[0] if first.ndim == 3 else 1
+    profile = {
+        "driver": "GTiff",
+        "width": grid.cols,
+        "height": grid.rows,
+        "count": count,
+        "dtype": dtype.name,
+        "crs": grid.crs.to_wkt(),
+        "transform": grid.geotransform(),
+        "tiled": True,
+        "blockxsize": blocksize,
+        "blockysize": blocksize,
+        "nodata": nodata,
+        "BIGTIFF": "IF_SAFER",
+        }
+    if compress is not None:
+        profile["compress"] = compress
+        profile["predictor"] = 3 if dtype.kind == "f" else 2
+    with rasterio.open(path, "w", **profile) as dst:
+        for row_slice, col_slice, block in blocks:
+            window = Window.from_slices(row_slice, col_slice)
+            block = np.asarray(block, dtype=dtype)
+            if block.ndim == 2:
+                dst.write(block, 1, window=window)
+            else:
+                dst.write(block, window=window)
+    return path
@@ -0,0 +1,46 @@
+"""Fixtures shared by several test modules"""
+
+import pytest
+
+N200CORRECT_MPP = ("Azimuthal Equal-Area\n"
+                   "90.0\t0.0\t\tlat0 lon0\n"
+                   "0.0\t\t\trotation\n"
+                   "200.5402\t\tscale (km/map unit)\n")
+
+NL_GPD = ("N200correct.mpp\t\tmap projection parameters\n"
+          "721 721\t\t\tcolumns rows\n"
+          "8\t\t\tgrid cells per map unit\n"
+          "360.0 360.0\t\tmap origin column,row\n")
+
+NH_GPD = NL_GPD.replace("721 721", "1441 1441").replace(
+    "8\t", "16\t").replace("360.0 360.0", "720.0 720.0")
+
+NEW_STYLE_GPD = b"""; EASE2_N25km.gpd
+Map Projection: Azimuthal Equal-Area (ellipsoid)
+Map Reference Latitude: 90.0
+Map Reference Longitude: 0.0
+Map Equatorial Radius: 6378.137 ; wgs84
+Map Eccentricity: 0.081819190843 ; wgs84
+Grid Width: 720
+Grid Height: 720
+Grid Map Origin Column: 359.5
+Grid Map Origin Row: 359.5
+Grid Map Units per Cell: 25000.0
+"""
+
+
+@pytest.fixture
+def mapx_path(tmp_path):
+    """mapxmaps directory with the original EASE-Grid Nl and Nh gpd files"""
+    path = tmp_path / "mapxmaps"
+    path.mkdir()
+    (path / "N200correct.mpp").write_text(N200CORRECT_MPP)
+    (path / "Nl.gpd").write_text(NL_GPD)
+    (path / "Nh.gpd").write_text(NH_GPD)
+    return path
+
+
+@pytest.fixture
+def new_style_gpd():
+    """Contents of a new-style EASE-Grid 2.0 North 25 km gpd file"""
+    return NEW_STYLE_GPD
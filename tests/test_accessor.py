@@ -0,0 +1,74 @@
+"""Tests for the nsidc xarray accessor"""
+
+import pytest
+import numpy as np
+
+xr = pytest.importorskip("xarray")
+pytest.importorskip("dask")
+
+import nsidc_projections.accessor
+from nsidc_projections.grid import ease_grid2, get_grid
+
+GRID = ease_grid2("North", 36)
+
+
+@pytest.fixture
+def dataset():
+    data = np.zeros((2, GRID.rows, GRID.cols))
+    return xr.Dataset({"dummy": (("time", "north_south", "west_east"), data)})
+
+
+def test_assign_grid_coordinates(dataset):
+    result = dataset.nsidc.assign_grid(GRID)
+    x, y = GRID.get_coordinates()
+    np.testing.assert_array_equal(result.x, x)
+    np.testing.assert_array_equal(result.y, y)
+    assert result.dummy.dims == ("time", "y", "x")
+    assert result.dummy.attrs["grid_mapping"] == "crs"
+    assert result.crs.attrs["grid_mapping_name"] == "lambert_azimuthal_equal_area"
+    assert "grid_mapping" not in dataset.dummy.attrs
+
+
+def test_latlon_is_lazy(dataset, monkeypatch):
+    calls = []
+    latlon_window = type(GRID)._latlon_window
+    monkeypatch.setattr(type(GRID), "_latlon_window",
+                        lambda self, *args, **kwargs: calls.append(args) or
+                        latlon_window(self, *args, **kwargs))
+    result = dataset.nsidc.assign_grid(GRID, chunks=(100, 250))
+    assert calls == []
+    lat = result.lat.isel(y=slice(0, 100), x=slice(0, 250)).values
+    assert len(calls) == 1
+    np.testing.assert_allclose(lat, GRID.get_latlon()[0][:100, :250])
+
+
+def test_latlon_values(dataset):
+    result = dataset.nsidc.assign_grid(GRID, chunks=(128, 128))
+    lat, lon = GRID.get_latlon()
+    np.testing.assert_allclose(result.lat.values, lat)
+    np.testing.assert_allclose(result.lon.values, lon)
+
+
+def test_assign_grid_dataarray_by_name():
+    grid = get_grid("EASEGrid2North25km")
+    data = xr.DataArray(np.zeros((grid.rows, grid.cols)), dims=("y", "x"))
+    result = data.nsidc.assign_grid("EASEGrid2North25km", latlon=False)
+    assert "lat" not in result.coords
+    assert result.attrs["grid_mapping"] == "crs"
+
+
+def test_assign_grid_wrong_shape(dataset):
+    with pytest.raises(ValueError):
+        dataset.nsidc.assign_grid(GRID, dims=("time", "west_east"))
+
+
+def test_assign_grid_dtype(dataset):
+    result = dataset.nsidc.assign_grid(GRID, chunks=(128, 128), dtype=np.float32)
+    assert result.lat.dtype == np.float32
+    np.testing.assert_allclose(result.lat.values, GRID.get_latlon()[0], rtol=1e-6)
+
+
+def test_latlon_arrays_are_shared(dataset):
+    first = dataset.nsidc.assign_grid(GRID, chunks=(128, 128))
+    second = dataset.nsidc.assign_grid(GRID, chunks=(128, 128))
+    assert first.lat.data is second.lat.data
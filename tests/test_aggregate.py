@@ -0,0 +1,91 @@
+"""Tests for nested grids and block aggregation"""
+
+import pytest
+import numpy as np
+
+from nsidc_projections import aggregate, grid, grid_info
+
+
+@pytest.mark.parametrize(
+    "region,resolution,cols,rows",
+    [
+        ("North", 36, 500, 500),
+        ("North", 9, 2000, 2000),
+        ("South", 3, 6000, 6000),
+        ("Global", 36, 964, 406),
+        ("Global", 9, 3856, 1624),
+        ("Global", 1, 34704, 14616),
+        ("Global", 12.5, 2776, 1168),
+        ("North", 3.125, 5760, 5760),
+    ]
+)
+def test_ease_grid2(region, resolution, cols, rows):
+    result = grid_info.ease_grid2(region, resolution)
+    assert (result.cols, result.rows) == (cols, rows)
+    assert result.name == f"EASE-Grid 2.0 {region} {resolution:g} km"
+
+
+def test_ease_grid2_matches_25km_grids():
+    assert grid_info.ease_grid2("Global", 25) == grid_info.EASEGrid2Global25km
+
+
+@pytest.mark.parametrize("region", grid_info.EASE_GRID2_REGIONS)
+def test_ease_grid2_shares_registered_grids(region):
+    assert grid.ease_grid2(region, 25) is grid.get_grid(f"EASEGrid2{region}25km")
+    assert grid.ease_grid2(region, 9) is grid.ease_grid2(region, 9.0)
+
+
+@pytest.mark.parametrize("region,resolution", [("Arctic", 36), ("North", 7)])
+def test_ease_grid2_raises(region, resolution):
+    with pytest.raises(ValueError):
+        grid_info.ease_grid2(region, resolution)
+
+
+def test_nesting_factor():
+    fine = grid.ease_grid2("Global", 3)
+    coarse = grid.ease_grid2("Global", 36)
+    assert aggregate.nesting_factor(fine, coarse) == 12
+    with pytest.raises(ValueError):
+        aggregate.nesting_factor(fine, grid.ease_grid2("Global", 25))
+
+
+def test_aggregate_mean_and_sum():
+    data = np.arange(32.).reshape(2, 4, 4)
+    mean = aggregate.aggregate(data, 2)
+    assert mean.shape == (2, 2, 2)
+    assert mean[0, 0, 0] == np.mean([0., 1., 4., 5.])
+    np.testing.assert_array_equal(aggregate.aggregate(data, 2, 'sum'), mean * 4)
+
+
+def test_aggregate_skipna():
+    data = np.array([[1., np.nan], [3., np.nan]])
+    assert aggregate.aggregate(data, 2, skipna=True)[0, 0] == 2.
+    assert np.isnan(aggregate.aggregate(data, 2)[0, 0])
+
+
+def test_aggregate_majority():
+    data = np.array([[1, 1, 2, 3],
+                     [1, 3, 4, 3],
+                     [5, 6, 7, 7],
+                     [6, 5, 8, 8]])
+    expected = np.array([[1, 3],
+                         [5, 7]])
+    np.testing.assert_array_equal(aggregate.aggregate(data, 2, 'majority'), expected)
+
+
+@pytest.mark.parametrize("method", ['mean', 'sum'])
+def test_disaggregate_round_trip(method):
+    data = np.random.default_rng(0).random((3, 4, 5))
+    fine = aggregate.disaggregate(data, 3, method=method)
+    assert fine.shape == (3, 12, 15)
+    np.testing.assert_allclose(aggregate.aggregate(fine, 3, method=method), data)
+
+
+def test_to_nested_grid():
+    coarse = grid.ease_grid2("North", 36)
+    fine = grid.ease_grid2("North", 9)
+    data = np.ones((fine.rows, fine.cols))
+    result = aggregate.to_nested_grid(data, fine, coarse, method='sum')
+    assert result.shape == (coarse.rows, coarse.cols)
+    assert np.all(result == 16.)
+    assert aggregate.to_nested_grid(result, coarse, fine).shape == data.shape
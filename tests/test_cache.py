@@ -0,0 +1,90 @@
+"""Tests for the grid array cache"""
+
+import pytest
+import numpy as np
+
+from nsidc_projections.cache import MEMMAP_ENTRY_BYTES, ArrayCache, make_key
+from nsidc_projections.grid import SSMI_PolarStereoNorth25km
+
+
+def test_make_key_is_stable():
+    assert make_key("latlon", 3411, (448, 304)) == make_key("latlon", 3411, (448, 304))
+    assert make_key("latlon", 3411) != make_key("latlon", 3412)
+
+
+def test_cache_key_depends_on_versions(monkeypatch):
+    from nsidc_projections import grid
+    key = SSMI_PolarStereoNorth25km.cache_key("latlon")
+    monkeypatch.setattr(grid, "CACHE_FORMAT", grid.CACHE_FORMAT + 1)
+    assert SSMI_PolarStereoNorth25km.cache_key("latlon") != key
+    monkeypatch.undo()
+    monkeypatch.setattr(grid, "proj_version_str", "0.0.0")
+    assert SSMI_PolarStereoNorth25km.cache_key("latlon") != key
+
+
+def test_memory_budget_evicts_least_recently_used():
+    cache = ArrayCache(max_bytes=3 * 800)
+    for key in "abc":
+        cache.put(key, np.zeros(100))
+    cache.get("a")
+    cache.put("d", np.zeros(100))
+    assert "b" not in cache
+    assert "a" in cache
+    assert cache.stats()["evictions"] == 1
+
+
+def test_cached_arrays_are_read_only():
+    cache = ArrayCache()
+    array = cache.get_or_compute("a", lambda: np.zeros(10))
+    with pytest.raises(ValueError):
+        array[0] = 1.
+
+
+def test_put_leaves_array_writeable():
+    cache = ArrayCache()
+    array = np.zeros(10)
+    cached = cache.put("a", array)
+    assert array.flags.writeable
+    assert not cached.flags.writeable
+
+
+def test_memmaps_count_against_budget(tmp_path):
+    cache = ArrayCache(max_bytes=3 * MEMMAP_ENTRY_BYTES, directory=tmp_path)
+    for key in "abcd":
+        cache.put(key, np.zeros(2 * MEMMAP_ENTRY_BYTES // 8))
+    cache.clear()
+    for key in "abcd":
+        assert isinstance(cache.get(key), np.memmap)
+    assert len(cache) == 3
+
+
+def test_get_coordinates_are_writeable():
+    x, y = SSMI_PolarStereoNorth25km.get_coordinates()
+    x[0] = 0.
+    assert SSMI_PolarStereoNorth25km.get_coordinates()[0][0] != 0.
+
+
+def test_disk_store_returns_memmap(tmp_path):
+    cache = ArrayCache(directory=tmp_path)
+    cache.put("a", np.arange(10.))
+    cache.clear()
+    result = cache.get("a")
+    assert isinstance(result, np.memmap)
+    np.testing.assert_array_equal(result, np.arange(10.))
+    assert cache.stats()["disk_hits"] == 1
+
+
+def test_disk_budget_evicts_files(tmp_path):
+    cache = ArrayCache(directory=tmp_path, max_disk_bytes=1000)
+    cache.put("a", np.zeros(100))
+    cache.put("b", np.zeros(100))
+    assert len(list(tmp_path.glob("*.npy"))) == 1
+
+
+def test_get_latlon_is_cached():
+    grid = SSMI_PolarStereoNorth25km
+    lat, lon = grid.get_latlon()
+    expected_lat, expected_lon = grid.get_latlon(cache=False)
+    np.testing.assert_array_equal(lat, expected_lat)
+    np.testing.assert_array_equal(lon, expected_lon)
+    assert grid.get_latlon()[0].base is lat.base
@@ -0,0 +1,204 @@
+"""Tests for Grid methods"""
+
+import pytest
+import numpy as np
+
+from nsidc_projections.grid import available_grids, get_grid
+
+
+@pytest.mark.parametrize("name", available_grids)
+def test_latlon_to_rowcol_round_trip(name):
+    grid = get_grid(name)
+    lat, lon = grid.get_latlon()
+    valid = np.isfinite(lat)
+    row, col, outside = grid.latlon_to_rowcol(lat[valid], lon[valid], chunk_size=10_000)
+    rows, cols = np.nonzero(valid)
+    assert not outside.any()
+    np.testing.assert_array_equal(row, rows)
+    np.testing.assert_array_equal(col, cols)
+
+
+def test_latlon_to_rowcol_fractional():
+    grid = get_grid("SSMI_PolarStereoNorth25km")
+    lat, lon = grid.get_latlon()
+    row, col, _ = grid.latlon_to_rowcol(lat[:2, :3], lon[:2, :3], fractional=True)
+    assert row.shape == (2, 3)
+    np.testing.assert_allclose(row, [[0.5]*3, [1.5]*3], atol=1e-6)
+    np.testing.assert_allclose(col, [[0.5, 1.5, 2.5]]*2, atol=1e-6)
+
+
+def test_latlon_to_rowcol_outside():
+    grid = get_grid("SSMI_PolarStereoNorth25km")
+    row, col, outside = grid.latlon_to_rowcol([-60., 85.], [0., 0.])
+    np.testing.assert_array_equal(outside, [True, False])
+    assert row[0] == -1 and col[0] == -1
+
+
+def test_iter_latlon_to_rowcol():
+    grid = get_grid("EASEGrid2North25km")
+    chunks = [(np.full(5, 90.), np.zeros(5)), (np.array([89.9]), np.array([0.]))]
+    results = list(grid.iter_latlon_to_rowcol(chunks))
+    assert len(results) == 2
+    np.testing.assert_array_equal(results[0][0], 360)
+
+
+def test_iter_latlon_blocks_matches_get_latlon():
+    grid = get_grid("SSMI_PolarStereoSouth25km")
+    lat, lon = grid.get_latlon()
+    covered = np.zeros(lat.shape, dtype=int)
+    for row_slice, col_slice, lat_block, lon_block in grid.iter_latlon_blocks((100, 128)):
+        assert lat_block.shape == (row_slice.stop - row_slice.start,
+                                   col_slice.stop - col_slice.start)
+        np.testing.assert_array_equal(lat_block, lat[row_slice, col_slice])
+        np.testing.assert_array_equal(lon_block, lon[row_slice, col_slice])
+        covered[row_slice, col_slice] += 1
+    assert (covered == 1).all()
+
+
+def test_get_coordinate_grids_are_read_only_views():
+    grid = get_grid("SSMI_PolarStereoNorth25km")
+    x, y = grid.get_coordinates()
+    x2d, y2d = grid.get_coordinate_grids()
+    assert x2d.shape == y2d.shape == (grid.rows, grid.cols)
+    assert np.shares_memory(x2d, grid.get_coordinate_grids()[0])
+    assert not x2d.flags.writeable
+    expected_x, expected_y = np.meshgrid(x, y)
+    np.testing.assert_array_equal(x2d, expected_x)
+    np.testing.assert_array_equal(y2d, expected_y)
+
+
+def test_get_gridcell_edges_dtype_and_out():
+    grid = get_grid("EASEGrid2North25km")
+    out = (np.empty(grid.cols + 1, dtype=np.float32), np.empty(grid.rows + 1, dtype=np.float32))
+    x, y = grid.get_gridcell_edges(out=out)
+    assert x is out[0]
+    assert x[0] == grid.upper_left_x and y[0] == grid.upper_left_y
+    assert grid.get_gridcell_edges(dtype=np.float32)[0].dtype == np.float32
+
+
+@pytest.mark.parametrize("engine", ["proj", "numpy"])
+def test_get_latlon_float32(engine):
+    grid = get_grid("SSMI_PolarStereoSouth25km")
+    expected_lat, expected_lon = grid.get_latlon(engine=engine)
+    lat, lon = grid.get_latlon(engine=engine, dtype=np.float32)
+    assert lat.dtype == lon.dtype == np.float32
+    np.testing.assert_allclose(lat, expected_lat, atol=1e-4)
+    np.testing.assert_allclose(lon, expected_lon, atol=1e-4)
+
+
+def test_get_latlon_out():
+    grid = get_grid("SSMI_PolarStereoSouth25km")
+    out = (np.empty((grid.rows, grid.cols)), np.empty((grid.rows, grid.cols)))
+    lat, lon = grid.get_latlon(cache=False, out=out)
+    assert lat is out[0] and lon is out[1]
+    np.testing.assert_array_equal(lat, grid.get_latlon()[0])
+
+
+@pytest.mark.parametrize("backend", ["thread", "process"])
+@pytest.mark.parametrize("engine", ["proj", "numpy"])
+def test_parallel_latlon_matches_serial(engine, backend):
+    grid = get_grid("EASEGrid2South25km")
+    expected = grid.get_latlon(cache=False, engine=engine)
+    result = grid.get_latlon(cache=False, engine=engine, workers=3, backend=backend)
+    for r, e in zip(result, expected):
+        np.testing.assert_array_equal(r, e)
+
+
+def test_process_latlon_into_out():
+    grid = get_grid("EASEGrid2South25km")
+    expected = grid.get_latlon(cache=False)
+    out = (np.empty((grid.rows, grid.cols)), np.empty((grid.rows, grid.cols), dtype=np.float32))
+    result = grid.get_latlon(cache=False, out=out, workers=2, backend="process")
+    assert result[0] is out[0] and result[1] is out[1]
+    np.testing.assert_array_equal(out[0], expected[0])
+    np.testing.assert_allclose(out[1], expected[1], rtol=1e-6)
+
+
+@pytest.mark.parametrize("name", ["SSMI_PolarStereoNorth25km", "EASEGrid2South25km",
+                                  "EASEGridNorth25km"])
+def test_cell_area_matches_geodesic_area(name):
+    grid = get_grid(name)
+    area = grid.cell_area()
+    x, y = grid.get_gridcell_edges()
+    geod = grid.geodetic_crs.get_geod()
+    for row, col in [(10, 20), (grid.rows // 2, grid.cols // 2), (grid.rows - 30, 40)]:
+        corners_x = [x[col], x[col + 1], x[col + 1], x[col]]
+        corners_y = [y[row], y[row], y[row + 1], y[row + 1]]
+        lat, lon = grid.transformer().transform(corners_x, corners_y)
+        expected = abs(geod.polygon_area_perimeter(lon, lat)[0])
+        assert area[row, col] == pytest.approx(expected, rel=1e-3)
+
+
+def test_scale_factors_float32():
+    grid = get_grid("SSMI_PolarStereoSouth25km")
+    h, k = grid.scale_factors(dtype=np.float32)
+    assert h.dtype == np.float32 and h.shape == (grid.rows, grid.cols)
+    np.testing.assert_array_equal(h, k)
+    assert grid.cell_area(dtype=np.float32).dtype == np.float32
+
+
+@pytest.mark.parametrize("name", available_grids)
+def test_to_cartopy_is_memoized(name):
+    grid = get_grid(name)
+    assert grid.to_cartopy() is grid.to_cartopy()
+
+
+@pytest.mark.parametrize("name", ['EASEGridGlobal25km', 'EASEGrid2Global25km'])
+def test_to_cartopy_cylindrical_equal_area(name):
+    grid = get_grid(name)
+    projection = grid.to_cartopy()
+    assert projection.x_limits[1] == pytest.approx(-grid.upper_left_x, abs=1.)
+    assert projection.y_limits[1] >= grid.upper_left_y
+
+
+def test_make_cartopy_crs_shares_to_cartopy():
+    from nsidc_projections.plot import make_cartopy_crs
+    grid = get_grid('EASEGrid2North25km')
+    assert make_cartopy_crs(grid.epsg) is grid.to_cartopy()
+
+
+@pytest.mark.parametrize("function", ["to_cartopy", "create_proj_crs"])
+def test_crs_conversion_rejects_non_crs(function):
+    from nsidc_projections import grid
+    with pytest.raises(TypeError):
+        getattr(grid, function)("EPSG:6931")
+
+
+@pytest.mark.parametrize("name, bbox", [
+    ("EASEGrid2North25km", (-160., 68., -120., 80.)),
+    ("SSMI_PolarStereoNorth25km", (-160., 68., -120., 80.)),
+    ("SSMI_PolarStereoSouth25km", (-60., -78., -20., -60.)),
+    ("EASEGrid2Global25km", (-30., -10., 40., 35.)),
+    ("EASEGrid2North25km", (170., 60., -170., 70.)),
+    ])
+def test_window_covers_bbox(name, bbox):
+    grid = get_grid(name)
+    row_slice, col_slice, window = grid.window(bbox)
+    lat, lon = grid.get_latlon()
+    west, south, east, north = bbox
+    in_lon = (lon >= west) | (lon <= east) if west > east else (lon >= west) & (lon <= east)
+    rows, cols = np.nonzero(in_lon & (lat >= south) & (lat <= north))
+    assert row_slice.start <= rows.min() and rows.max() < row_slice.stop
+    assert col_slice.start <= cols.min() and cols.max() < col_slice.stop
+    # At most one cell more than the cells in the box on each side
+    assert rows.min() - row_slice.start <= 1 and row_slice.stop - rows.max() <= 2
+    window_lat, window_lon = window.get_latlon(cache=False)
+    np.testing.assert_allclose(window_lat, lat[row_slice, col_slice])
+    np.testing.assert_allclose(window_lon, lon[row_slice, col_slice])
+
+
+def test_window_projected_bbox():
+    grid = get_grid("EASEGrid2North25km")
+    row_slice, col_slice, window = grid.window((-100_000., -50_000., 100_000., 50_000.),
+                                               latlon=False)
+    assert (row_slice, col_slice) == (slice(358, 362), slice(356, 364))
+    assert (window.rows, window.cols) == (4, 8)
+    assert (window.upper_left_x, window.upper_left_y) == (-100_000., 50_000.)
+
+
+def test_window_whole_grid_and_outside():
+    grid = get_grid("SSMI_PolarStereoNorth25km")
+    assert grid.window((-180., -90., 180., 90.))[:2] == (slice(0, grid.rows),
+                                                         slice(0, grid.cols))
+    with pytest.raises(ValueError):
+        grid.window((0., -80., 10., -70.))
@@ -0,0 +1,58 @@
+"""Tests for drop-in-bucket gridding"""
+
+import pytest
+import numpy as np
+
+from nsidc_projections.grid import get_grid
+
+GRID = get_grid("EASEGrid2North25km")
+
+
+def random_points(n, seed=0):
+    rng = np.random.default_rng(seed)
+    return rng.uniform(60., 90., n), rng.uniform(-180., 180., n), rng.normal(size=n)
+
+
+def test_statistics_match_numpy():
+    lat, lon, values = random_points(100_000)
+    accumulator = GRID.accumulator()
+    assert accumulator.add(lat, lon, values) == lat.size
+    row, col, _ = GRID.latlon_to_rowcol(lat, lon)
+    cell = (row == row[0]) & (col == col[0])
+    r, c = row[0], col[0]
+    assert accumulator.counts()[r, c] == cell.sum()
+    assert accumulator.mean()[r, c] == pytest.approx(values[cell].mean())
+    assert accumulator.std()[r, c] == pytest.approx(values[cell].std())
+    assert accumulator.minimum()[r, c] == values[cell].min()
+    assert accumulator.maximum()[r, c] == values[cell].max()
+    assert accumulator.counts().sum() == lat.size
+
+
+def test_empty_cells_are_nan():
+    accumulator = GRID.accumulator()
+    accumulator.add([90.], [0.], [1.])
+    mean = accumulator.mean()
+    assert np.isnan(mean[0, 0])
+    assert mean[360, 360] == 1.
+    assert np.isnan(accumulator.std(ddof=1)[360, 360])
+
+
+def test_ignores_points_off_grid_and_nan_values():
+    accumulator = get_grid("SSMI_PolarStereoNorth25km").accumulator()
+    assert accumulator.add([-60., 85., 85.], [0., 0., 0.], [1., np.nan, 2.]) == 1
+
+
+def test_merge_matches_single_pass():
+    lat, lon, values = random_points(50_000)
+    single = GRID.accumulator().update([(lat, lon, values)])
+    chunks = [GRID.accumulator().update([(lat[i::3], lon[i::3], values[i::3])])
+              for i in range(3)]
+    merged = chunks[0].merge(chunks[1]).merge(chunks[2])
+    np.testing.assert_array_equal(merged.counts(), single.counts())
+    np.testing.assert_allclose(merged.mean(), single.mean())
+    np.testing.assert_array_equal(merged.minimum(), single.minimum())
+
+
+def test_merge_different_grids():
+    with pytest.raises(ValueError):
+        GRID.accumulator().merge(get_grid("EASEGrid2South25km").accumulator())
@@ -0,0 +1,95 @@
+"""Tests that importing the package stays cheap
+
+Each check runs in a fresh interpreter so modules imported by other tests
+do not count.
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+# Median wall-clock budget for importing a module, in seconds
+IMPORT_BUDGET = 0.5
+
+HEAVY_MODULES = ['cartopy', 'matplotlib', 'yaml', 'scipy', 'shapely']
+
+CHECK_IMPORT = """
+import json, sys, time
+t0 = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - t0
+print(json.dumps({{"elapsed": elapsed,
+                   "loaded": [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+MODULES = [
+    'nsidc_projections',
+    'nsidc_projections.grid',
+    'nsidc_projections.crs',
+    'nsidc_projections.profiling',
+    'nsidc_projections.plot',
+    'nsidc_projections.mapx.parse_mapx',
+    ]
+
+
+def import_in_subprocess(module, cwd=None, heavy=HEAVY_MODULES):
+    code = CHECK_IMPORT.format(module=module, heavy=heavy)
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True,
+                         text=True, check=True, cwd=cwd).stdout
+    return json.loads(out)
+
+
+@pytest.mark.parametrize("module", MODULES)
+def test_import_does_not_load_heavy_modules(module):
+    assert import_in_subprocess(module)["loaded"] == []
+
+
+@pytest.mark.parametrize("module", MODULES)
+def test_import_budget(module):
+    times = sorted(import_in_subprocess(module)["elapsed"] for _ in range(3))
+    assert times[1] < IMPORT_BUDGET
+
+
+def test_grid_does_not_load_process_pools():
+    heavy = ['concurrent.futures', 'multiprocessing.shared_memory']
+    assert import_in_subprocess('nsidc_projections.grid', heavy=heavy)["loaded"] == []
+
+
+CHECK_LAZY_REGISTRY = """
+import json
+from nsidc_projections import profiling
+import nsidc_projections.grid as grid
+import nsidc_projections.crs as crs
+result = {"grids": list(grid._grid_registry), "crs": list(crs._crs_registry),
+          "crs_created": profiling.stats().get("crs.create", {}).get("calls", 0)}
+from nsidc_projections.grid import EASEGrid2North25km as first
+from nsidc_projections.grid import EASEGrid2North25km as second
+result["same"] = first is second
+print(json.dumps(result))
+"""
+
+
+def test_grids_and_crs_are_created_lazily():
+    from nsidc_projections import profiling
+    env = dict(os.environ, **{profiling.PROFILE_ENV: "1"})
+    out = subprocess.run([sys.executable, "-c", CHECK_LAZY_REGISTRY], capture_output=True,
+                         text=True, check=True, env=env).stdout
+    result = json.loads(out)
+    assert result["grids"] == [] and result["crs"] == []
+    assert result["crs_created"] == 0
+    assert result["same"]
+
+
+def test_import_from_other_directory(tmp_path):
+    assert import_in_subprocess('nsidc_projections.mapx.parse_mapx', cwd=tmp_path)["loaded"] == []
+
+
+def test_config_path_from_environment(tmp_path, monkeypatch):
+    from nsidc_projections import filepath
+    config = tmp_path / "other.yml"
+    config.write_text("APP:\n  MAPXPATH: /data/mapxmaps\n")
+    monkeypatch.setenv(filepath.CONFIG_ENV, str(config))
+    assert str(filepath.MAPXMAPS_PATH) == "/data/mapxmaps"
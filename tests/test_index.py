@@ -0,0 +1,61 @@
+"""Tests for identifying grids from shapes and coordinates"""
+
+import pytest
+
+import nsidc_projections
+from nsidc_projections import index
+from nsidc_projections.grid import ease_grid2, get_grid
+from nsidc_projections.mapx.catalog import MapxCatalog
+
+
+def names(grids):
+    return [grid.name for grid in grids]
+
+
+@pytest.mark.parametrize(
+    "shape,expected",
+    [
+        ((448, 304), ["SSM/I Polar Stereographic North 25 km (N3B)"]),
+        ((721, 721), ["EASE-Grid North 25 km", "EASE-Grid South 25 km"]),
+        ((500, 500), ["EASE-Grid 2.0 North 36 km", "EASE-Grid 2.0 South 36 km"]),
+        ((10, 10), []),
+    ]
+)
+def test_identify_shape(shape, expected):
+    assert names(nsidc_projections.identify(shape=shape)) == expected
+
+
+@pytest.mark.parametrize("name", ['SSMI_PolarStereoSouth25km', 'EASEGrid2Global25km',
+                                  'AVHRR_EASEGridNorth25km'])
+def test_identify_coordinates(name):
+    grid = get_grid(name)
+    x, y = grid.get_coordinates()
+    assert names(nsidc_projections.identify(x=x, y=y)) == [grid.name]
+    assert names(nsidc_projections.identify(x=x, y=y[::-1])) == [grid.name]
+
+
+def test_identify_epsg():
+    grid = ease_grid2("South", 36)
+    assert nsidc_projections.identify(shape=(500, 500), epsg=grid.epsg) == [grid]
+
+
+def test_identify_cell_size_tolerance():
+    index_ = index.GridIndex([get_grid('EASEGridNorth25km')], tolerance=1.)
+    assert len(index_.identify(cell_size=25067.)) == 1
+    assert index_.identify(cell_size=25065.) == []
+
+
+def test_identify_requires_a_property():
+    with pytest.raises(ValueError):
+        nsidc_projections.identify()
+
+
+def test_add_mapx_catalog(mapx_path):
+    (mapx_path / "Nh.gpd").unlink()
+    index_ = index.GridIndex()
+    assert index.add_mapx_catalog(index_, MapxCatalog(mapx_path, index_path=False)) == []
+    grid = get_grid('EASEGridNorth25km')
+    x, y = grid.get_coordinates()
+    [result] = index_.identify(x=x, y=y)
+    assert result.name == "Nl"
+    assert result.epsg == grid.epsg
@@ -0,0 +1,82 @@
+"""Accuracy of closed-form projection kernels against pyproj"""
+
+import pytest
+import numpy as np
+from pyproj.enums import TransformDirection
+
+from nsidc_projections import grid_info, kernels
+from nsidc_projections.grid import available_grids, get_grid
+
+LATLON_TOLERANCE = 1e-7  # degrees
+XY_TOLERANCE = 1e-3  # meters
+
+
+def longitude_difference(a, b):
+    with np.errstate(invalid="ignore"):
+        return np.abs((a - b + 180.) % 360. - 180.)
+
+
+@pytest.mark.parametrize("name", available_grids)
+def test_inverse_matches_pyproj(name):
+    grid = get_grid(name)
+    expected_lat, expected_lon = grid.get_latlon(cache=False)
+    lat, lon = grid.get_latlon(cache=False, engine='numpy')
+    valid = np.isfinite(expected_lat)
+    np.testing.assert_array_equal(np.isfinite(lat), valid)
+    assert np.abs(lat - expected_lat)[valid].max() < LATLON_TOLERANCE
+    assert longitude_difference(lon, expected_lon)[valid].max() < LATLON_TOLERANCE
+
+
+@pytest.mark.parametrize("name", available_grids)
+def test_forward_matches_pyproj(name):
+    grid = get_grid(name)
+    lat, lon = grid.get_latlon()
+    valid = np.isfinite(lat)
+    x, y = kernels.forward(grid.projection, lat[valid], lon[valid])
+    expected_x, expected_y = grid.transformer().transform(
+        lat[valid], lon[valid], direction=TransformDirection.INVERSE)
+    assert np.abs(x - expected_x).max() < XY_TOLERANCE
+    assert np.abs(y - expected_y).max() < XY_TOLERANCE
+
+
+@pytest.mark.parametrize("name", available_grids)
+def test_latlon_to_rowcol_numpy_engine(name):
+    grid = get_grid(name)
+    lat, lon = grid.get_latlon()
+    valid = np.isfinite(lat)
+    expected = grid.latlon_to_rowcol(lat[valid], lon[valid])
+    result = grid.latlon_to_rowcol(lat[valid], lon[valid], engine='numpy')
+    for r, e in zip(result, expected):
+        np.testing.assert_array_equal(r, e)
+
+
+def test_float32():
+    projection = grid_info.PROJECTIONS[grid_info.EASE_GRID2_NORTH_EPSG]
+    x = np.linspace(-9e6, 9e6, 101, dtype=np.float32)
+    lat, lon = kernels.inverse(projection, x, x[:, np.newaxis])
+    assert lat.dtype == np.float32
+    expected_lat, expected_lon = kernels.inverse(projection, x, x[:, np.newaxis],
+                                                 dtype=np.float64)
+    np.testing.assert_allclose(lat, expected_lat, atol=1e-3)
+    assert np.nanmax(longitude_difference(lon, expected_lon)) < 1e-3
+
+
+def test_out_buffer():
+    projection = grid_info.PROJECTIONS[grid_info.POLAR_STEREO_NORTH_EPSG]
+    out = (np.empty(3), np.empty(3))
+    x, y = kernels.forward(projection, [90., 80., 70.], [0., 0., 0.], out=out)
+    assert x is out[0] and y is out[1]
+    assert (x[0], y[0]) == pytest.approx((0., 0.))
+
+
+def test_off_globe_is_nan():
+    projection = grid_info.PROJECTIONS[grid_info.EASE_GRID_NORTH_EPSG]
+    lat, lon = kernels.inverse(projection, [0., 9.1e6], [0., 9.1e6])
+    assert lat[0] == pytest.approx(90.)
+    assert np.isnan(lat[1])
+
+
+def test_unknown_family():
+    projection = grid_info.Projection("merc", 0., 0., None, 1., 1.)
+    with pytest.raises(NotImplementedError):
+        kernels.forward(projection, 0., 0.)
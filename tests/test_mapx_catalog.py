@@ -0,0 +1,88 @@
+"""Tests for the indexed MapX catalog"""
+
+import os
+
+import pytest
+
+from nsidc_projections import filepath
+from nsidc_projections.mapx import catalog as mapx_catalog
+from nsidc_projections.mapx.catalog import MapxCatalog
+from nsidc_projections.mapx.parse_mapx import GPDefinition
+
+
+def test_catalog_lookup(mapx_path, tmp_path):
+    catalog = MapxCatalog(mapx_path, index_path=tmp_path / "index.json")
+    assert catalog.names() == ["Nh", "Nl"]
+    assert catalog["Nl"]["Grid Width"] == 721
+    assert catalog["Nh.gpd"]["Map Units per Cell"] == pytest.approx(12533.7625)
+    assert "Nl" in catalog
+
+
+def test_lookup_returns_copy(mapx_path):
+    catalog = MapxCatalog(mapx_path, index_path=False)
+    catalog["Nl"]["Grid Width"] = 0
+    assert catalog["Nl"]["Grid Width"] == 721
+
+
+def test_from_gpd_without_catalog(mapx_path, monkeypatch):
+    monkeypatch.setattr(filepath, "MAPXMAPS_PATH", mapx_path)
+    monkeypatch.setattr(mapx_catalog, "_default_catalog", None)
+    gpd = GPDefinition()
+    gpd.from_gpd("Nl")
+    assert gpd.grid_width == 721
+    assert mapx_catalog._default_catalog is None
+
+
+def test_index_is_reused(mapx_path, tmp_path):
+    index_path = tmp_path / "index.json"
+    assert MapxCatalog(mapx_path, index_path=index_path).parsed == 2
+    catalog = MapxCatalog(mapx_path, index_path=index_path)
+    assert catalog.parsed == 0
+    assert catalog["Nl"]["Grid Height"] == 721
+
+
+def test_changed_files_are_parsed_again(mapx_path, tmp_path):
+    index_path = tmp_path / "index.json"
+    MapxCatalog(mapx_path, index_path=index_path)
+    gpd = mapx_path / "Nl.gpd"
+    gpd.write_text(gpd.read_text().replace("721 721", "722 722"))
+    mpp = mapx_path / "N200correct.mpp"
+    stat = mpp.stat()
+    os.utime(mpp, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    catalog = MapxCatalog(mapx_path, index_path=index_path)
+    assert catalog.parsed == 2
+    assert catalog["Nl"]["Grid Width"] == 722
+
+
+def test_unparseable_files_are_recorded(mapx_path):
+    (mapx_path / "bad.gpd").write_text("Grid Width: 720\n")
+    catalog = MapxCatalog(mapx_path, index_path=False)
+    assert "bad" not in catalog
+    assert "bad" in catalog.errors
+
+
+def test_unparseable_files_are_not_parsed_again(mapx_path, tmp_path):
+    index_path = tmp_path / "index.json"
+    (mapx_path / "bad.gpd").write_text("Grid Width: 720\n")
+    assert MapxCatalog(mapx_path, index_path=index_path).parsed == 3
+    mtime_ns = index_path.stat().st_mtime_ns
+    catalog = MapxCatalog(mapx_path, index_path=index_path)
+    assert catalog.parsed == 0
+    assert "bad" in catalog.errors
+    assert index_path.stat().st_mtime_ns == mtime_ns
+    (mapx_path / "bad.gpd").write_text("Grid Width: 721\n")
+    assert MapxCatalog(mapx_path, index_path=index_path).parsed == 1
+
+
+def test_missing_mpp_is_retried_when_added(mapx_path, tmp_path):
+    index_path = tmp_path / "index.json"
+    mpp = mapx_path / "N200correct.mpp"
+    contents = mpp.read_text()
+    mpp.unlink()
+    catalog = MapxCatalog(mapx_path, index_path=index_path)
+    assert catalog.names() == []
+    assert MapxCatalog(mapx_path, index_path=index_path).parsed == 0
+    mpp.write_text(contents)
+    catalog = MapxCatalog(mapx_path, index_path=index_path)
+    assert catalog.parsed == 2
+    assert catalog.names() == ["Nh", "Nl"]
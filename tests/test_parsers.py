@@ -141,3 +141,46 @@ def test_calc_map_origin_y():
     expected = 9030575.88125
     result = mapx.calc_map_origin_y(test)
     assert expected == result
+
+
+def test_parse_new_style_gpd(new_style_gpd):
+    result = mapx.parse_gpd_buffer(new_style_gpd)
+    assert result["Map Projection"] == "Azimuthal Equal-Area (Ellipsoid)"
+    assert result["Map Equatorial Radius"] == 6378137.
+    assert result["Grid Width"] == 720
+    assert result["Map Origin X"] == pytest.approx(-9000000.)
+    assert result["Map Origin Y"] == pytest.approx(9000000.)
+    assert result["Cell Height"] == -25000.
+
+
+@pytest.mark.parametrize(
+    "case,expected",
+    GPD_CASE
+)
+def test_parse_gpd_from_mmap(case, expected):
+    import mmap
+    with open(mapx.make_gpd_path(case), "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            result = mapx.parse_gpd_buffer(buffer)
+    assert pytest.approx(result) == expected
+
+
+def test_tokenize_original_style():
+    buffer = b"-90.0  0.0  -70.0\t\tlat0 lon0 lat1\n6378.273\t\tEarth equatorial radius (km) -- hughes\n"
+    assert list(mapx.tokenize(buffer, original_style=True)) == [
+        ("lat0 lon0 lat1", "-90.0 0.0 -70.0"),
+        ("Earth equatorial radius (km)", "6378.273"),
+        ]
+
+
+def test_tokenize_original_style_key_is_second_field():
+    buffer = b"N200correct.mpp\t\tmap projection parameters\n721 721\t\tcolumns rows\tnote\n"
+    assert list(mapx.tokenize(buffer, original_style=True)) == [
+        ("map projection parameters", "N200correct.mpp"),
+        ("columns rows", "721 721"),
+        ]
+
+
+def test_tokenize_mpp_key_is_last_field():
+    buffer = b"Azimuthal Equal-Area\n90.0\t0.0\t\tlat0 lon0\n"
+    assert list(mapx.tokenize_mpp(buffer)) == [("lat0 lon0", "90.0 0.0")]
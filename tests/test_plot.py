@@ -0,0 +1,58 @@
+"""Tests for the frame renderer
+
+Coastlines are not drawn so tests do not need Natural Earth data.
+"""
+
+import pytest
+import numpy as np
+
+from nsidc_projections.grid import get_grid
+from nsidc_projections.plot import FrameRenderer, RENDER_METHODS
+
+GRID = get_grid('SSMI_PolarStereoNorth25km')
+
+
+def frames(n):
+    return np.random.default_rng(0).random((n, GRID.rows, GRID.cols))
+
+
+@pytest.mark.parametrize("method", RENDER_METHODS)
+def test_render_all(method, tmp_path):
+    renderer = FrameRenderer(GRID, coastlines=False, figsize=(2, 2), method=method)
+    paths = [tmp_path / f"frame{i}.png" for i in range(3)]
+    result = renderer.render_all(frames(3), paths, titles=["a", "b", "c"])
+    assert result == paths
+    assert all(path.stat().st_size > 0 for path in paths)
+    assert renderer.title.get_text() == "c"
+
+
+def test_render_reuses_figure(tmp_path):
+    renderer = FrameRenderer(GRID, coastlines=False, figsize=(2, 2))
+    data = frames(2)
+    renderer.render(data[0], tmp_path / "a.png")
+    figure, mesh = renderer.figure, renderer.mesh
+    renderer.render(data[1], tmp_path / "b.png")
+    assert renderer.figure is figure and renderer.mesh is mesh
+    np.testing.assert_array_equal(np.ma.getdata(mesh.get_array()).ravel(), data[1].ravel())
+
+
+def test_render_wrong_shape(tmp_path):
+    renderer = FrameRenderer(GRID, coastlines=False)
+    with pytest.raises(ValueError):
+        renderer.render(np.zeros((10, 10)), tmp_path / "a.png")
+
+
+def test_render_all_workers(tmp_path):
+    renderer = FrameRenderer(GRID, coastlines=False, figsize=(2, 2))
+    paths = [tmp_path / f"frame{i}.png" for i in range(4)]
+    assert renderer.render_all(frames(4), paths, workers=2) == paths
+    assert all(path.exists() for path in paths)
+
+
+def test_pickle_drops_artists(tmp_path):
+    import pickle
+    renderer = FrameRenderer(GRID, coastlines=False, figsize=(2, 2))
+    assert renderer.title is None
+    renderer.render(frames(1)[0], tmp_path / "a.png", title="a")
+    copy = pickle.loads(pickle.dumps(renderer))
+    assert copy.figure is None and copy.mesh is None and copy.title is None
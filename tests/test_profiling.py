@@ -0,0 +1,83 @@
+"""Tests for opt-in profiling counters"""
+
+import json
+import logging
+import os
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+from nsidc_projections import grid_info, profiling, transform
+from nsidc_projections.grid import Grid, get_grid
+from nsidc_projections.mapx import parse_mapx
+
+
+@pytest.fixture(autouse=True)
+def profiling_off():
+    profiling.disable()
+    profiling.clear()
+    yield
+    profiling.disable()
+    profiling.clear()
+
+
+def test_off_by_default():
+    get_grid('EASEGrid2North25km').get_latlon(cache=False, engine='numpy')
+    assert not profiling.enabled()
+    assert profiling.stats() == {}
+
+
+def test_profile_restores_state():
+    with profiling.profile():
+        assert profiling.enabled()
+    assert not profiling.enabled()
+
+
+def test_latlon_counts_points_and_bytes():
+    grid = get_grid('EASEGrid2North25km')
+    with profiling.profile():
+        grid.get_latlon(cache=False, engine='numpy')
+    stats = profiling.stats()
+    assert stats["grid.latlon"]["calls"] == 1
+    assert stats["grid.latlon"]["points"] == grid.rows * grid.cols
+    assert stats["grid.alloc"]["bytes"] == 2 * grid.rows * grid.cols * 8
+    assert stats["grid.latlon"]["seconds"] > 0.
+
+
+def test_crs_and_transformer_creation():
+    transform.clear()
+    grid = Grid(grid_info.SSMI_PolarStereoNorth25km)
+    with profiling.profile():
+        grid.latlon_to_rowcol(np.array([80., 70.]), np.array([0., 45.]))
+    stats = profiling.stats()
+    assert stats["crs.create"]["calls"] == 1
+    assert stats["transform.create"]["calls"] == 1
+    assert stats["grid.rowcol"]["points"] == 2
+
+
+def test_mapx_read(tmp_path, new_style_gpd):
+    (tmp_path / "new.gpd").write_bytes(new_style_gpd)
+    with profiling.profile():
+        parse_mapx.get_grid_definition("new", tmp_path)
+    stats = profiling.stats()
+    assert stats["mapx.read"]["calls"] == 1
+    assert stats["mapx.read"]["bytes"] == len(new_style_gpd)
+    assert stats["mapx.parse"]["calls"] == 1
+
+
+def test_log_lines(caplog):
+    with caplog.at_level(logging.INFO, logger=profiling.logger.name):
+        with profiling.profile(log=True):
+            get_grid('EASEGrid2North25km').get_latlon(cache=False, engine='numpy')
+    events = [json.loads(r.getMessage())["event"] for r in caplog.records]
+    assert "grid.latlon" in events
+
+
+def test_environment_variable():
+    code = "from nsidc_projections import profiling; print(profiling.enabled())"
+    env = dict(os.environ, **{profiling.PROFILE_ENV: "1"})
+    output = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True,
+                            text=True, check=True).stdout
+    assert output.strip() == "True"
@@ -0,0 +1,85 @@
+"""Tests for memory-mapped flat binary readers"""
+
+import numpy as np
+import pytest
+
+from nsidc_projections import readers
+from nsidc_projections.grid import get_grid
+from nsidc_projections.readers import BinaryFormat
+
+GRID = "SSMI_PolarStereoNorth25km"
+
+
+def write_binary(path, data, binary_format):
+    binary_format = readers.get_format(binary_format)
+    data = np.asarray(data, dtype=binary_format.dtype)
+    if binary_format.flipud:
+        data = data[..., ::-1, :]
+    with open(path, "wb") as f:
+        f.write(b"h" * binary_format.header_bytes)
+        f.write(data.tobytes())
+    return path
+
+
+@pytest.fixture
+def grid_data():
+    grid = get_grid(GRID)
+    return np.arange(grid.rows * grid.cols).reshape(grid.rows, grid.cols) % 251
+
+
+@pytest.mark.parametrize("binary_format", ["nsidc0051", "nsidc0001", BinaryFormat(">i2"),
+                                           BinaryFormat("<f4", 16, flipud=True)])
+def test_open_binary(tmp_path, grid_data, binary_format):
+    path = write_binary(tmp_path / "data.bin", grid_data, binary_format)
+    array = readers.open_binary(path, GRID, binary_format)
+    assert isinstance(array, np.memmap)
+    assert not array.flags.writeable
+    np.testing.assert_array_equal(array, grid_data)
+
+
+def test_open_binary_bands(tmp_path, grid_data):
+    data = np.stack([grid_data, grid_data + 1])
+    path = write_binary(tmp_path / "data.bin", data, "nsidc0001")
+    np.testing.assert_array_equal(readers.open_binary(path, GRID, "nsidc0001", bands=2), data)
+
+
+def test_open_binary_wrong_size(tmp_path, grid_data):
+    path = write_binary(tmp_path / "data.bin", grid_data, "nsidc0001")
+    with pytest.raises(ValueError):
+        readers.open_binary(path, GRID, "nsidc0051")
+
+
+def test_open_window(tmp_path, grid_data):
+    path = write_binary(tmp_path / "data.bin", grid_data, "nsidc0051")
+    bbox = (-160., 68., -120., 80.)
+    row_slice, col_slice, expected_grid = get_grid(GRID).window(bbox)
+    window, grid = readers.open_window(path, GRID, "nsidc0051", bbox)
+    np.testing.assert_array_equal(window, grid_data[row_slice, col_slice])
+    assert (grid.rows, grid.cols) == window.shape
+    assert grid.upper_left_x == expected_grid.upper_left_x
+
+
+def test_read_series(tmp_path, grid_data):
+    paths = [write_binary(tmp_path / f"{day}.bin", grid_data + day, "nsidc0001")
+             for day in range(5)]
+    series = readers.read_series(paths, GRID, "nsidc0001", 100, slice(50, 53))
+    np.testing.assert_array_equal(series, [grid_data[100, 50:53] + day for day in range(5)])
+
+
+def test_to_dataarray(tmp_path, grid_data):
+    path = write_binary(tmp_path / "data.bin", grid_data, "nsidc0051")
+    array = readers.to_dataarray(path, GRID, "nsidc0051", name="sic")
+    assert isinstance(array.variable._data, np.memmap)
+    assert array.attrs["grid_mapping"] == "crs"
+    np.testing.assert_array_equal(array.isel(y=10, x=slice(5, 9)), grid_data[10, 5:9])
+
+
+@pytest.mark.parametrize("binary_format", ["nsidc0051", BinaryFormat(">i2", 8, flipud=True)])
+@pytest.mark.parametrize("index", [(100, 50), (slice(10, 20), slice(300, None)),
+                                   (slice(-5, None, 2), 7)])
+def test_read_series_matches_open_binary(tmp_path, grid_data, binary_format, index):
+    paths = [write_binary(tmp_path / f"{day}.bin", grid_data + day, binary_format)
+             for day in range(3)]
+    series = readers.read_series(paths, GRID, binary_format, *index)
+    expected = [readers.open_binary(path, GRID, binary_format)[index] for path in paths]
+    np.testing.assert_array_equal(series, expected)
@@ -0,0 +1,118 @@
+"""Tests for regridding with sparse weights"""
+
+import pytest
+import numpy as np
+
+from nsidc_projections.grid import get_grid
+from nsidc_projections.regrid import Regridder, conservative_weights
+
+SOURCE = get_grid("SSMI_PolarStereoNorth25km")
+TARGET = get_grid("EASEGrid2North25km")
+
+
+@pytest.mark.parametrize("method", ["nearest", "bilinear"])
+def test_same_grid_is_identity(method):
+    regridder = Regridder(SOURCE, SOURCE, method=method)
+    data = np.random.default_rng(0).random((SOURCE.rows, SOURCE.cols))
+    np.testing.assert_allclose(regridder(data), data, atol=1e-9)
+
+
+@pytest.mark.parametrize("method", ["nearest", "bilinear"])
+def test_constant_field(method):
+    regridder = Regridder(SOURCE, TARGET, method=method)
+    result = regridder(np.full((3, SOURCE.rows, SOURCE.cols), 2.))
+    assert result.shape == (3, TARGET.rows, TARGET.cols)
+    covered = np.isfinite(result[0])
+    assert covered.any() and not covered.all()
+    np.testing.assert_allclose(result[:, covered], 2.)
+
+
+def test_bilinear_reproduces_linear_field():
+    x, y = SOURCE.get_coordinate_grids()
+    lat, lon = TARGET.get_latlon()
+    regridder = Regridder(SOURCE, TARGET, method="bilinear")
+    result = regridder(x)
+    expected_x, _ = SOURCE.transformer().transform(lat, lon, direction="INVERSE")
+    interior = np.isfinite(result) & (np.abs(expected_x) < 3.7e6)
+    np.testing.assert_allclose(result[interior], expected_x[interior], atol=1e-3)
+
+
+def test_skipna():
+    regridder = Regridder(SOURCE, SOURCE, method="bilinear")
+    data = np.ones((SOURCE.rows, SOURCE.cols))
+    data[100, 100] = np.nan
+    assert np.isnan(regridder(data)[100, 100])
+    assert regridder(data, skipna=True)[100, 100] == 1.
+
+
+def test_weights_are_saved_and_reused(tmp_path):
+    path = tmp_path / "weights.npz"
+    regridder = Regridder(SOURCE, TARGET, method="nearest", path=path)
+    assert path.exists()
+    loaded = Regridder(SOURCE, TARGET, method="nearest", path=path)
+    assert (loaded.weights != regridder.weights).nnz == 0
+    other = Regridder(SOURCE, TARGET, method="bilinear", path=path)
+    assert other.weights.nnz > regridder.weights.nnz
+    numpy_engine = Regridder(SOURCE, TARGET, method="bilinear", path=path, engine="numpy")
+    assert np.array_equal(np.load(path)["metadata"], numpy_engine._metadata())
+
+
+def test_shape_mismatch():
+    regridder = Regridder(SOURCE, TARGET)
+    with pytest.raises(ValueError):
+        regridder(np.zeros((10, 10)))
+
+
+BEAUFORT = (-160., 68., -120., 80.)
+GLOBAL_TARGET = get_grid("EASEGrid2Global25km")
+
+
+def integral(grid, data):
+    return np.nansum(data * grid.cell_area())
+
+
+@pytest.mark.parametrize("source, target", [
+    (SOURCE.window(BEAUFORT)[2], TARGET),
+    (TARGET.window(BEAUFORT)[2], SOURCE),
+    (TARGET.window((170., 50., -170., 60.))[2], GLOBAL_TARGET),
+    ])
+def test_conservative_preserves_integral(source, target):
+    regridder = Regridder(source, target, method="conservative")
+    data = np.random.default_rng(0).random((source.rows, source.cols))
+    result = regridder(data, fill_value=0.)
+    assert integral(target, result) == pytest.approx(integral(source, data), rel=1e-4)
+
+
+def test_conservative_same_grid_is_identity():
+    source = SOURCE.window(BEAUFORT)[2]
+    weights = conservative_weights(source, source)
+    np.testing.assert_allclose(weights.toarray(), np.eye(source.rows * source.cols), atol=1e-9)
+
+
+def test_conservative_constant_field_and_skipna():
+    source = SOURCE.window(BEAUFORT)[2]
+    regridder = Regridder(source, TARGET, method="conservative")
+    data = np.full((source.rows, source.cols), 2.)
+    result = regridder(data)
+    inside = np.isclose(result, 2.)
+    assert inside.sum() > 0.5 * source.rows * source.cols
+    assert (result[np.isfinite(result)] <= 2. + 1e-9).all()
+    np.testing.assert_allclose(regridder(data, skipna=True)[np.isfinite(result)], 2.)
+
+
+def test_conservative_options_are_saved(tmp_path):
+    source = SOURCE.window(BEAUFORT)[2]
+    path = tmp_path / "weights.npz"
+    coarse = Regridder(source, TARGET, method="conservative", path=path, edge_points=1)
+    reused = Regridder(source, TARGET, method="conservative", path=path, edge_points=1,
+                       workers=1, band_rows=10)
+    assert abs(reused.weights - coarse.weights).max() == 0.
+    fine = Regridder(source, TARGET, method="conservative", path=path, edge_points=16)
+    assert abs(fine.weights - coarse.weights).max() > 0.
+
+
+def test_conservative_workers_match_serial():
+    source = SOURCE.window(BEAUFORT)[2]
+    serial = conservative_weights(source, TARGET)
+    parallel = conservative_weights(source, TARGET, workers=2, band_rows=10)
+    assert abs(serial - parallel).max() == 0.
@@ -0,0 +1,35 @@
+"""Tests for the shared transformer pool"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from pyproj.enums import TransformDirection
+
+from nsidc_projections import transform
+
+
+@pytest.fixture(autouse=True)
+def empty_pool():
+    transform.clear()
+
+
+def test_transformer_is_reused():
+    first = transform.get_transformer(3411, 4326)
+    second = transform.get_transformer("EPSG:3411", "EPSG:4326")
+    assert first is second
+    assert transform.stats() == {"created": 1, "reused": 1}
+
+
+def test_threads_get_own_transformer():
+    main = transform.get_transformer(3411, 4326)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        other = executor.submit(transform.get_transformer, 3411, 4326).result()
+    assert main is not other
+
+
+def test_inverse_round_trip():
+    lat, lon = transform.transform(3411, 4326, 0., 0.)
+    x, y = transform.transform(3411, 4326, lat, lon,
+                               direction=TransformDirection.INVERSE)
+    assert lat == pytest.approx(90.)
+    assert (x, y) == pytest.approx((0., 0.), abs=1e-6)
@@ -0,0 +1,68 @@
+"""Tests for NetCDF and GeoTIFF writers"""
+
+import pytest
+import numpy as np
+
+from nsidc_projections.grid import get_grid
+from nsidc_projections import writers
+
+GRID = get_grid('SSMI_PolarStereoNorth25km')
+
+
+@pytest.fixture
+def data():
+    return np.random.default_rng(0).random((GRID.rows, GRID.cols)).astype(np.float32)
+
+
+def blocks(data, shape=(100, 128)):
+    for row_slice, col_slice in GRID.iter_windows(shape):
+        yield row_slice, col_slice, data[row_slice, col_slice]
+
+
+@pytest.mark.parametrize("from_blocks", [False, True])
+def test_write_netcdf(tmp_path, data, from_blocks):
+    netCDF4 = pytest.importorskip("netCDF4")
+    path = tmp_path / "data.nc"
+    source = blocks(data) if from_blocks else data
+    writers.write_netcdf(path, GRID, source, name="ice", chunks=(128, 128),
+                         attrs={"units": "1"})
+    x, y = GRID.get_coordinates()
+    with netCDF4.Dataset(path) as nc:
+        variable = nc["ice"]
+        np.testing.assert_array_equal(variable[:], data)
+        assert variable.chunking() == [128, 128]
+        assert variable.filters()["zlib"]
+        assert variable.grid_mapping == "crs"
+        assert variable.units == "1"
+        assert nc["crs"].grid_mapping_name == "polar_stereographic"
+        np.testing.assert_array_equal(nc["x"][:], x)
+        np.testing.assert_array_equal(nc["y"][:], y)
+
+
+def test_write_netcdf_latlon_3d(tmp_path, data):
+    netCDF4 = pytest.importorskip("netCDF4")
+    path = tmp_path / "data.nc"
+    writers.write_netcdf(path, GRID, np.stack([data, data]), latlon=True)
+    lat, _ = GRID.get_latlon()
+    with netCDF4.Dataset(path) as nc:
+        assert nc["data"].dimensions == ("time", "y", "x")
+        np.testing.assert_allclose(nc["lat"][:], lat)
+
+
+@pytest.mark.parametrize("from_blocks", [False, True])
+def test_write_geotiff(tmp_path, data, from_blocks):
+    rasterio = pytest.importorskip("rasterio")
+    path = tmp_path / "data.tif"
+    source = blocks(data) if from_blocks else data
+    writers.write_geotiff(path, GRID, source, blocksize=128, nodata=-999.)
+    with rasterio.open(path) as src:
+        np.testing.assert_array_equal(src.read(1), data)
+        assert src.crs.to_epsg() == GRID.epsg
+        assert src.transform == GRID.geotransform()
+        assert src.block_shapes == [(128, 128)]
+        assert src.nodata == -999.
+
+
+def test_write_wrong_shape(tmp_path):
+    with pytest.raises(ValueError):
+        writers.write_geotiff(tmp_path / "data.tif", GRID, np.zeros((10, 10)))